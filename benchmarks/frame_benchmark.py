@@ -0,0 +1,354 @@
+"""主循环帧耗时基准测试
+
+在无界面模式下依次加载五张地图，让玩家（相机）沿固定路线移动，
+分阶段记录每帧耗时：逻辑更新、地图渲染、实体渲染、UI渲染、display.flip。
+结果以p50/p95/p99写入JSON，并与保存的基线对比，超出容差时以非零状态码退出。
+
+用法：
+    python benchmarks/frame_benchmark.py                    # 运行并与基线对比
+    python benchmarks/frame_benchmark.py --save-baseline    # 运行并保存为新基线
+    python benchmarks/frame_benchmark.py --maps 1 2 --frames 120
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# 添加项目根目录到路径
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+import pygame
+
+from src.core.clock import game_clock
+from src.core.game import Game
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, 'results', 'latest.json')
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+# 阶段名称（按一帧内的执行顺序）
+PHASES = ['update', 'map_render', 'entity_render', 'ui_render', 'flip']
+
+# 相机路线：距地图边缘留出余量
+PATH_MARGIN_X = 300
+PATH_MARGIN_Y = 250
+# 路线与传送点之间至少保留的距离（像素）
+EXIT_CLEARANCE = 40
+# 检查路线是否经过传送点时的采样步长（像素）
+PATH_SAMPLE_STEP = 8
+
+
+def is_leg_clear(start, end, exit_rects, player_size):
+    """玩家沿直线从start走到end的过程中是否不会碰到任何传送点"""
+    (x1, y1), (x2, y2) = start, end
+    width, height = player_size
+    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    samples = int(length // PATH_SAMPLE_STEP) + 1
+    for i in range(samples + 1):
+        ratio = i / samples
+        player_rect = pygame.Rect(x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio, width, height)
+        if player_rect.collidelist(exit_rects) != -1:
+            return False
+    return True
+
+
+def build_camera_path(map_width, map_height, exits=(), player_size=(24, 36)):
+    """生成固定的相机路线（绕地图一圈的折线）
+
+    落在传送点上的路点直接跳过，经过传送点的路段改为先横后竖或先竖后横的折线绕开，
+    保证整个测试过程中玩家都停留在同一张地图上。
+
+    Args:
+        map_width, map_height: 地图尺寸
+        exits: 地图的传送点列表
+        player_size: 玩家碰撞矩形的 (宽, 高)
+
+    Raises:
+        ValueError: 某一路段无法绕开传送点
+    """
+    left, right = PATH_MARGIN_X, map_width - PATH_MARGIN_X
+    top, bottom = PATH_MARGIN_Y, map_height - PATH_MARGIN_Y
+    center_x, center_y = map_width // 2, map_height // 2
+    waypoints = [
+        (left, top), (right, top), (right, bottom),
+        (center_x, center_y), (left, bottom), (left, top)
+    ]
+    exit_rects = [pygame.Rect(exit['x'], exit['y'], exit['width'], exit['height']).inflate(2 * EXIT_CLEARANCE, 2 * EXIT_CLEARANCE)
+                  for exit in exits]
+    waypoints = [point for point in waypoints if is_leg_clear(point, point, exit_rects, player_size)]
+
+    path = [waypoints[0]]
+    for target in waypoints[1:]:
+        start = path[-1]
+        if is_leg_clear(start, target, exit_rects, player_size):
+            path.append(target)
+            continue
+        for corner in ((start[0], target[1]), (target[0], start[1])):
+            if is_leg_clear(start, corner, exit_rects, player_size) and is_leg_clear(corner, target, exit_rects, player_size):
+                path.extend([corner, target])
+                break
+        else:
+            raise ValueError(f"相机路线无法避开传送点: {start} -> {target}")
+    return path
+
+
+def point_on_path(path, t):
+    """按路线总长度取参数t（0~1）对应的位置"""
+    segments = []
+    total = 0.0
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+        segments.append((x1, y1, x2, y2, length))
+        total += length
+
+    distance = t * total
+    for x1, y1, x2, y2, length in segments:
+        if distance <= length and length > 0:
+            ratio = distance / length
+            return x1 + (x2 - x1) * ratio, y1 + (y2 - y1) * ratio
+        distance -= length
+    return path[-1]
+
+
+def percentile(values, pct):
+    """计算百分位数（线性插值）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def summarize(samples):
+    """汇总一组毫秒耗时"""
+    return {
+        'p50': round(percentile(samples, 50), 3),
+        'p95': round(percentile(samples, 95), 3),
+        'p99': round(percentile(samples, 99), 3),
+        'mean': round(sum(samples) / len(samples), 3) if samples else 0.0
+    }
+
+
+def render_frame(game):
+    """按阶段渲染一帧（与Game.render的游戏内分支顺序一致），返回各阶段耗时（毫秒）"""
+    screen = game.screen
+    camera_x, camera_y = int(game.camera_x), int(game.camera_y)
+    current_map = game.map_manager.get_current_map()
+    perf = time.perf_counter
+
+    start = perf()
+    screen.fill((0, 0, 0))
+    current_map.render_terrain(screen, camera_x, camera_y)
+    map_time = perf() - start
+
+    start = perf()
+    current_map.render_entities(screen, camera_x, camera_y)
+    entity_time = perf() - start
+
+    start = perf()
+    current_map.render_exits(screen, camera_x, camera_y)
+    map_time += perf() - start
+
+    start = perf()
+    game.player.render(screen, (game.camera_x, game.camera_y))
+    game.animation_manager.render(screen, (game.camera_x, game.camera_y))
+    entity_time += perf() - start
+
+    start = perf()
+    game.ui.render_game_ui()
+    game.ui.render_item_drops()
+    game.ui.render_damage_texts()
+    game.ui.render_game_messages()
+    ui_time = perf() - start
+
+    start = perf()
+    pygame.display.flip()
+    flip_time = perf() - start
+
+    return {
+        'map_render': map_time * 1000,
+        'entity_render': entity_time * 1000,
+        'ui_render': ui_time * 1000,
+        'flip': flip_time * 1000
+    }
+
+
+def benchmark_map(game, map_id, frames, warmup):
+    """在单张地图上沿固定路线运行，返回各阶段耗时统计"""
+    current_map = game.map_manager.get_map(map_id)
+    path = build_camera_path(current_map.width, current_map.height, current_map.exits,
+                             (game.player.width, game.player.height))
+    start_x, start_y = path[0]
+    game.map_manager.switch_map(map_id, start_x, start_y)
+
+    timings = {phase: [] for phase in PHASES}
+    frame_times = []
+    perf = time.perf_counter
+
+    for frame in range(warmup + frames):
+        # 沿路线放置玩家，相机通过Game.update平滑跟随
+        x, y = point_on_path(path, frame / float(warmup + frames - 1))
+        game.player.x, game.player.y = x, y
+
+        frame_start = perf()
+        game_clock.advance(game.tick_ms)
+        pygame.event.pump()
+        game.update()
+        update_time = perf() - frame_start
+        if game.map_manager.current_map_id != map_id:
+            # 统计结果按地图归类，中途切换地图会让数据张冠李戴
+            raise RuntimeError(f"基准测试在地图{map_id}的第{frame}帧切换到了地图{game.map_manager.current_map_id}")
+
+        render_timings = render_frame(game)
+        frame_time = perf() - frame_start
+
+        if frame < warmup:
+            continue
+        timings['update'].append(update_time * 1000)
+        for phase, value in render_timings.items():
+            timings[phase].append(value)
+        frame_times.append(frame_time * 1000)
+
+    return {
+        'scene_type': current_map.scene_type,
+        'frames': frames,
+        'frame': summarize(frame_times),
+        'phases': {phase: summarize(values) for phase, values in timings.items()}
+    }
+
+
+def run_benchmark(map_ids=None, frames=300, warmup=30, seed=12345, profession='战士', monster_arrays=False):
+    """运行整套基准测试
+
+    Returns:
+        dict: 可直接写入JSON的结果
+    """
+    # 固定随机种子和模拟时钟，保证地形、怪物与AI行为可复现
+    random.seed(seed)
+    game = Game(headless=True, monster_arrays=monster_arrays)
+    game_clock.enable_fixed_step(0)
+    game.start_game(profession)
+
+    if not map_ids:
+        map_ids = game.map_manager.get_map_ids()
+
+    results = {
+        'meta': {
+            'frames': frames,
+            'warmup': warmup,
+            'seed': seed,
+            'monster_arrays': monster_arrays,
+            'resolution': [game.width, game.height],
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+        },
+        'maps': {}
+    }
+
+    for map_id in map_ids:
+        print(f"Benchmarking map {map_id}...")
+        results['maps'][str(map_id)] = benchmark_map(game, map_id, frames, warmup)
+        summary = results['maps'][str(map_id)]['frame']
+        print(f"  {results['maps'][str(map_id)]['scene_type']}: "
+              f"p50={summary['p50']:.2f}ms p95={summary['p95']:.2f}ms p99={summary['p99']:.2f}ms")
+
+    pygame.quit()
+    return results
+
+
+def compare_with_baseline(results, baseline, tolerance, metric='p95'):
+    """与基线比较，返回回归列表
+
+    Args:
+        results: 本次结果
+        baseline: 基线结果
+        tolerance: 允许的相对增长（0.2表示20%）
+        metric: 比较的百分位
+    """
+    regressions = []
+    for map_id, current in results['maps'].items():
+        base = baseline.get('maps', {}).get(map_id)
+        if not base:
+            continue
+
+        pairs = [('frame', current['frame'], base['frame'])]
+        for phase in PHASES:
+            if phase in current['phases'] and phase in base.get('phases', {}):
+                pairs.append((phase, current['phases'][phase], base['phases'][phase]))
+
+        for name, cur, old in pairs:
+            # 忽略极短阶段的抖动（低于0.05ms）
+            if old[metric] < 0.05:
+                continue
+            if cur[metric] > old[metric] * (1 + tolerance):
+                regressions.append(
+                    f"map {map_id} ({current['scene_type']}) {name} {metric}: "
+                    f"{old[metric]:.3f}ms -> {cur[metric]:.3f}ms "
+                    f"(+{(cur[metric] / old[metric] - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def write_json(path, data):
+    """写入JSON文件"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="主循环帧耗时基准测试")
+    parser.add_argument('--maps', type=int, nargs='*', help='要测试的地图ID（默认全部）')
+    parser.add_argument('--frames', type=int, default=300, help='每张地图统计的帧数')
+    parser.add_argument('--warmup', type=int, default=30, help='每张地图预热帧数（不计入统计）')
+    parser.add_argument('--seed', type=int, default=12345, help='随机种子')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='结果JSON路径')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基线JSON路径')
+    parser.add_argument('--save-baseline', action='store_true', help='将本次结果保存为基线')
+    parser.add_argument('--require-baseline', action='store_true',
+                        help='基线不存在时以非零状态码退出（用于CI，避免缺少基线时静默通过）')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='允许的相对回归（默认0.2即20%%）')
+    parser.add_argument('--metric', default='p95', choices=['p50', 'p95', 'p99'], help='用于比较的百分位')
+    parser.add_argument('--monster-arrays', action='store_true', help='使用数组化怪物存储')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.maps, args.frames, args.warmup, args.seed, monster_arrays=args.monster_arrays)
+    write_json(args.output, results)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 2 if args.require_baseline else 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline, args.tolerance, args.metric)
+    if regressions:
+        print("PERFORMANCE REGRESSION DETECTED:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"No regressions beyond {args.tolerance * 100:.0f}% ({args.metric})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
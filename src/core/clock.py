@@ -0,0 +1,47 @@
+import pygame
+
+
+class GameClock:
+    """游戏时钟
+
+    默认跟随pygame的实时时钟；固定步长模式下按模拟时间推进，
+    这样无界面模拟时冷却、仇恨衰减、动画等计时与帧数保持一致。
+    """
+
+    def __init__(self):
+        """初始化游戏时钟"""
+        self.fixed_step = False
+        self.sim_time = 0.0
+
+    def enable_fixed_step(self, start_time=None):
+        """切换到固定步长模式
+
+        Args:
+            start_time: 模拟时间起点（毫秒），默认从当前实时时间开始
+        """
+        if start_time is None:
+            start_time = pygame.time.get_ticks()
+        self.sim_time = float(start_time)
+        self.fixed_step = True
+
+    def disable_fixed_step(self):
+        """恢复为实时时钟"""
+        self.fixed_step = False
+
+    def advance(self, ms):
+        """固定步长模式下推进模拟时间
+
+        Args:
+            ms: 推进的毫秒数
+        """
+        self.sim_time += ms
+
+    def get_ticks(self):
+        """获取当前游戏时间（毫秒）"""
+        if self.fixed_step:
+            return int(self.sim_time)
+        return pygame.time.get_ticks()
+
+
+# 创建全局游戏时钟实例
+game_clock = GameClock()
@@ -11,33 +11,66 @@ from src.map.map_manager import MapManager
 from src.ui.ui import UI
 from src.systems.data_storage import DataStorage
 from src.systems.quest_system import Quest
+from src.core.clock import game_clock
+from src.systems.profiler import profiler
+from src.systems.sound_synth import sound_synth
+from src.systems.startup_tracer import startup_tracer
 
 
 class Game:
     """游戏核心类"""
     
-    def __init__(self):
-        """初始化游戏"""
+    def __init__(self, headless=False, monster_arrays=False):
+        """初始化游戏
+        
+        Args:
+            headless: 是否以无界面模式运行（使用dummy视频/音频驱动，不渲染）
+            monster_arrays: 是否用数组化存储批量更新怪物（需要numpy）
+        """
+        self.headless = headless
+        self.monster_arrays = monster_arrays
+        if headless:
+            # 无界面模式：必须在pygame.init()之前指定dummy驱动
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        
         # 初始化pygame
         print("Initializing pygame...")
-        pygame.init()
+        with startup_tracer.phase('pygame.init'):
+            pygame.init()
         print("Pygame initialized successfully")
         
         # 初始化声音系统
-        pygame.mixer.init()
-        print("Sound system initialized successfully")
+        with startup_tracer.phase('mixer.init'):
+            try:
+                pygame.mixer.init()
+                print("Sound system initialized successfully")
+            except pygame.error as e:
+                print(f"Sound system unavailable: {e}")
+        
+        # 后台预先合成战斗音效（无界面模式不需要声音）
+        if not headless and pygame.mixer.get_init():
+            sound_synth.cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'save', 'sound_cache')
+            sound_synth.prebuild()
         
         # 设置窗口大小和标题
         self.width, self.height = 1280, 800  # 增大默认窗口大小
         # 创建可调整大小的窗口
         print(f"Creating window: {self.width}x{self.height}")
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-        pygame.display.set_caption("传奇游戏")
+        with startup_tracer.phase('display.set_mode'):
+            if headless:
+                self.screen = pygame.display.set_mode((self.width, self.height))
+            else:
+                self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+                pygame.display.set_caption("传奇游戏")
         print("Window created successfully")
         
         # 设置时钟
         self.clock = pygame.time.Clock()
         self.fps = 60
+        # 固定逻辑步长（毫秒）
+        self.tick_ms = 1000.0 / self.fps
+        self.ticks = 0
         
         # 游戏状态
         self.running = True
@@ -49,8 +82,9 @@ class Game:
         # 初始化游戏元素
         # 暂时不创建player对象，等用户选择开始游戏后再创建
         self.player = None  # 初始化为None
-        self.map_manager = MapManager(self)  # 使用地图管理器
-        self.ui = UI(self)
+        self.map_manager = MapManager(self, prefetch=not headless)  # 使用地图管理器（地图在首次进入时创建）
+        with startup_tracer.phase('UI'):
+            self.ui = UI(self)
         
         # 游戏数据
         self.gold = 1000
@@ -63,15 +97,17 @@ class Game:
         self.camera_y = 0
         
         # 初始化任务系统
-        from src.systems.quest_system import QuestSystem
-        self.quest_system = QuestSystem(self)
+        with startup_tracer.phase('QuestSystem'):
+            from src.systems.quest_system import QuestSystem
+            self.quest_system = QuestSystem(self)
         
         # 初始化动画系统
         from src.systems.animation import AnimationManager
         self.animation_manager = AnimationManager()
         
         # 初始化数据存储系统
-        self.data_storage = DataStorage(self)
+        with startup_tracer.phase('DataStorage'):
+            self.data_storage = DataStorage(self)
         
         # 初始化鼠标悬停信息
         self.hovered_item = None
@@ -87,16 +123,6 @@ class Game:
         #     # 有存档，显示存档选择界面
         #     self.ui.show_load_selection = True
         #     self.ui.selected_load_slot = 0
-        
-        # 显示当前地图的Boss信息
-        current_map = self.map_manager.get_current_map()
-        if current_map and hasattr(self, 'ui') and hasattr(self.ui, 'add_game_message'):
-            # 查找地图中的Boss
-            boss_monsters = [monster for monster in current_map.monsters if hasattr(monster, 'name') and ('王' in monster.name or '教主' in monster.name)]
-            for boss in boss_monsters:
-                boss_message = f"[Boss刷新] {boss.name} 在 {current_map.scene_type} 出现了！坐标: ({int(boss.x)}, {int(boss.y)})"
-                print(boss_message)
-                self.ui.add_game_message(boss_message, (255, 0, 0), 5000)
     
     def add_exp(self, amount):
         """添加经验值
@@ -300,6 +326,12 @@ class Game:
                 # F10显示技能天赋
                 print("显示技能天赋")
                 self.game_state = GameState.SKILLS
+            elif event.key == pygame.K_m:
+                # M切换全地图视图
+                self.ui.minimap.toggle_full_map()
+            elif event.key == pygame.K_F12:
+                # F12切换性能分析浮层
+                profiler.toggle_overlay()
     
     def interact_with_npcs(self):
         """与附近的NPC交互"""
@@ -423,6 +455,7 @@ class Game:
             print(f"防御力: {self.player.defense}")
             print(f"魔法力: {self.player.magic}")
     
+    @profiler.profile('Game.update')
     def update(self):
         """更新游戏状态"""
         # 检查是否有特殊界面打开
@@ -440,41 +473,93 @@ class Game:
         
         # 根据游戏状态更新
         if self.game_state == GameState.GAME and not has_special_ui:
-            self.player.update()
-            self.player.update_skills()  # 更新技能状态
-            self.map_manager.update()  # 更新地图管理器
-            
-            # 更新动画
-            self.animation_manager.update()
-            
-            # 更新掉落物品提示
-            self.ui.update_item_drops()
-            # 更新伤害值显示
-            self.ui.update_damage_texts()
-            # 更新游戏内消息
-            self.ui.update_game_messages()
-            
-            # 检查升级
-            self.check_level_up()
-            
-            # 更新相机位置，跟随玩家（添加平滑过渡效果）
-            target_camera_x = self.player.x - self.width // 2
-            target_camera_y = self.player.y - self.height // 2
-            
-            # 平滑相机移动
-            self.camera_x += (target_camera_x - self.camera_x) * 0.1
-            self.camera_y += (target_camera_y - self.camera_y) * 0.1
-            
-            # 限制相机范围，防止超出地图
-            current_map = self.map_manager.get_current_map()
-            if current_map:
-                self.camera_x = max(0, min(current_map.width - self.width, self.camera_x))
-                self.camera_y = max(0, min(current_map.height - self.height, self.camera_y))
+            self.update_world()
         else:
             # 特殊界面打开时，只更新必要的UI元素
             self.ui.update_item_drops()
             self.ui.update_damage_texts()
             self.ui.update_game_messages()
+        self.ticks += 1
+    
+    def update_world(self):
+        """推进一个逻辑帧的游戏世界（玩家、地图、动画、相机）"""
+        self.player.update()
+        self.player.update_skills()  # 更新技能状态
+        self.map_manager.update()  # 更新地图管理器
+        
+        # 更新动画
+        self.animation_manager.update()
+        
+        # 更新掉落物品提示
+        self.ui.update_item_drops()
+        # 更新伤害值显示
+        self.ui.update_damage_texts()
+        # 更新游戏内消息
+        self.ui.update_game_messages()
+        
+        # 检查升级
+        self.check_level_up()
+        
+        # 更新相机位置，跟随玩家（添加平滑过渡效果）
+        target_camera_x = self.player.x - self.width // 2
+        target_camera_y = self.player.y - self.height // 2
+        
+        # 平滑相机移动
+        self.camera_x += (target_camera_x - self.camera_x) * 0.1
+        self.camera_y += (target_camera_y - self.camera_y) * 0.1
+        
+        # 限制相机范围，防止超出地图
+        current_map = self.map_manager.get_current_map()
+        if current_map:
+            self.camera_x = max(0, min(current_map.width - self.width, self.camera_x))
+            self.camera_y = max(0, min(current_map.height - self.height, self.camera_y))
+    
+    def step(self, n_ticks=1):
+        """以固定步长推进游戏逻辑，不渲染、不等待，用于无界面模拟
+        
+        首次调用时游戏时钟切换到固定步长模式，之后保持该模式（多次调用的模拟时间连续）；
+        模拟结束后如需回到实时循环，调用 game_clock.disable_fixed_step()。
+        
+        Args:
+            n_ticks: 推进的逻辑帧数（游戏退出时提前结束）
+            
+        Returns:
+            float: 实际执行的逻辑帧数按耗时计算的每秒逻辑帧数（ticks/sec）
+        """
+        import time
+        
+        # 切换到模拟时间，冷却、仇恨衰减等计时与帧数一致
+        if not game_clock.fixed_step:
+            game_clock.enable_fixed_step()
+        
+        ticks = 0
+        start = time.perf_counter()
+        for _ in range(n_ticks):
+            if not self.running:
+                break
+            game_clock.advance(self.tick_ms)
+            if self.headless:
+                # 无界面模式下仍需泵送事件队列，避免SDL事件堆积
+                pygame.event.pump()
+            self.update()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+        
+        if ticks == 0:
+            return 0.0
+        return ticks / elapsed if elapsed > 0 else float('inf')
+    
+    def start_game(self, profession=None):
+        """直接以指定职业进入游戏（跳过主菜单，用于无界面模拟）
+        
+        Args:
+            profession: 职业名称，默认使用当前选择的职业
+        """
+        if profession:
+            self.selected_class = profession
+        self.player = Player(self, 职业=self.selected_class)
+        self.map_manager.set_player(self.player)
+        self.game_state = GameState.GAME
         
     def render(self):
         """渲染游戏"""
@@ -570,19 +655,19 @@ class Game:
                         self.screen.blit(transparent_surface, (hover_x, hover_y))
                         
                         # 绘制技能信息
-                        name_text = small_font.render(skill_name, True, (255, 215, 0))
+                        name_text = font_cache.render(skill_name, (255, 215, 0), 16, 'ui')
                         self.screen.blit(name_text, (hover_x + 10, hover_y + 10))
                         
-                        level_text = small_font.render(f'等级: {skill_level}', True, (255, 255, 255))
+                        level_text = font_cache.render(f'等级: {skill_level}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(level_text, (hover_x + 10, hover_y + 30))
                         
-                        damage_text = small_font.render(f'伤害: {skill_damage}', True, (255, 0, 0))
+                        damage_text = font_cache.render(f'伤害: {skill_damage}', (255, 0, 0), 16, 'ui')
                         self.screen.blit(damage_text, (hover_x + 10, hover_y + 50))
                         
-                        range_text = small_font.render(f'范围: {skill_range}', True, (0, 255, 0))
+                        range_text = font_cache.render(f'范围: {skill_range}', (0, 255, 0), 16, 'ui')
                         self.screen.blit(range_text, (hover_x + 10, hover_y + 70))
                         
-                        cooldown_text = small_font.render(f'冷却: {skill_cooldown}秒', True, (0, 0, 255))
+                        cooldown_text = font_cache.render(f'冷却: {skill_cooldown}秒', (0, 0, 255), 16, 'ui')
                         self.screen.blit(cooldown_text, (hover_x + 10, hover_y + 90))
                     elif hasattr(self.hovered_item, 'name'):
                         # 物品悬停信息
@@ -627,16 +712,16 @@ class Game:
                         self.screen.blit(transparent_surface, (hover_x, hover_y))
                         
                         # 绘制物品信息
-                        name_text = small_font.render(item_name, True, (255, 215, 0))
+                        name_text = font_cache.render(item_name, (255, 215, 0), 16, 'ui')
                         self.screen.blit(name_text, (hover_x + 10, hover_y + 10))
                         
-                        quantity_text = small_font.render(f'数量: {item_quantity}', True, (255, 255, 255))
+                        quantity_text = font_cache.render(f'数量: {item_quantity}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(quantity_text, (hover_x + 10, hover_y + 25))
                         
-                        type_text = small_font.render(f'类型: {item_type}', True, (255, 255, 255))
+                        type_text = font_cache.render(f'类型: {item_type}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(type_text, (hover_x + 10, hover_y + 40))
                         
-                        desc_text = small_font.render(item_description, True, (200, 200, 200))
+                        desc_text = font_cache.render(item_description, (200, 200, 200), 16, 'ui')
                         self.screen.blit(desc_text, (hover_x + 10, hover_y + 55))
             elif self.game_state == GameState.MENU:
                 self.ui.render_menu()
@@ -744,19 +829,19 @@ class Game:
                         self.screen.blit(transparent_surface, (hover_x, hover_y))
                         
                         # 绘制技能信息
-                        name_text = small_font.render(skill_name, True, (255, 215, 0))
+                        name_text = font_cache.render(skill_name, (255, 215, 0), 16, 'ui')
                         self.screen.blit(name_text, (hover_x + 10, hover_y + 10))
                         
-                        level_text = small_font.render(f'等级: {skill_level}', True, (255, 255, 255))
+                        level_text = font_cache.render(f'等级: {skill_level}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(level_text, (hover_x + 10, hover_y + 30))
                         
-                        damage_text = small_font.render(f'伤害: {skill_damage}', True, (255, 0, 0))
+                        damage_text = font_cache.render(f'伤害: {skill_damage}', (255, 0, 0), 16, 'ui')
                         self.screen.blit(damage_text, (hover_x + 10, hover_y + 50))
                         
-                        range_text = small_font.render(f'范围: {skill_range}', True, (0, 255, 0))
+                        range_text = font_cache.render(f'范围: {skill_range}', (0, 255, 0), 16, 'ui')
                         self.screen.blit(range_text, (hover_x + 10, hover_y + 70))
                         
-                        cooldown_text = small_font.render(f'冷却: {skill_cooldown}秒', True, (0, 0, 255))
+                        cooldown_text = font_cache.render(f'冷却: {skill_cooldown}秒', (0, 0, 255), 16, 'ui')
                         self.screen.blit(cooldown_text, (hover_x + 10, hover_y + 90))
                     elif hasattr(self.hovered_item, 'name'):
                         # 物品悬停信息
@@ -801,16 +886,16 @@ class Game:
                         self.screen.blit(transparent_surface, (hover_x, hover_y))
                         
                         # 绘制物品信息
-                        name_text = small_font.render(item_name, True, (255, 215, 0))
+                        name_text = font_cache.render(item_name, (255, 215, 0), 16, 'ui')
                         self.screen.blit(name_text, (hover_x + 10, hover_y + 10))
                         
-                        quantity_text = small_font.render(f'数量: {item_quantity}', True, (255, 255, 255))
+                        quantity_text = font_cache.render(f'数量: {item_quantity}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(quantity_text, (hover_x + 10, hover_y + 25))
                         
-                        type_text = small_font.render(f'类型: {item_type}', True, (255, 255, 255))
+                        type_text = font_cache.render(f'类型: {item_type}', (255, 255, 255), 16, 'ui')
                         self.screen.blit(type_text, (hover_x + 10, hover_y + 40))
                         
-                        desc_text = small_font.render(item_description, True, (200, 200, 200))
+                        desc_text = font_cache.render(item_description, (200, 200, 200), 16, 'ui')
                         self.screen.blit(desc_text, (hover_x + 10, hover_y + 55))
             elif self.game_state == GameState.BATTLE:
                 self.ui.render_battle()
@@ -830,6 +915,11 @@ class Game:
                 self.ui.render_help()
         
         # 更新显示
+        # 绘制性能分析浮层并结束本帧统计
+        if profiler.enabled:
+            profiler.render_overlay(self.screen, self.ui.small_font)
+            profiler.end_frame()
+        
         pygame.display.flip()
         
     def handle_merchant_menu_events(self, event):
@@ -904,29 +994,21 @@ class Game:
         pygame.draw.rect(self.screen, (0, 0, 0), (menu_x, menu_y, menu_width, menu_height))
         pygame.draw.rect(self.screen, (100, 100, 100), (menu_x, menu_y, menu_width, menu_height), 2)
         
-        # 使用UI中已经加载的支持中文的字体
-        title_font = self.ui.large_font
-        option_font = self.ui.font
-        prompt_font = self.ui.small_font
-        
         # 绘制标题
         if self.current_merchant:
-            title = title_font.render(f"与{self.current_merchant.name}对话", True, (255, 215, 0))
+            title = font_cache.render(f"与{self.current_merchant.name}对话", (255, 215, 0), 36, 'ui')
             self.screen.blit(title, (menu_x + 20, menu_y + 20))
         
         # 绘制选项
         for i, option in enumerate(self.merchant_options):
             color = (255, 255, 255) if i == self.selected_merchant_option else (150, 150, 150)
-            text = option_font.render(f"{i+1}. {option}", True, color)
+            text = font_cache.render(f"{i+1}. {option}", color, 24, 'ui')
             self.screen.blit(text, (menu_x + 40, menu_y + 80 + i * 40))
         
         # 绘制提示
-        prompt = prompt_font.render("按上下键选择，Enter确认，Escape取消", True, (150, 150, 150))
+        prompt = font_cache.render("按上下键选择，Enter确认，Escape取消", (150, 150, 150), 16, 'ui')
         self.screen.blit(prompt, (menu_x + 40, menu_y + 160))
 
-        # 控制帧率
-        self.clock.tick(self.fps)
-
 
 # 运行游戏
 if __name__ == "__main__":
@@ -936,6 +1018,7 @@ if __name__ == "__main__":
         game.handle_events()
         game.update()
         game.render()
+        game.clock.tick(game.fps)
     print("Game exited")
     pygame.quit()
     sys.exit()
\ No newline at end of file
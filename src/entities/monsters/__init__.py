@@ -1,11 +1,21 @@
 from .factory import MonsterFactory
 from .base import BaseMonster
+from .monster_type import MonsterType
+from .aggro import AggroTable
+from .registry import MonsterRegistry, monster_registry
+from .pool import MonsterPool, monster_pool
 from .normal import Scarecrow, Chicken, Deer
 from .advanced import Skeleton, Zombie, Wolf
 
 __all__ = [
     'MonsterFactory',
     'BaseMonster',
+    'MonsterType',
+    'AggroTable',
+    'MonsterRegistry',
+    'monster_registry',
+    'MonsterPool',
+    'monster_pool',
     'Scarecrow',
     'Chicken',
     'Deer',
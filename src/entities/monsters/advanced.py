@@ -1,27 +1,26 @@
 from .base import BaseMonster
+from .monster_type import MonsterType
 import pygame
 
 class Skeleton(BaseMonster):
     """骷髅怪物"""
     
-    def __init__(self, x, y):
-        """初始化骷髅"""
-        super().__init__("骷髅", x, y)
-        
-        # 骷髅属性
-        self.health = 60
-        self.max_health = 60
-        self.attack = 15
-        self.defense = 5
-        self.exp = 30
-        self.gold = 15
-        
+    __slots__ = ()
+    
+    # 骷髅属性（所有骷髅共享）
+    TYPE = MonsterType(
+        "骷髅", health=60, attack=15, defense=5, exp=30, gold=15,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '金疮药', 'quantity': 2, 'chance': 0.4, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'health', 'value': 30},
             {'name': '骷髅骨', 'quantity': 1, 'chance': 0.3, 'type': 'material', 'subtype': 'material'},
             {'name': '生锈的剑', 'quantity': 1, 'chance': 0.2, 'type': 'weapon', 'subtype': 'equipment', 'attack': 8, 'defense': 0, 'magic': 0}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化骷髅"""
+        super().__init__("骷髅", x, y)
     
     def render_default(self, screen):
         """渲染骷髅"""
@@ -39,24 +38,22 @@ class Skeleton(BaseMonster):
 class Zombie(BaseMonster):
     """僵尸怪物"""
     
-    def __init__(self, x, y):
-        """初始化僵尸"""
-        super().__init__("僵尸", x, y)
-        
-        # 僵尸属性
-        self.health = 80
-        self.max_health = 80
-        self.attack = 20
-        self.defense = 8
-        self.exp = 40
-        self.gold = 20
-        
+    __slots__ = ()
+    
+    # 僵尸属性（所有僵尸共享）
+    TYPE = MonsterType(
+        "僵尸", health=80, attack=20, defense=8, exp=40, gold=20,
         # 掉落物品（使用物品ID）
-        self.drop_items = [
+        drop_items=[
             {'item_id': 3001, 'quantity': 3, 'chance': 0.5},  # 金疮药
             {'item_id': 4005, 'quantity': 1, 'chance': 0.3},  # 僵尸牙齿
             {'item_id': 4006, 'quantity': 1, 'chance': 0.4}   # 腐烂的肉
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化僵尸"""
+        super().__init__("僵尸", x, y)
     
     def render_default(self, screen):
         """渲染僵尸"""
@@ -74,25 +71,24 @@ class Zombie(BaseMonster):
 class Wolf(BaseMonster):
     """狼怪物"""
     
-    def __init__(self, x, y):
-        """初始化狼"""
-        super().__init__("狼", x, y)
-        
-        # 狼属性
-        self.health = 70
-        self.max_health = 70
-        self.attack = 18
-        self.defense = 4
-        self.exp = 35
-        self.gold = 18
-        self.speed = 3  # 狼跑得更快
-        
+    __slots__ = ()
+    
+    # 狼属性（所有狼共享）
+    TYPE = MonsterType(
+        "狼", health=70, attack=18, defense=4, exp=35, gold=18,
+        # 狼跑得更快
+        speed=3,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '金疮药', 'quantity': 2, 'chance': 0.4, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'health', 'value': 30},
             {'name': '狼皮', 'quantity': 1, 'chance': 0.3, 'type': 'material', 'subtype': 'material'},
             {'name': '狼牙', 'quantity': 1, 'chance': 0.2, 'type': 'material', 'subtype': 'material'}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化狼"""
+        super().__init__("狼", x, y)
     
     def render_default(self, screen):
         """渲染狼"""
@@ -112,26 +108,24 @@ class Wolf(BaseMonster):
 class Warrior(BaseMonster):
     """沃玛卫士怪物"""
     
-    def __init__(self, x, y):
-        """初始化沃玛卫士"""
-        super().__init__("沃玛卫士", x, y)
-        
-        # 沃玛卫士属性
-        self.health = 150
-        self.max_health = 150
-        self.attack = 30
-        self.defense = 15
-        self.exp = 100
-        self.gold = 50
-        
+    __slots__ = ()
+    
+    # 沃玛卫士属性（所有沃玛卫士共享）
+    TYPE = MonsterType(
+        "沃玛卫士", health=150, attack=30, defense=15, exp=100, gold=50,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '金疮药', 'quantity': 5, 'chance': 0.6, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'health', 'value': 30},
             {'name': '魔法药', 'quantity': 3, 'chance': 0.5, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'magic', 'value': 20},
             {'name': '沃玛号角', 'quantity': 1, 'chance': 0.2, 'type': 'material', 'subtype': 'material'},
             {'name': '雷电术技能书', 'quantity': 1, 'chance': 0.1, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '雷电术', 'skill_level': 1, 'required_profession': 'mage'},
             {'name': '召唤骷髅技能书', 'quantity': 1, 'chance': 0.1, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '召唤骷髅', 'skill_level': 1, 'required_profession': 'taoist'}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化沃玛卫士"""
+        super().__init__("沃玛卫士", x, y)
     
     def render_default(self, screen):
         """渲染沃玛卫士"""
@@ -151,26 +145,24 @@ class Warrior(BaseMonster):
 class ZombieKing(BaseMonster):
     """僵尸王怪物"""
     
-    def __init__(self, x, y):
-        """初始化僵尸王"""
-        super().__init__("僵尸王", x, y)
-        
-        # 僵尸王属性
-        self.health = 200
-        self.max_health = 200
-        self.attack = 35
-        self.defense = 20
-        self.exp = 150
-        self.gold = 75
-        
+    __slots__ = ()
+    
+    # 僵尸王属性（所有僵尸王共享）
+    TYPE = MonsterType(
+        "僵尸王", health=200, attack=35, defense=20, exp=150, gold=75,
         # 掉落物品（使用物品ID）
-        self.drop_items = [
+        drop_items=[
             {'item_id': 3003, 'quantity': 3, 'chance': 0.6},  # 超级金疮药
             {'item_id': 3004, 'quantity': 2, 'chance': 0.5},  # 超级魔法药
             {'item_id': 4005, 'quantity': 2, 'chance': 0.4},  # 僵尸牙齿
             {'item_id': 5004, 'quantity': 1, 'chance': 0.1},  # 半月弯刀技能书
             {'item_id': 5005, 'quantity': 1, 'chance': 0.1}   # 魔法盾技能书
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化僵尸王"""
+        super().__init__("僵尸王", x, y)
     
     def render_default(self, screen):
         """渲染僵尸王"""
@@ -188,26 +180,24 @@ class ZombieKing(BaseMonster):
 class SkeletonKing(BaseMonster):
     """骷髅王怪物"""
     
-    def __init__(self, x, y):
-        """初始化骷髅王"""
-        super().__init__("骷髅王", x, y)
-        
-        # 骷髅王属性
-        self.health = 250
-        self.max_health = 250
-        self.attack = 40
-        self.defense = 10
-        self.exp = 200
-        self.gold = 100
-        
+    __slots__ = ()
+    
+    # 骷髅王属性（所有骷髅王共享）
+    TYPE = MonsterType(
+        "骷髅王", health=250, attack=40, defense=10, exp=200, gold=100,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '超级金疮药', 'quantity': 4, 'chance': 0.7, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'health', 'value': 80},
             {'name': '超级魔法药', 'quantity': 3, 'chance': 0.6, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'magic', 'value': 60},
             {'name': '骷髅骨', 'quantity': 3, 'chance': 0.5, 'type': 'material', 'subtype': 'material'},
             {'name': '烈火剑法技能书', 'quantity': 1, 'chance': 0.15, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '烈火剑法', 'skill_level': 1, 'required_profession': 'warrior'},
             {'name': '群体治愈术技能书', 'quantity': 1, 'chance': 0.1, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '群体治愈术', 'skill_level': 1, 'required_profession': 'taoist'}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化骷髅王"""
+        super().__init__("骷髅王", x, y)
     
     def render_default(self, screen):
         """渲染骷髅王"""
@@ -228,20 +218,13 @@ class SkeletonKing(BaseMonster):
 class WomaBoss(BaseMonster):
     """沃玛教主boss"""
     
-    def __init__(self, x, y):
-        """初始化沃玛教主"""
-        super().__init__("沃玛教主", x, y)
-        
-        # 沃玛教主属性
-        self.health = 500
-        self.max_health = 500
-        self.attack = 60
-        self.defense = 30
-        self.exp = 500
-        self.gold = 300
-        
+    __slots__ = ()
+    
+    # 沃玛教主属性（所有沃玛教主共享）
+    TYPE = MonsterType(
+        "沃玛教主", health=500, attack=60, defense=30, exp=500, gold=300,
         # 掉落物品（使用物品ID）
-        self.drop_items = [
+        drop_items=[
             {'item_id': 3003, 'quantity': 10, 'chance': 0.9},  # 超级金疮药
             {'item_id': 3004, 'quantity': 8, 'chance': 0.9},  # 超级魔法药
             {'item_id': 4008, 'quantity': 2, 'chance': 0.5},  # 沃玛号角
@@ -249,6 +232,11 @@ class WomaBoss(BaseMonster):
             {'item_id': 5007, 'quantity': 1, 'chance': 0.3},  # 冰咆哮技能书
             {'item_id': 5008, 'quantity': 1, 'chance': 0.3}   # 召唤神兽技能书
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化沃玛教主"""
+        super().__init__("沃玛教主", x, y)
     
     def render_default(self, screen):
         """渲染沃玛教主"""
@@ -269,26 +257,24 @@ class WomaBoss(BaseMonster):
 class ZumaGuard(BaseMonster):
     """祖玛卫士怪物"""
     
-    def __init__(self, x, y):
-        """初始化祖玛卫士"""
-        super().__init__("祖玛卫士", x, y)
-        
-        # 祖玛卫士属性
-        self.health = 300
-        self.max_health = 300
-        self.attack = 45
-        self.defense = 25
-        self.exp = 250
-        self.gold = 150
-        
+    __slots__ = ()
+    
+    # 祖玛卫士属性（所有祖玛卫士共享）
+    TYPE = MonsterType(
+        "祖玛卫士", health=300, attack=45, defense=25, exp=250, gold=150,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '超级金疮药', 'quantity': 5, 'chance': 0.7, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'health', 'value': 80},
             {'name': '超级魔法药', 'quantity': 4, 'chance': 0.6, 'type': 'consumable', 'subtype': 'recovery', 'effect': 'magic', 'value': 60},
             {'name': '祖玛头像', 'quantity': 1, 'chance': 0.3, 'type': 'material', 'subtype': 'material'},
             {'name': '开天斩技能书', 'quantity': 1, 'chance': 0.1, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '开天斩', 'skill_level': 1, 'required_profession': 'warrior'},
             {'name': '狂龙紫电技能书', 'quantity': 1, 'chance': 0.1, 'type': 'skill_book', 'subtype': 'skill', 'skill_name': '狂龙紫电', 'skill_level': 1, 'required_profession': 'mage'}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化祖玛卫士"""
+        super().__init__("祖玛卫士", x, y)
     
     def render_default(self, screen):
         """渲染祖玛卫士"""
@@ -308,20 +294,13 @@ class ZumaGuard(BaseMonster):
 class ZumaBoss(BaseMonster):
     """祖玛教主boss"""
     
-    def __init__(self, x, y):
-        """初始化祖玛教主"""
-        super().__init__("祖玛教主", x, y)
-        
-        # 祖玛教主属性
-        self.health = 800
-        self.max_health = 800
-        self.attack = 80
-        self.defense = 40
-        self.exp = 1000
-        self.gold = 500
-        
+    __slots__ = ()
+    
+    # 祖玛教主属性（所有祖玛教主共享）
+    TYPE = MonsterType(
+        "祖玛教主", health=800, attack=80, defense=40, exp=1000, gold=500,
         # 掉落物品（使用物品ID）
-        self.drop_items = [
+        drop_items=[
             {'item_id': 3003, 'quantity': 15, 'chance': 0.95},  # 超级金疮药
             {'item_id': 3004, 'quantity': 12, 'chance': 0.95},  # 超级魔法药
             {'item_id': 4009, 'quantity': 3, 'chance': 0.7},   # 祖玛头像
@@ -329,6 +308,11 @@ class ZumaBoss(BaseMonster):
             {'item_id': 5010, 'quantity': 1, 'chance': 0.5},   # 狂龙紫电技能书
             {'item_id': 5011, 'quantity': 1, 'chance': 0.5}    # 道符连击技能书
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化祖玛教主"""
+        super().__init__("祖玛教主", x, y)
     
     def render_default(self, screen):
         """渲染祖玛教主"""
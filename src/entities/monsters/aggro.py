@@ -0,0 +1,185 @@
+import heapq
+
+
+# 每帧的毫秒数（衰减速率按帧配置，换算成按时间计算）
+FRAME_MS = 16
+# 最后一次获得仇恨后，经过该时间（毫秒）才开始衰减
+AGGRO_GRACE_MS = 1000
+# 全量检查超出追击范围、仇恨已衰减到0的目标的间隔（毫秒），当前目标每次查询都会检查
+LEASH_SWEEP_MS = 500
+
+
+class AggroTable:
+    """怪物的仇恨表
+
+    仇恨值不再每帧逐个衰减，只在获得仇恨时记录 (数值, 时间)，
+    需要时按时间戳计算当前值：最后一次获得仇恨后AGGRO_GRACE_MS内不衰减，
+    之后每帧减少decay_rate，减到0为止。
+
+    处于不衰减期的目标按数值放在一个大顶堆中；进入衰减期的目标数值都按相同速率下降，
+    彼此的大小关系不再变化，按 数值 + 速率*衰减起点 放在另一个大顶堆中。
+    两个堆顶中较大的就是仇恨最高的目标，查询不需要遍历整张表。
+    仇恨变化时直接压入新记录，旧记录按序号判断失效，出堆时跳过（惰性删除）。
+    """
+
+    __slots__ = ('decay_per_ms', 'entries', '_grace_heap', '_decay_heap', '_grace_end_heap',
+                 '_next_serial', '_next_sweep')
+
+    def __init__(self, decay_rate):
+        """初始化仇恨表
+
+        Args:
+            decay_rate: 每帧衰减的仇恨值
+        """
+        self.decay_per_ms = decay_rate / FRAME_MS
+        # 目标 -> [数值, 最后获得仇恨的时间, 序号, 是否在不衰减期]
+        self.entries = {}
+        # (-数值, 序号, 目标)
+        self._grace_heap = []
+        # (-(数值 + 速率*衰减起点), 序号, 目标)
+        self._decay_heap = []
+        # (衰减起点, 序号, 目标)
+        self._grace_end_heap = []
+        self._next_serial = 0
+        self._next_sweep = 0
+
+    def add(self, target, amount, current_time):
+        """增加目标的仇恨值
+
+        Args:
+            target: 仇恨目标（玩家、宠物等任何有x、y坐标的对象）
+            amount: 增加的仇恨值
+            current_time: 当前游戏时间（毫秒）
+        """
+        self._advance(current_time)
+        value = self.get(target, current_time) + amount
+        serial = self._next_serial
+        self._next_serial += 1
+        self.entries[target] = [value, current_time, serial, True]
+        heapq.heappush(self._grace_heap, (-value, serial, target))
+        heapq.heappush(self._grace_end_heap, (current_time + AGGRO_GRACE_MS, serial, target))
+        if len(self._grace_heap) + len(self._decay_heap) > 4 * len(self.entries) + 16:
+            self._rebuild()
+
+    def get(self, target, current_time):
+        """目标当前的仇恨值（不在表中时为0）"""
+        entry = self.entries.get(target)
+        if entry is None:
+            return 0
+        value, last_time = entry[0], entry[1]
+        decay_time = current_time - last_time - AGGRO_GRACE_MS
+        if decay_time > 0:
+            value -= self.decay_per_ms * decay_time
+        return max(0, value)
+
+    def remove(self, target):
+        """移除目标（堆中的记录在出堆时跳过）"""
+        self.entries.pop(target, None)
+
+    def clear(self):
+        """清空仇恨表"""
+        self.entries.clear()
+        self._grace_heap.clear()
+        self._decay_heap.clear()
+        self._grace_end_heap.clear()
+        self._next_sweep = 0
+
+    def top(self, current_time, x, y, leash_range):
+        """仇恨最高的目标
+
+        超出追击范围（以 (x, y) 为中心、leash_range 为半径）的目标会被移除：
+        当前目标每次查询都检查，其余目标每隔LEASH_SWEEP_MS统一检查一次，
+        同时移除仇恨已衰减到0的目标，避免它们让仇恨表一直非空（怪物一直处于战斗档位）。
+        最高仇恨已衰减到0时说明所有目标都没有仇恨，清空整张表。
+
+        Returns:
+            仇恨最高的目标，没有时返回None
+        """
+        if not self.entries:
+            return None
+        self._advance(current_time)
+        if current_time >= self._next_sweep:
+            self._next_sweep = current_time + LEASH_SWEEP_MS
+            self._sweep(current_time, x, y, leash_range)
+
+        leash_sq = leash_range * leash_range
+        while self.entries:
+            target, value = self._peek(current_time)
+            if value <= 0:
+                self.clear()
+                return None
+            dx = target.x - x
+            dy = target.y - y
+            if dx * dx + dy * dy > leash_sq:
+                self.remove(target)
+                continue
+            return target
+        return None
+
+    def _valid(self, serial, target, in_grace):
+        entry = self.entries.get(target)
+        return entry is not None and entry[2] == serial and entry[3] == in_grace
+
+    def _advance(self, current_time):
+        """把不衰减期已结束的目标移到衰减堆"""
+        grace_end_heap = self._grace_end_heap
+        while grace_end_heap and grace_end_heap[0][0] < current_time:
+            grace_end, serial, target = heapq.heappop(grace_end_heap)
+            if not self._valid(serial, target, True):
+                continue
+            entry = self.entries[target]
+            entry[3] = False
+            heapq.heappush(self._decay_heap, (-(entry[0] + self.decay_per_ms * grace_end), serial, target))
+
+    def _peek(self, current_time):
+        """两个堆顶中仇恨较高的 (目标, 当前仇恨值)，先丢弃失效的堆顶记录"""
+        grace_heap = self._grace_heap
+        while grace_heap and not self._valid(grace_heap[0][1], grace_heap[0][2], True):
+            heapq.heappop(grace_heap)
+        decay_heap = self._decay_heap
+        while decay_heap and not self._valid(decay_heap[0][1], decay_heap[0][2], False):
+            heapq.heappop(decay_heap)
+
+        best_target, best_value = None, 0
+        if grace_heap:
+            best_target, best_value = grace_heap[0][2], -grace_heap[0][0]
+        if decay_heap:
+            value = -decay_heap[0][0] - self.decay_per_ms * current_time
+            if best_target is None or value > best_value:
+                best_target, best_value = decay_heap[0][2], value
+        return best_target, best_value
+
+    def _sweep(self, current_time, x, y, leash_range):
+        """移除所有超出追击范围或仇恨已衰减到0的目标"""
+        leash_sq = leash_range * leash_range
+        for target in [t for t in self.entries
+                       if (t.x - x) ** 2 + (t.y - y) ** 2 > leash_sq or self.get(t, current_time) <= 0]:
+            del self.entries[target]
+
+    def _rebuild(self):
+        """失效记录太多时按有效条目重建堆，保证内存有界"""
+        self._grace_heap = []
+        self._decay_heap = []
+        self._grace_end_heap = []
+        for target, (value, last_time, serial, in_grace) in self.entries.items():
+            grace_end = last_time + AGGRO_GRACE_MS
+            if in_grace:
+                self._grace_heap.append((-value, serial, target))
+                self._grace_end_heap.append((grace_end, serial, target))
+            else:
+                self._decay_heap.append((-(value + self.decay_per_ms * grace_end), serial, target))
+        heapq.heapify(self._grace_heap)
+        heapq.heapify(self._decay_heap)
+        heapq.heapify(self._grace_end_heap)
+
+    def __contains__(self, target):
+        return target in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
@@ -1,52 +1,59 @@
 import pygame
 import random
-import os
+import math
+
+from src.core.clock import game_clock
+from src.systems.profiler import profiler
+from src.systems.font_cache import font_cache
+from src.systems.sound_bank import sound_bank
+from .monster_type import MonsterType
+from .aggro import AggroTable
 
 class BaseMonster:
-    """基础怪物类"""
+    """基础怪物类
+    
+    属性、掉落、精灵、音效等静态数据保存在共享的MonsterType中，
+    实例只用__slots__保存可变状态，大量刷怪时内存占用小。
+    """
+    
+    __slots__ = ('monster_type', 'x', 'y', 'spawn_point', 'activity_area', 'wander_speed', 'direction',
+                 'health', 'state', 'target', 'wander_timer', 'wander_duration',
+                 'aggro', 'last_attack_time', 'combat_state', 'array_store')
+    
+    # 休眠超过该帧数后，漫游位置视为在活动范围内均匀分布
+    FAST_FORWARD_MIX_FRAMES = 600
+    # 子类的怪物类型（MonsterType），没有时按名称使用默认类型
+    TYPE = None
     
     def __init__(self, name, x, y):
         """初始化怪物"""
-        # 基本信息
-        self.name = name
+        monster_type = self.TYPE
+        if monster_type is None or monster_type.name != name:
+            monster_type = MonsterType.for_name(name)
+        self.monster_type = monster_type
+        
+        # 仇恨系统
+        self.aggro = AggroTable(monster_type.aggro_decay_rate)
+        
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """重置为在(x, y)刚刷新的状态（对象池复用死亡的怪物时调用）"""
         self.x, self.y = x, y
         
         # 刷新点（初始位置）
         self.spawn_point = (x, y)
-        # 活动范围（以刷新点为中心的半径）
-        if '王' in name or '教主' in name:
-            # Boss类型怪物活动范围更大
-            self.activity_range = 500
-        elif name in ['狼', '僵尸', '骷髅']:
-            # 普通怪物
-            self.activity_range = 300
-        else:
-            # 小型怪物
-            self.activity_range = 200
+        # 活动区域（由地图设置，没有时使用以刷新点为中心的活动范围）
+        self.activity_area = None
         
         # 速度
-        self.speed = 1.5
-        self.wander_speed = self.speed  # 初始化为正常速度
+        self.wander_speed = self.monster_type.speed  # 初始化为正常速度
         
         # 方向
         self.direction = random.randint(0, 3)
         
-        # 动画状态
-        self.animation_frame = 0
-        self.animation_speed = 0.05
-        
-        # 基本属性（由子类覆盖）
-        self.health = 50
-        self.max_health = 50
-        self.attack = 10
-        self.defense = 5
-        self.exp = 20
-        self.gold = 10
-        self.drop_items = []  # 掉落物品
-        self.sound_effects = {}  # 声音效果
-        
-        # 加载声音效果
-        self.load_sound_effects()
+        # 生命值
+        self.health = self.monster_type.health
         
         # AI状态
         self.state = 'wandering'
@@ -55,20 +62,36 @@ class BaseMonster:
         self.wander_duration = random.randint(60, 120)
         
         # 仇恨系统
-        self.aggro_list = {}  # 仇恨列表 {player: aggro_value}
-        self.aggro_range = 150  # 仇恨范围
-        self.attack_range = 30  # 攻击范围
-        self.aggro_decay_rate = 0.5  # 仇恨衰减率
-        self.last_aggro_time = {}  # 最后获得仇恨的时间
-        self.attack_cooldown = 60  # 攻击冷却时间（帧数）
+        self.aggro.clear()
         self.last_attack_time = 0  # 最后攻击时间
         self.combat_state = False  # 战斗状态
-        
-        # 加载精灵素材
-        self.load_sprites()
+        # 所属的数组化怪物存储（由MonsterArrayStore设置），进入战斗时需要通知它
+        self.array_store = None
+    
+    # 类型的静态数据（只读）
+    name = property(lambda self: self.monster_type.name)
+    max_health = property(lambda self: self.monster_type.health)
+    attack = property(lambda self: self.monster_type.attack)
+    defense = property(lambda self: self.monster_type.defense)
+    exp = property(lambda self: self.monster_type.exp)
+    gold = property(lambda self: self.monster_type.gold)
+    speed = property(lambda self: self.monster_type.speed)
+    drop_items = property(lambda self: self.monster_type.drop_items)
+    activity_range = property(lambda self: self.monster_type.activity_range)
+    aggro_range = property(lambda self: self.monster_type.aggro_range)
+    attack_range = property(lambda self: self.monster_type.attack_range)
+    aggro_decay_rate = property(lambda self: self.monster_type.aggro_decay_rate)
+    attack_cooldown = property(lambda self: self.monster_type.attack_cooldown)
+    sound_effects = property(lambda self: self.monster_type.get_sounds())
     
-    def update(self, player):
-        """更新怪物状态"""
+    @profiler.profile('BaseMonster.update')
+    def update(self, player, steps=1):
+        """更新怪物状态
+        
+        Args:
+            player: 玩家
+            steps: 本次更新代表的帧数（降频更新时大于1，漫游和回归按帧数放大位移）
+        """
         # 计算与玩家的距离
         dx = player.x - self.x
         dy = player.y - self.y
@@ -78,7 +101,7 @@ class BaseMonster:
         boundary_breach = False
         
         # 检查是否接近或超出活动区域边界
-        if hasattr(self, 'activity_area'):
+        if self.activity_area is not None:
             area = self.activity_area
             # 计算到边界的距离
             dist_to_left = self.x - area['x1']
@@ -89,7 +112,7 @@ class BaseMonster:
             # 检查是否超出边界
             if self.x < area['x1'] or self.x > area['x2'] or self.y < area['y1'] or self.y > area['y2']:
                 # 超出边界，执行平滑引导回归
-                self.smooth_return_to_area(area)
+                self.smooth_return_to_area(area, steps)
                 boundary_breach = True
             elif min(dist_to_left, dist_to_right, dist_to_top, dist_to_bottom) < 50:
                 # 接近边界，触发预警减速
@@ -105,7 +128,7 @@ class BaseMonster:
             
             if spawn_distance > self.activity_range:
                 # 超出活动范围，执行平滑引导回归
-                self.smooth_return_to_spawn()
+                self.smooth_return_to_spawn(steps)
                 boundary_breach = True
             elif spawn_distance > self.activity_range * 0.8:
                 # 接近边界，触发预警减速
@@ -138,31 +161,99 @@ class BaseMonster:
             else:
                 # 无目标，随机漫游
                 self.state = 'wandering'
-                self.wander()
+                self.wander(steps)
         
         # 限制位置
         self.x = max(0, min(2400 - 32, self.x))
         self.y = max(0, min(1800 - 32, self.y))
         
-    def wander(self):
+    def wander(self, steps=1):
         """随机漫游"""
-        self.wander_timer += 1
+        self.wander_timer += steps
         if self.wander_timer >= self.wander_duration:
             self.direction = random.randint(0, 3)
             self.wander_timer = 0
             self.wander_duration = random.randint(60, 120)
         
         # 移动
+        distance = self.wander_speed * steps
         if self.direction == 0:
-            self.y -= self.wander_speed
+            self.y -= distance
         elif self.direction == 1:
-            self.x += self.wander_speed
+            self.x += distance
         elif self.direction == 2:
-            self.y += self.wander_speed
+            self.y += distance
         elif self.direction == 3:
-            self.x -= self.wander_speed
+            self.x -= distance
+    
+    def fast_forward(self, elapsed_frames, is_blocked=None):
+        """休眠结束时一次性推进漫游状态
+        
+        休眠期间玩家不在附近，怪物只会脱离战斗并在活动范围内漫游。
+        时间较短时按漫游的分段直线运动推进（每段一次计算），
+        时间足够长时位置近似均匀分布，直接在活动范围内随机取点。
+        
+        Args:
+            elapsed_frames: 休眠经过的帧数
+            is_blocked: 可选的判断函数 is_blocked(monster)，推进后的位置被地形阻挡时放弃本次位移
+        """
+        # 脱离战斗
+        self.aggro.clear()
+        self.target = None
+        self.combat_state = False
+        self.state = 'wandering'
+        
+        elapsed_frames = int(elapsed_frames)
+        if elapsed_frames <= 0:
+            return
+        
+        old_x, old_y = self.x, self.y
+        if elapsed_frames >= self.FAST_FORWARD_MIX_FRAMES:
+            # 随机取点
+            if self.activity_area is not None:
+                area = self.activity_area
+                self.x = random.uniform(area['x1'], area['x2'])
+                self.y = random.uniform(area['y1'], area['y2'])
+            else:
+                angle = random.uniform(0, 2 * math.pi)
+                radius = self.activity_range * random.random() ** 0.5
+                self.x = self.spawn_point[0] + math.cos(angle) * radius
+                self.y = self.spawn_point[1] + math.sin(angle) * radius
+            self.direction = random.randint(0, 3)
+            self.wander_timer = random.randint(0, 59)
+            self.wander_duration = random.randint(60, 120)
+        else:
+            # 按漫游分段推进
+            remaining = elapsed_frames
+            while remaining > 0:
+                segment = max(1, min(remaining, self.wander_duration - self.wander_timer))
+                self.wander(segment)
+                remaining -= segment
+            self._clamp_to_activity_range()
+        
+        # 限制位置
+        self.x = max(0, min(2400 - 32, self.x))
+        self.y = max(0, min(1800 - 32, self.y))
+        
+        if is_blocked is not None and is_blocked(self):
+            self.x, self.y = old_x, old_y
+    
+    def _clamp_to_activity_range(self):
+        """把位置限制在活动范围内"""
+        if self.activity_area is not None:
+            area = self.activity_area
+            self.x = max(area['x1'], min(area['x2'], self.x))
+            self.y = max(area['y1'], min(area['y2'], self.y))
+        else:
+            dx = self.x - self.spawn_point[0]
+            dy = self.y - self.spawn_point[1]
+            distance = (dx**2 + dy**2)**0.5
+            if distance > self.activity_range:
+                scale = self.activity_range / distance
+                self.x = self.spawn_point[0] + dx * scale
+                self.y = self.spawn_point[1] + dy * scale
     
-    def smooth_return_to_area(self, area):
+    def smooth_return_to_area(self, area, steps=1):
         """平滑返回活动区域"""
         # 计算区域中心
         area_center_x = (area['x1'] + area['x2']) // 2
@@ -175,7 +266,7 @@ class BaseMonster:
         
         if distance > 0:
             # 平滑向区域中心移动
-            move_speed = self.speed * 1.2  # 加速返回
+            move_speed = self.speed * 1.2 * steps  # 加速返回
             self.x += (dx / distance) * move_speed
             self.y += (dy / distance) * move_speed
             
@@ -191,7 +282,7 @@ class BaseMonster:
                 else:
                     self.direction = 0
     
-    def smooth_return_to_spawn(self):
+    def smooth_return_to_spawn(self, steps=1):
         """平滑返回刷新点"""
         # 计算到刷新点的方向
         spawn_dx = self.spawn_point[0] - self.x
@@ -201,7 +292,7 @@ class BaseMonster:
         distance = (spawn_dx**2 + spawn_dy**2)**0.5
         if distance > 0:
             # 平滑向刷新点移动
-            move_speed = self.speed * 1.2  # 加速返回
+            move_speed = self.speed * 1.2 * steps  # 加速返回
             self.x += (spawn_dx / distance) * move_speed
             self.y += (spawn_dy / distance) * move_speed
             
@@ -217,48 +308,6 @@ class BaseMonster:
                 else:
                     self.direction = 0
     
-    def load_sprites(self):
-        """加载精灵素材"""
-        # 尝试加载图片，失败则使用默认颜色
-        try:
-            base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets')
-            self.sprites = {}
-            
-            # 根据怪物名称加载对应的精灵
-            monster_sprite_path = os.path.join(base_path, f"sprites/monster/{self.name}.png")
-            
-            # 特殊处理：鸡和鹿的素材文件名
-            if self.name == '鸡':
-                monster_sprite_path = os.path.join(base_path, "sprites/monster/鸡.png")
-            elif self.name == '鹿':
-                monster_sprite_path = os.path.join(base_path, "sprites/monster/鹿.png")
-            
-            if os.path.exists(monster_sprite_path):
-                self.sprites['default'] = pygame.image.load(monster_sprite_path).convert_alpha()
-                # 缩放精灵到合适大小（根据怪物类型调整大小，符合盛大传奇风格）
-                if '王' in self.name or '教主' in self.name:
-                    # BOSS怪物，更大
-                    self.sprites['default'] = pygame.transform.scale(self.sprites['default'], (48, 48))
-                elif self.name in ['狼', '僵尸', '骷髅']:
-                    # 较大的怪物
-                    self.sprites['default'] = pygame.transform.scale(self.sprites['default'], (30, 30))
-                elif self.name in ['稻草人', '鸡', '鹿']:
-                    # 较小的怪物
-                    self.sprites['default'] = pygame.transform.scale(self.sprites['default'], (24, 24))
-                else:
-                    # 默认大小
-                    self.sprites['default'] = pygame.transform.scale(self.sprites['default'], (28, 28))
-                self.use_default_sprites = False
-            else:
-                # 对于其他怪物，使用默认的渲染
-                self.sprites['default'] = None
-                self.use_default_sprites = True
-                print(f"未找到怪物素材: {monster_sprite_path}")
-        except Exception as e:
-            print(f"加载怪物精灵失败: {e}")
-            self.use_default_sprites = True
-            self.sprites = {'default': None}
-    
     def chase(self, player):
         """追击玩家"""
         # 计算方向
@@ -304,9 +353,9 @@ class BaseMonster:
     
     def render(self, screen):
         """渲染怪物"""
-        if not self.use_default_sprites and self.sprites.get('default'):
+        sprite = self.monster_type.get_sprite()
+        if sprite is not None:
             # 使用加载的精灵图片
-            sprite = self.sprites['default']
             screen.blit(sprite, (self.x, self.y))
         else:
             # 绘制默认怪物
@@ -321,33 +370,18 @@ class BaseMonster:
     def render_default(self, screen):
         """渲染默认怪物"""
         # 默认怪物（传奇风格）
-        if '王' in self.name or '教主' in self.name:
+        if self.monster_type.is_boss:
             # BOSS怪物，更大
             pygame.draw.rect(screen, (255, 0, 0), (self.x + 8, self.y + 8, 32, 32))
-        elif self.name in ['狼', '僵尸', '骷髅']:
-            # 较大的怪物
-            pygame.draw.rect(screen, (150, 50, 50), (self.x + 5, self.y + 5, 20, 20))
-        elif self.name in ['稻草人', '鸡', '鹿']:
-            # 较小的怪物
-            pygame.draw.rect(screen, (150, 50, 50), (self.x + 4, self.y + 4, 16, 16))
         else:
-            # 默认大小
-            pygame.draw.rect(screen, (150, 50, 50), (self.x + 4, self.y + 4, 20, 20))
+            # 普通怪物按体型绘制（与碰撞盒一致）
+            offset_x, offset_y, width, height = self.monster_type.collision_box
+            pygame.draw.rect(screen, (150, 50, 50), (self.x + offset_x, self.y + offset_y, width, height))
     
     def render_name(self, screen):
         """渲染怪物名字"""
         # 绘制怪物名字（传奇风格，红色）
-        try:
-            font = pygame.font.SysFont('hiraginosansgb', 12)
-        except:
-            try:
-                font = pygame.font.SysFont('songti', 12)
-            except:
-                try:
-                    font = pygame.font.SysFont('arialunicode', 12)
-                except:
-                    font = pygame.font.Font(None, 12)
-        text = font.render(self.name, True, (255, 0, 0))
+        text = font_cache.render(self.name, (255, 0, 0), 12)
         screen.blit(text, (self.x + 8, self.y - 15))
     
     def render_health_bar(self, screen):
@@ -361,6 +395,8 @@ class BaseMonster:
     
     def take_damage(self, damage, attacker=None):
         """受到伤害"""
+        if self.array_store is not None:
+            self.array_store.mark_engaged(self)
         actual_damage = max(1, damage - self.defense)
         self.health -= actual_damage
         
@@ -378,62 +414,31 @@ class BaseMonster:
         return actual_damage
     
     def add_aggro(self, target, amount):
-        """增加仇恨值"""
-        if target not in self.aggro_list:
-            self.aggro_list[target] = 0
-        
-        self.aggro_list[target] += amount
-        self.last_aggro_time[target] = pygame.time.get_ticks()
+        """增加仇恨值（受到伤害、宠物攻击等仇恨事件）"""
+        if self.array_store is not None and not self.combat_state:
+            self.array_store.mark_engaged(self)
+        self.aggro.add(target, amount, game_clock.get_ticks())
         self.combat_state = True
     
     def update_aggro(self, player, distance):
-        """更新仇恨值"""
+        """更新仇恨值（衰减按时间戳在查询时计算，这里只处理玩家靠近产生的仇恨）"""
         # 检查玩家是否在仇恨范围内
         if distance <= self.aggro_range:
             # 基础仇恨值（玩家在范围内）
             self.add_aggro(player, 1)
-        
-        # 衰减仇恨值
-        current_time = pygame.time.get_ticks()
-        to_remove = []
-        
-        for target, aggro in self.aggro_list.items():
-            # 检查目标是否还在仇恨范围内
-            target_distance = ((target.x - self.x)**2 + (target.y - self.y)**2)**0.5
-            
-            if target_distance > self.aggro_range * 1.5:
-                # 目标超出范围，清除仇恨
-                to_remove.append(target)
-            else:
-                # 衰减仇恨值
-                time_since_last_aggro = current_time - self.last_aggro_time.get(target, current_time)
-                if time_since_last_aggro > 1000:  # 1秒
-                    self.aggro_list[target] = max(0, self.aggro_list[target] - self.aggro_decay_rate)
-                    if self.aggro_list[target] <= 0:
-                        to_remove.append(target)
-        
-        # 移除没有仇恨的目标
-        for target in to_remove:
-            del self.aggro_list[target]
-            if target in self.last_aggro_time:
-                del self.last_aggro_time[target]
-        
-        # 如果没有仇恨目标，退出战斗状态
-        if not self.aggro_list:
-            self.combat_state = False
     
     def update_target(self):
         """更新当前目标"""
-        if not self.aggro_list:
-            self.target = None
-            return
+        # 选择仇恨值最高的目标，超出追击范围（仇恨范围的1.5倍）的目标被移除
+        self.target = self.aggro.top(game_clock.get_ticks(), self.x, self.y, self.aggro_range * 1.5)
         
-        # 选择仇恨值最高的目标
-        self.target = max(self.aggro_list.items(), key=lambda x: x[1])[0]
+        # 如果没有仇恨目标，退出战斗状态
+        if self.target is None:
+            self.combat_state = False
     
     def attack_target(self, target):
         """攻击目标"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         
         # 检查攻击冷却
         if current_time - self.last_attack_time > self.attack_cooldown * 16:  # 16ms per frame
@@ -455,19 +460,16 @@ class BaseMonster:
         """获取掉落物品"""
         return self.drop_items
     
+    def get_collision_rect(self):
+        """获取碰撞盒（世界坐标）"""
+        # 为了避免穿模，使用较小的碰撞盒（按怪物类型预先确定）
+        offset_x, offset_y, width, height = self.monster_type.collision_box
+        return pygame.Rect(self.x + offset_x, self.y + offset_y, width, height)
+    
     def collides_with(self, other):
         """检测是否与其他游戏元素碰撞"""
         # 简化碰撞检测，只返回是否碰撞
-        # 为了避免穿模，使用较小的碰撞盒
-        if self.name in ['狼', '僵尸', '骷髅']:
-            # 较大的怪物
-            self_rect = pygame.Rect(self.x + 5, self.y + 5, 20, 20)
-        elif self.name in ['稻草人', '鸡', '鹿']:
-            # 较小的怪物
-            self_rect = pygame.Rect(self.x + 4, self.y + 4, 16, 16)
-        else:
-            # 默认大小
-            self_rect = pygame.Rect(self.x + 4, self.y + 4, 20, 20)
+        self_rect = self.get_collision_rect()
         
         # 根据其他对象类型调整碰撞盒
         if hasattr(other, 'name') and other.name == '玩家':
@@ -484,39 +486,6 @@ class BaseMonster:
         # 不进行推挤，只检测碰撞
         pass
     
-    def load_sound_effects(self):
-        """加载声音效果"""
-        try:
-            import os
-            base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets')
-            sound_path = os.path.join(base_path, 'sounds')
-            
-            # 为不同类型的声音效果设置默认路径
-            sound_types = ['attack', 'hurt', 'death']
-            
-            for sound_type in sound_types:
-                # 尝试加载怪物特定的声音
-                monster_sound_path = os.path.join(sound_path, f"{self.name.lower().replace(' ', '_')}_{sound_type}.wav")
-                if os.path.exists(monster_sound_path):
-                    try:
-                        self.sound_effects[sound_type] = pygame.mixer.Sound(monster_sound_path)
-                    except:
-                        pass
-                else:
-                    # 尝试加载通用声音
-                    generic_sound_path = os.path.join(sound_path, f"{sound_type}.wav")
-                    if os.path.exists(generic_sound_path):
-                        try:
-                            self.sound_effects[sound_type] = pygame.mixer.Sound(generic_sound_path)
-                        except:
-                            pass
-        except Exception as e:
-            print(f"加载声音效果失败: {e}")
-    
     def play_sound(self, sound_type):
         """播放声音效果"""
-        if sound_type in self.sound_effects:
-            try:
-                self.sound_effects[sound_type].play()
-            except:
-                pass
+        sound_bank.play(self.sound_effects.get(sound_type))
@@ -0,0 +1,125 @@
+import os
+from types import MappingProxyType
+
+from src.systems.asset_cache import asset_cache
+from src.systems.sound_bank import sound_bank
+
+
+# 怪物精灵目录
+MONSTER_SPRITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets', 'sprites', 'monster')
+
+# 体型 -> (活动范围, 精灵尺寸, 碰撞盒, 推挤半径, 靠近检测尺寸)
+# 碰撞盒是相对怪物坐标的 (偏移x, 偏移y, 宽, 高)，为了避免穿模比精灵小；
+# 推挤半径用于玩家与怪物的碰撞反弹，靠近检测尺寸用于计算怪物中心点
+BODY_SIZES = {
+    # Boss类型怪物活动范围更大，精灵更大
+    'boss': (500, (48, 48), (4, 4, 20, 20), 14, 32),
+    # 普通怪物，较大
+    'large': (300, (30, 30), (5, 5, 20, 20), 15, 36),
+    # 小型怪物
+    'small': (200, (24, 24), (4, 4, 16, 16), 12, 28),
+    # 默认大小
+    'normal': (200, (28, 28), (4, 4, 20, 20), 14, 32)
+}
+# 怪物名称 -> 体型（未列出的按默认大小）
+BODY_SIZE_BY_NAME = {
+    '狼': 'large', '僵尸': 'large', '骷髅': 'large',
+    '稻草人': 'small', '鸡': 'small', '鹿': 'small'
+}
+
+
+class MonsterType:
+    """怪物类型描述
+
+    同一种怪物的静态数据（属性、掉落、活动范围、精灵尺寸、碰撞盒、音效）只保存一份，
+    由该类型的所有实例共享；实例只保存位置、血量、AI状态等可变数据。
+    创建后不可修改，掉落物品表也是只读的。
+    """
+
+    __slots__ = ('name', 'health', 'attack', 'defense', 'exp', 'gold', 'speed', 'drop_items',
+                 'activity_range', 'sprite_size', 'sprite_path', 'collision_box', 'is_boss',
+                 'body_size', 'contact_radius', 'proximity_size',
+                 'aggro_range', 'attack_range', 'aggro_decay_rate', 'attack_cooldown',
+                 '_sprite', '_sounds')
+
+    # 按名称创建的默认类型（没有专门子类的怪物）
+    _defaults = {}
+
+    def __init__(self, name, health=50, attack=10, defense=5, exp=20, gold=10, speed=1.5, drop_items=()):
+        """创建怪物类型
+
+        Args:
+            name: 怪物名称
+            health: 最大生命值
+            attack, defense: 攻击、防御
+            exp, gold: 击杀获得的经验和金币
+            speed: 移动速度
+            drop_items: 掉落物品表（字典列表）
+        """
+        # 体型只在创建类型时判断一次，之后各处直接读取描述中的字段
+        is_boss = '王' in name or '教主' in name
+        body_size = 'boss' if is_boss else BODY_SIZE_BY_NAME.get(name, 'normal')
+        activity_range, sprite_size, collision_box, contact_radius, proximity_size = BODY_SIZES[body_size]
+
+        fields = {
+            'name': name,
+            'health': health,
+            'attack': attack,
+            'defense': defense,
+            'exp': exp,
+            'gold': gold,
+            'speed': speed,
+            'drop_items': tuple(MappingProxyType(dict(item)) for item in drop_items),
+            'activity_range': activity_range,
+            'sprite_size': sprite_size,
+            'sprite_path': os.path.join(MONSTER_SPRITE_DIR, f"{name}.png"),
+            'collision_box': collision_box,
+            'is_boss': is_boss,
+            'body_size': body_size,
+            'contact_radius': contact_radius,
+            'proximity_size': proximity_size,
+            'aggro_range': 150,
+            'attack_range': 30,
+            'aggro_decay_rate': 0.5,
+            # 攻击冷却时间（帧数）
+            'attack_cooldown': 60,
+            '_sprite': False,
+            '_sounds': None
+        }
+        for field, value in fields.items():
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"MonsterType是只读的，不能修改{name}")
+
+    @classmethod
+    def for_name(cls, name):
+        """获取没有专门子类的怪物的默认类型（按名称缓存）"""
+        monster_type = cls._defaults.get(name)
+        if monster_type is None:
+            monster_type = cls._defaults[name] = cls(name)
+        return monster_type
+
+    def get_sprite(self):
+        """精灵图片（首次使用时加载，没有素材时为None）"""
+        sprite = self._sprite
+        if sprite is False:
+            try:
+                # 同一素材只加载一次，刷新怪物不再读取磁盘
+                sprite = asset_cache.get_image(self.sprite_path, self.sprite_size)
+            except Exception as e:
+                print(f"加载怪物精灵失败: {e}")
+                sprite = None
+            object.__setattr__(self, '_sprite', sprite)
+        return sprite
+
+    def get_sounds(self):
+        """音效表 {类型: Sound}（首次使用时加载）"""
+        sounds = self._sounds
+        if sounds is None:
+            sounds = sound_bank.get_monster_sounds(self.name)
+            object.__setattr__(self, '_sounds', sounds)
+        return sounds
+
+    def __repr__(self):
+        return f"MonsterType({self.name!r})"
@@ -1,26 +1,25 @@
 from .base import BaseMonster
+from .monster_type import MonsterType
 import pygame
 
 class Scarecrow(BaseMonster):
     """稻草人怪物"""
     
-    def __init__(self, x, y):
-        """初始化稻草人"""
-        super().__init__("稻草人", x, y)
-        
-        # 稻草人属性
-        self.health = 30
-        self.max_health = 30
-        self.attack = 5
-        self.defense = 2
-        self.exp = 10
-        self.gold = 5
-        
+    __slots__ = ()
+    
+    # 稻草人属性（所有稻草人共享）
+    TYPE = MonsterType(
+        "稻草人", health=30, attack=5, defense=2, exp=10, gold=5,
         # 掉落物品（使用物品ID）
-        self.drop_items = [
+        drop_items=[
             {'item_id': 3001, 'quantity': 1, 'chance': 0.3},  # 金疮药
             {'item_id': 4007, 'quantity': 1, 'chance': 0.1}   # 稻草人之心
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化稻草人"""
+        super().__init__("稻草人", x, y)
     
     def render_default(self, screen):
         """渲染稻草人"""
@@ -41,23 +40,21 @@ class Scarecrow(BaseMonster):
 class Chicken(BaseMonster):
     """鸡怪物"""
     
-    def __init__(self, x, y):
-        """初始化鸡"""
-        super().__init__("鸡", x, y)
-        
-        # 鸡属性
-        self.health = 20
-        self.max_health = 20
-        self.attack = 3
-        self.defense = 1
-        self.exp = 5
-        self.gold = 2
-        
+    __slots__ = ()
+    
+    # 鸡属性（所有鸡共享）
+    TYPE = MonsterType(
+        "鸡", health=20, attack=3, defense=1, exp=5, gold=2,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '鸡肉', 'quantity': 1, 'chance': 0.5},
             {'name': '鸡毛', 'quantity': 1, 'chance': 0.3}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化鸡"""
+        super().__init__("鸡", x, y)
     
     def render_default(self, screen):
         """渲染鸡"""
@@ -78,24 +75,22 @@ class Chicken(BaseMonster):
 class Deer(BaseMonster):
     """鹿怪物"""
     
-    def __init__(self, x, y):
-        """初始化鹿"""
-        super().__init__("鹿", x, y)
-        
-        # 鹿属性
-        self.health = 40
-        self.max_health = 40
-        self.attack = 8
-        self.defense = 3
-        self.exp = 15
-        self.gold = 8
-        
+    __slots__ = ()
+    
+    # 鹿属性（所有鹿共享）
+    TYPE = MonsterType(
+        "鹿", health=40, attack=8, defense=3, exp=15, gold=8,
         # 掉落物品
-        self.drop_items = [
+        drop_items=[
             {'name': '鹿肉', 'quantity': 1, 'chance': 0.4},
             {'name': '鹿皮', 'quantity': 1, 'chance': 0.2},
             {'name': '鹿茸', 'quantity': 1, 'chance': 0.1}
         ]
+    )
+    
+    def __init__(self, x, y):
+        """初始化鹿"""
+        super().__init__("鹿", x, y)
     
     def render_default(self, screen):
         """渲染鹿"""
@@ -0,0 +1,76 @@
+import threading
+from collections import deque
+
+from .factory import MonsterFactory
+
+
+class MonsterPool:
+    """怪物对象池
+
+    按怪物名称保存死亡后释放的怪物，刷新同类怪物时重置并复用，不再创建新对象。
+    每种怪物的空闲列表先进先出，刚死亡的怪物最晚被复用，
+    仍引用它的技能动画等有时间结束。
+    存取空闲列表时加锁，可以在任意线程中使用。
+    """
+
+    def __init__(self, max_free_per_type=32):
+        """初始化对象池
+
+        Args:
+            max_free_per_type: 每种怪物最多保留的空闲对象数
+        """
+        self.max_free_per_type = max_free_per_type
+        # 怪物名称 -> deque[怪物]
+        self.free_lists = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, name, x, y):
+        """获取一只在(x, y)刷新的怪物
+
+        Args:
+            name: 怪物名称
+            x, y: 刷新位置
+
+        Returns:
+            怪物实例（复用的对象已重置为刚刷新的状态）
+        """
+        with self._lock:
+            free_list = self.free_lists.get(name)
+            monster = free_list.popleft() if free_list else None
+            if monster is not None:
+                self.reused += 1
+            else:
+                self.created += 1
+        if monster is None:
+            return MonsterFactory.create_monster(name, x, y)
+        monster.reset(x, y)
+        return monster
+
+    def release(self, monster):
+        """回收一只已从地图移除的怪物"""
+        with self._lock:
+            free_list = self.free_lists.get(monster.name)
+            if free_list is None:
+                free_list = self.free_lists[monster.name] = deque()
+            if len(free_list) < self.max_free_per_type:
+                free_list.append(monster)
+
+    def clear(self):
+        """清空对象池"""
+        with self._lock:
+            self.free_lists.clear()
+
+    def get_stats(self):
+        """获取对象池统计"""
+        with self._lock:
+            return {
+                'free': sum(len(free_list) for free_list in self.free_lists.values()),
+                'created': self.created,
+                'reused': self.reused
+            }
+
+
+# 创建全局怪物对象池实例
+monster_pool = MonsterPool()
@@ -0,0 +1,81 @@
+from src.core.id_manager import id_manager
+
+from .base import BaseMonster
+from .monster_type import MonsterType
+from .normal import Scarecrow, Chicken, Deer
+from .advanced import Skeleton, Zombie, Wolf, Warrior, ZombieKing, SkeletonKing, WomaBoss, ZumaGuard, ZumaBoss
+
+
+# 有专门子类的怪物（按可用怪物列表的顺序）
+MONSTER_CLASSES = (Scarecrow, Chicken, Deer, Skeleton, Zombie, Wolf, Warrior,
+                   ZombieKing, SkeletonKing, WomaBoss, ZumaGuard, ZumaBoss)
+
+
+class MonsterRegistry:
+    """怪物注册表
+
+    启动时一次性建立 名称 -> (怪物类, 类型描述) 和 ID -> 名称 两张表，
+    创建怪物、判断Boss、读取体型都只需一次字典查找，不再逐个比较名称字符串。
+    没有专门子类的怪物使用BaseMonster和按名称缓存的默认类型。
+    """
+
+    def __init__(self, monster_classes=MONSTER_CLASSES, monster_ids=None):
+        """初始化注册表
+
+        Args:
+            monster_classes: 怪物子类列表（每个子类的TYPE描述其静态数据）
+            monster_ids: 怪物ID索引 {ID: {"name": 名称, ...}}，默认使用ID管理器中的数据
+        """
+        self.monster_classes = tuple(monster_classes)
+        # 名称 -> (怪物类, MonsterType)
+        self.entries = {}
+        for monster_class in monster_classes:
+            monster_type = monster_class.TYPE
+            self.entries[monster_type.name] = (monster_class, monster_type)
+        # ID -> 名称
+        if monster_ids is None:
+            monster_ids = id_manager.monster_ids
+        self.names_by_id = {monster_id: info['name'] for monster_id, info in monster_ids.items()}
+        self.ids_by_name = {name: monster_id for monster_id, name in self.names_by_id.items()}
+
+    def get_entry(self, name):
+        """获取 (怪物类, 类型描述)，未注册的名称返回BaseMonster和默认类型"""
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = (BaseMonster, MonsterType.for_name(name))
+        return entry
+
+    def get_type(self, name):
+        """根据名称获取类型描述"""
+        return self.get_entry(name)[1]
+
+    def get_name(self, monster_id):
+        """根据ID获取怪物名称（未知ID返回None）"""
+        return self.names_by_id.get(monster_id)
+
+    def get_id(self, name):
+        """根据名称获取怪物ID（未知名称返回None）"""
+        return self.ids_by_name.get(name)
+
+    def is_boss(self, name):
+        """判断该名称的怪物是否为Boss"""
+        return self.get_type(name).is_boss
+
+    def create(self, name, x, y):
+        """根据名称创建怪物实例"""
+        monster_class, _ = self.get_entry(name)
+        if monster_class is BaseMonster:
+            return BaseMonster(name, x, y)
+        return monster_class(x, y)
+
+    def create_by_id(self, monster_id, x, y):
+        """根据ID创建怪物实例（未知ID创建"未知怪物"）"""
+        return self.create(self.names_by_id.get(monster_id, "未知怪物"), x, y)
+
+    def get_available_monsters(self):
+        """有专门子类的怪物名称列表"""
+        return [monster_class.TYPE.name for monster_class in self.monster_classes]
+
+
+# 创建全局怪物注册表实例
+monster_registry = MonsterRegistry()
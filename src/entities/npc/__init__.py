@@ -1,13 +1,27 @@
+import importlib
+
 from .base import BaseNPC
-from .types.village import VillageNPC
-from .types.forest import ForestNPC
-from .types.desert import DesertNPC
-from .types.dungeon import DungeonNPC
-from .behaviors.quest import QuestBehavior
-from .behaviors.trade import TradeBehavior
-from .behaviors.skill import SkillBehavior
-from .behaviors.repair import RepairBehavior
-from .behaviors.heal import HealBehavior
+
+# NPC类型和行为模块在首次使用时才导入，缩短启动时间
+_LAZY_EXPORTS = {
+    'VillageNPC': '.types.village',
+    'ForestNPC': '.types.forest',
+    'DesertNPC': '.types.desert',
+    'DungeonNPC': '.types.dungeon',
+    'QuestBehavior': '.behaviors.quest',
+    'TradeBehavior': '.behaviors.trade',
+    'SkillBehavior': '.behaviors.skill',
+    'RepairBehavior': '.behaviors.repair',
+    'HealBehavior': '.behaviors.heal'
+}
+
+# 地图类型 -> NPC类名
+_MAP_NPC_CLASSES = {
+    '村庄': 'VillageNPC',
+    '森林': 'ForestNPC',
+    '沙漠': 'DesertNPC',
+    '地牢': 'DungeonNPC'
+}
 
 # 导出所有类
 __all__ = [
@@ -23,16 +37,23 @@ __all__ = [
     'HealBehavior'
 ]
 
+
+def __getattr__(name):
+    """按需导入NPC类型和行为类"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 # 创建NPC工厂函数
 def create_npc(name, x, y, dialogue, has_shop=False, map_type='村庄', npc_type='普通', function=None):
     """创建NPC的工厂函数"""
-    if map_type == '村庄':
-        return VillageNPC(name, x, y, dialogue, has_shop, npc_type, function)
-    elif map_type == '森林':
-        return ForestNPC(name, x, y, dialogue, has_shop, npc_type, function)
-    elif map_type == '沙漠':
-        return DesertNPC(name, x, y, dialogue, has_shop, npc_type, function)
-    elif map_type == '地牢':
-        return DungeonNPC(name, x, y, dialogue, has_shop, npc_type, function)
+    class_name = _MAP_NPC_CLASSES.get(map_type)
+    if class_name:
+        npc_class = globals().get(class_name) or __getattr__(class_name)
+        return npc_class(name, x, y, dialogue, has_shop, npc_type, function)
     else:
         return BaseNPC(name, x, y, dialogue, has_shop, map_type, npc_type, function)
@@ -1,9 +1,205 @@
 import pygame
 import math
 import os
+from types import MappingProxyType
+
+from src.systems.font_cache import font_cache
+from src.systems.asset_cache import asset_cache
+
+
+# 根据心情调整的颜色亮度
+MOOD_BRIGHTNESS = MappingProxyType({
+    '正常': 1.0,
+    '积极': 1.2,
+    '温和': 0.9,
+    '谨慎': 0.8,
+    '直率': 1.1,
+    '平静': 0.9,
+    '神圣': 1.3,
+    '欢快': 1.2,
+    '轻松': 1.0,
+    '专注': 0.8,
+    '冷静': 0.9,
+    '灵活': 1.0,
+    '严肃': 0.8,
+    '沉思': 0.7,
+    '警惕': 1.1,
+    '阴郁': 0.6,
+    '疯狂': 1.3,
+    '自豪': 1.2,
+    '傲慢': 1.1,
+    '自信': 1.1,
+    '豪放': 1.2,
+    '狂野': 1.3,
+    '麻木': 0.5
+})
+
+# 心情 -> 心情指示器
+MOOD_INDICATORS = MappingProxyType({
+    '积极': '😊',
+    '温和': '😌',
+    '谨慎': '😟',
+    '直率': '😀',
+    '平静': '😐',
+    '神圣': '😇',
+    '欢快': '😄',
+    '轻松': '😎',
+    '专注': '🤔',
+    '冷静': '😐',
+    '灵活': '🤨',
+    '严肃': '😠',
+    '沉思': '🧐',
+    '警惕': '😨',
+    '阴郁': '😔',
+    '疯狂': '😈',
+    '自豪': '😏',
+    '傲慢': '😒',
+    '自信': '😎',
+    '豪放': '🤠',
+    '狂野': '😜',
+    '麻木': '😶'
+})
+
+# 心情 -> 对话前缀
+MOOD_PREFIXES = MappingProxyType({
+    '正常': '',
+    '积极': '今天心情真好！',
+    '温和': '慢慢来，',
+    '谨慎': '小心点，',
+    '直率': '说实话，',
+    '平静': '静静地，',
+    '神圣': '愿神保佑你，',
+    '欢快': '哈哈！',
+    '轻松': '放松点，',
+    '专注': '认真地说，',
+    '冷静': '冷静地，',
+    '灵活': '灵活点，',
+    '严肃': '严肃地说，',
+    '沉思': '思考着，',
+    '警惕': '小心！',
+    '阴郁': '唉...',
+    '疯狂': '哈哈哈哈！',
+    '自豪': '骄傲地，',
+    '傲慢': '哼，',
+    '自信': '自信地，',
+    '豪放': '痛快！',
+    '狂野': '桀桀桀！',
+    '麻木': ''
+})
+
+# 性格 -> 可能的心情变化
+MOOD_CHANGES = MappingProxyType({
+    '慈祥': ('正常', '积极', '温和'),
+    '豪爽': ('积极', '直率', '欢快'),
+    '细心': ('温和', '谨慎', '平静'),
+    '精明': ('谨慎', '灵活', '自信'),
+    '粗犷': ('直率', '豪放', '积极'),
+    '神秘': ('平静', '沉思', '谨慎'),
+    '虔诚': ('神圣', '平静', '温和'),
+    '热情': ('欢快', '积极', '轻松'),
+    '悠闲': ('轻松', '平静', '温和'),
+    '敏锐': ('专注', '警惕', '冷静'),
+    '专业': ('冷静', '专注', '严肃'),
+    '博学': ('专注', '沉思', '平静'),
+    '圆滑': ('灵活', '自信', '谨慎'),
+    '忠诚': ('严肃', '警惕', '正常'),
+    '优雅': ('平静', '温和', '正常'),
+    '野性': ('豪放', '狂野', '专注'),
+    '坚韧': ('严肃', '冷静', '正常'),
+    '孤独': ('沉思', '平静', '阴郁'),
+    '果断': ('直率', '自信', '严肃'),
+    '狡猾': ('警惕', '灵活', '谨慎'),
+    '麻木': ('麻木',),
+    '荣耀': ('自豪', '严肃', '正常'),
+    '傲慢': ('傲慢', '自信', '严肃'),
+    '勇敢': ('豪放', '积极', '直率')
+})
+
+# NPC类型 -> 精灵文件名
+SPRITE_FILES = MappingProxyType({
+    '村长': '村长.png',
+    '武器商': '武器商.png',
+    '药店老板': '药店老板.png',
+    '防具商': 'shop_npc.png',
+    '铁匠': 'shop_npc.png',
+    '法师': 'shop_npc.png',
+    '牧师': 'shop_npc.png',
+    '精灵': 'shop_npc.png',
+    '德鲁伊': 'shop_npc.png',
+    '猎人': 'shop_npc.png',
+    '樵夫': 'shop_npc.png',
+    '隐士': 'shop_npc.png',
+    '商队首领': 'shop_npc.png',
+    '向导': 'shop_npc.png',
+    '绿洲守卫': 'shop_npc.png',
+    '沙漠商人': 'shop_npc.png',
+    '游牧民': 'shop_npc.png',
+    '守卫': 'shop_npc.png',
+    '狱卒': 'shop_npc.png',
+    '盗贼': 'shop_npc.png',
+    '骷髅兵': 'shop_npc.png'
+})
+
+# NPC精灵目录
+NPC_SPRITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets', 'sprites', 'npc')
+
+
+class NPCProfile:
+    """NPC类型的静态数据（性格、背景、技能、初始心情、日常行为、上下文对话）
+
+    同一地图类型、同一NPC类型的所有NPC共享一份，创建后不可修改。
+    """
+
+    __slots__ = ('personality', 'background', 'skills', 'mood', 'daily_routine', 'contextual_dialogue')
+
+    def __init__(self, personality, background, skills, mood, daily_routine, contextual_dialogue):
+        """创建NPC类型数据"""
+        object.__setattr__(self, 'personality', personality)
+        object.__setattr__(self, 'background', background)
+        object.__setattr__(self, 'skills', tuple(skills))
+        object.__setattr__(self, 'mood', mood)
+        object.__setattr__(self, 'daily_routine', tuple(daily_routine))
+        object.__setattr__(self, 'contextual_dialogue', MappingProxyType(dict(contextual_dialogue)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"NPCProfile是只读的，不能修改{name}")
+
+
+# (NPC类, NPC类型) -> NPCProfile
+_profiles = {}
+# (NPC类型, 名称) -> 精灵Surface（没有素材时为None）
+_sprites = {}
+
 
 class BaseNPC:
-    """基础NPC类"""
+    """基础NPC类
+    
+    性格、对话等按类型确定的静态数据保存在共享的NPCProfile中（由类属性中的表生成），
+    实例只用__slots__保存位置、心情、互动记录等可变数据。
+    """
+    
+    __slots__ = ('name', 'x', 'y', 'dialogue', 'has_shop', 'map_type', 'npc_type', 'function', 'profile',
+                 'level', 'mood', 'relationships', 'memories', 'dialogue_history', 'current_dialogue_index',
+                 'shop_items', 'sprite', 'activity_area', 'associated_building')
+    
+    # 个性化属性：NPC类型 -> (性格, 背景, 技能, 心情)，子类覆盖
+    PERSONALITIES = MappingProxyType({})
+    DEFAULT_PERSONALITY = ("友好", "普通村民", (), "正常")
+    
+    # 日常行为：NPC类型 -> 行为列表，子类覆盖
+    ROUTINES = MappingProxyType({})
+    DEFAULT_ROUTINE = ('早晨活动', '中午休息', '下午活动', '晚上休息')
+    
+    # 上下文对话：NPC类型 -> {场景: 对话}，子类覆盖
+    DIALOGUES = MappingProxyType({})
+    DEFAULT_DIALOGUE = MappingProxyType({
+        'greeting': '你好，旅行者。',
+        'quest': '我需要你的帮助。',
+        'farewell': '再见，祝你好运！',
+        'happy': '今天真是个好日子！',
+        'sad': '今天有点难过。',
+        'angry': '我很生气！'
+    })
     
     def __init__(self, name, x, y, dialogue, has_shop=False, map_type='村庄', npc_type='普通', function=None):
         """初始化NPC"""
@@ -16,27 +212,19 @@ class BaseNPC:
         self.function = function  # NPC功能类型
         
         # 个性化属性
-        self.personality = "友好"  # 性格
-        self.background = "普通村民"  # 背景故事
+        self.profile = self.get_profile(npc_type)
         self.level = 1  # 等级
-        self.skills = []  # 技能
-        self.mood = "正常"  # 心情
+        self.mood = self.profile.mood  # 心情
         self.relationships = {}  # 与玩家的关系
         self.memories = []  # 与玩家的互动记忆
-        self.daily_routine = []  # 日常行为
         
         # 多轮对话系统
         self.dialogue_history = []
         self.current_dialogue_index = 0
-        self.contextual_dialogue = []  # 上下文相关对话
         
         # 商店物品
         self.shop_items = []
         
-        # 精灵素材
-        self.sprites = {}
-        self.use_default_sprites = True
-        
         # 活动区域
         self.activity_area = None
         self.associated_building = None
@@ -44,17 +232,30 @@ class BaseNPC:
         # 初始化商店物品
         self._initialize_shop_items()
         
-        # 设置个性化属性
-        self._set_personal_attributes()
-        
-        # 初始化日常行为
-        self._initialize_daily_routine()
-        
-        # 初始化上下文对话
-        self._initialize_contextual_dialogue()
-        
-        # 加载精灵素材
-        self.load_sprites()
+        # 精灵素材在首次使用时加载（可以在后台线程创建NPC，素材留给主线程加载）
+        self.sprite = False
+    
+    @classmethod
+    def get_profile(cls, npc_type):
+        """获取NPC类型的共享数据（每个NPC类和类型只生成一次）"""
+        key = (cls, npc_type)
+        profile = _profiles.get(key)
+        if profile is None:
+            personality, background, skills, mood = cls.PERSONALITIES.get(npc_type, cls.DEFAULT_PERSONALITY)
+            profile = _profiles[key] = NPCProfile(
+                personality, background, skills, mood,
+                cls.ROUTINES.get(npc_type, cls.DEFAULT_ROUTINE),
+                cls.DIALOGUES.get(npc_type, cls.DEFAULT_DIALOGUE)
+            )
+        return profile
+    
+    # 类型的静态数据（只读）
+    personality = property(lambda self: self.profile.personality)  # 性格
+    background = property(lambda self: self.profile.background)  # 背景故事
+    skills = property(lambda self: self.profile.skills)  # 技能
+    daily_routine = property(lambda self: self.profile.daily_routine)  # 日常行为
+    contextual_dialogue = property(lambda self: self.profile.contextual_dialogue)  # 上下文相关对话
+    use_default_sprites = property(lambda self: self.get_sprite() is None)
     
     def set_activity_area(self, area):
         """设置活动区域"""
@@ -75,91 +276,46 @@ class BaseNPC:
         """初始化商店物品"""
         pass
     
-    def _set_personal_attributes(self):
-        """设置个性化属性"""
-        pass
-    
-    def _initialize_daily_routine(self):
-        """初始化日常行为"""
-        self.daily_routine = ['早晨活动', '中午休息', '下午活动', '晚上休息']
-    
-    def _initialize_contextual_dialogue(self):
-        """初始化上下文对话"""
-        self.contextual_dialogue = {
-            'greeting': '你好，旅行者。',
-            'quest': '我需要你的帮助。',
-            'farewell': '再见，祝你好运！',
-            'happy': '今天真是个好日子！',
-            'sad': '今天有点难过。',
-            'angry': '我很生气！'
-        }
-    
     def load_sprites(self):
-        """加载精灵素材"""
+        """加载精灵素材（同类型、同名称的NPC只查找和加载一次）"""
+        key = (self.npc_type, self.name)
+        if key in _sprites:
+            self.sprite = _sprites[key]
+            return
         # 尝试加载图片，失败则使用默认颜色
         try:
-            base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'assets')
-            self.sprites = {}
-            
-            # 首先尝试根据NPC类型加载对应的精灵
-            type_to_filename = {
-                '村长': '村长.png',
-                '武器商': '武器商.png',
-                '药店老板': '药店老板.png',
-                '防具商': 'shop_npc.png',
-                '铁匠': 'shop_npc.png',
-                '法师': 'shop_npc.png',
-                '牧师': 'shop_npc.png',
-                '精灵': 'shop_npc.png',
-                '德鲁伊': 'shop_npc.png',
-                '猎人': 'shop_npc.png',
-                '樵夫': 'shop_npc.png',
-                '隐士': 'shop_npc.png',
-                '商队首领': 'shop_npc.png',
-                '向导': 'shop_npc.png',
-                '绿洲守卫': 'shop_npc.png',
-                '沙漠商人': 'shop_npc.png',
-                '游牧民': 'shop_npc.png',
-                '守卫': 'shop_npc.png',
-                '狱卒': 'shop_npc.png',
-                '盗贼': 'shop_npc.png',
-                '骷髅兵': 'shop_npc.png'
-            }
-            
             npc_sprite_path = None
             
-            # 尝试根据NPC类型加载
-            if self.npc_type in type_to_filename:
-                npc_sprite_path = os.path.join(base_path, f"sprites/npc/{type_to_filename[self.npc_type]}")
+            # 首先尝试根据NPC类型加载对应的精灵
+            if self.npc_type in SPRITE_FILES:
+                npc_sprite_path = os.path.join(NPC_SPRITE_DIR, SPRITE_FILES[self.npc_type])
             
             # 如果根据类型加载失败，尝试根据NPC名称加载
             if not npc_sprite_path or not os.path.exists(npc_sprite_path):
-                npc_sprite_path = os.path.join(base_path, f"sprites/npc/{self.name}.png")
+                npc_sprite_path = os.path.join(NPC_SPRITE_DIR, f"{self.name}.png")
             
             # 最后尝试使用默认的shop_npc.png
             if not os.path.exists(npc_sprite_path):
-                npc_sprite_path = os.path.join(base_path, "sprites/npc/shop_npc.png")
+                npc_sprite_path = os.path.join(NPC_SPRITE_DIR, "shop_npc.png")
             
-            if os.path.exists(npc_sprite_path):
-                self.sprites['default'] = pygame.image.load(npc_sprite_path).convert_alpha()
-                # 缩放精灵到合适大小
-                self.sprites['default'] = pygame.transform.scale(self.sprites['default'], (32, 32))
-                self.use_default_sprites = False
-            else:
-                # 对于其他NPC，使用默认的渲染
-                self.sprites['default'] = None
-                self.use_default_sprites = True
-                print(f"未找到NPC素材: {npc_sprite_path}")
+            # 缩放精灵到合适大小（同一素材只加载一次），没有素材时使用默认的渲染
+            self.sprite = asset_cache.get_image(npc_sprite_path, (32, 32))
         except Exception as e:
             print(f"加载NPC精灵失败: {e}")
-            self.use_default_sprites = True
-            self.sprites = {'default': None}
+            self.sprite = None
+        _sprites[key] = self.sprite
+    
+    def get_sprite(self):
+        """精灵图片（首次使用时加载，没有素材时为None）"""
+        if self.sprite is False:
+            self.load_sprites()
+        return self.sprite
     
     def render(self, screen):
         """渲染NPC"""
-        if not self.use_default_sprites and self.sprites.get('default'):
+        sprite = self.get_sprite()
+        if sprite is not None:
             # 使用加载的精灵图片
-            sprite = self.sprites['default']
             screen.blit(sprite, (self.x, self.y))
             # 使用白色文字以确保在图片背景上清晰可见
             text_color = (255, 255, 255)
@@ -168,33 +324,7 @@ class BaseNPC:
             base_color = (255, 255, 0)  # 黄色
             
             # 根据心情调整颜色亮度
-            mood_brightness = {
-                '正常': 1.0,
-                '积极': 1.2,
-                '温和': 0.9,
-                '谨慎': 0.8,
-                '直率': 1.1,
-                '平静': 0.9,
-                '神圣': 1.3,
-                '欢快': 1.2,
-                '轻松': 1.0,
-                '专注': 0.8,
-                '冷静': 0.9,
-                '灵活': 1.0,
-                '严肃': 0.8,
-                '沉思': 0.7,
-                '警惕': 1.1,
-                '阴郁': 0.6,
-                '疯狂': 1.3,
-                '自豪': 1.2,
-                '傲慢': 1.1,
-                '自信': 1.1,
-                '豪放': 1.2,
-                '狂野': 1.3,
-                '麻木': 0.5
-            }
-            
-            brightness = mood_brightness.get(self.mood, 1.0)
+            brightness = MOOD_BRIGHTNESS.get(self.mood, 1.0)
             # 调整颜色亮度
             color = tuple(min(255, int(c * brightness)) for c in base_color)
             
@@ -207,26 +337,15 @@ class BaseNPC:
                 text_color = (0, 0, 0)  # 深色背景用黑色文字
         
         # 绘制NPC名字
-        try:
-            font = pygame.font.SysFont('hiraginosansgb', 12)
-        except:
-            try:
-                font = pygame.font.SysFont('songti', 12)
-            except:
-                try:
-                    font = pygame.font.SysFont('arialunicode', 12)
-                except:
-                    font = pygame.font.Font(None, 12)
-        
-        text = font.render(self.name, True, text_color)
+        text = font_cache.render(self.name, text_color, 12)
         screen.blit(text, (self.x + 8, self.y - 15))
         
         # 绘制NPC类型
-        type_text = font.render(self.npc_type, True, (200, 200, 200))
+        type_text = font_cache.render(self.npc_type, (200, 200, 200), 12)
         screen.blit(type_text, (self.x + 8, self.y + 35))
         
         # 绘制NPC个性
-        personality_text = font.render(self.personality, True, (150, 150, 150))
+        personality_text = font_cache.render(self.personality, (150, 150, 150), 12)
         screen.blit(personality_text, (self.x + 8, self.y + 50))
         
         # 绘制心情指示器
@@ -235,35 +354,9 @@ class BaseNPC:
     def _draw_mood_indicator(self, screen):
         """绘制心情指示器"""
         # 根据心情绘制不同的指示器
-        mood_indicators = {
-            '积极': '😊',
-            '温和': '😌',
-            '谨慎': '😟',
-            '直率': '😀',
-            '平静': '😐',
-            '神圣': '😇',
-            '欢快': '😄',
-            '轻松': '😎',
-            '专注': '🤔',
-            '冷静': '😐',
-            '灵活': '🤨',
-            '严肃': '😠',
-            '沉思': '🧐',
-            '警惕': '😨',
-            '阴郁': '😔',
-            '疯狂': '😈',
-            '自豪': '😏',
-            '傲慢': '😒',
-            '自信': '😎',
-            '豪放': '🤠',
-            '狂野': '😜',
-            '麻木': '😶'
-        }
-        
-        indicator = mood_indicators.get(self.mood, '😐')
+        indicator = MOOD_INDICATORS.get(self.mood, '😐')
         # 绘制心情指示器
-        font = pygame.font.Font(None, 16)
-        text = font.render(indicator, True, (255, 255, 255))
+        text = font_cache.render(indicator, (255, 255, 255), 16, font_cache.DEFAULT)
         screen.blit(text, (self.x + 20, self.y - 15))
     
     def get_dialogue(self):
@@ -358,64 +451,12 @@ class BaseNPC:
     
     def _get_mood_dialogue(self):
         """根据心情生成对话前缀"""
-        mood_prefixes = {
-            '正常': '',
-            '积极': '今天心情真好！',
-            '温和': '慢慢来，',
-            '谨慎': '小心点，',
-            '直率': '说实话，',
-            '平静': '静静地，',
-            '神圣': '愿神保佑你，',
-            '欢快': '哈哈！',
-            '轻松': '放松点，',
-            '专注': '认真地说，',
-            '冷静': '冷静地，',
-            '灵活': '灵活点，',
-            '严肃': '严肃地说，',
-            '沉思': '思考着，',
-            '警惕': '小心！',
-            '阴郁': '唉...',
-            '疯狂': '哈哈哈哈！',
-            '自豪': '骄傲地，',
-            '傲慢': '哼，',
-            '自信': '自信地，',
-            '豪放': '痛快！',
-            '狂野': '桀桀桀！',
-            '麻木': ''
-        }
-        return mood_prefixes.get(self.mood, '')
+        return MOOD_PREFIXES.get(self.mood, '')
     
     def _update_mood(self):
         """随机更新NPC心情"""
         # 基于性格的心情变化
-        mood_changes = {
-            '慈祥': ['正常', '积极', '温和'],
-            '豪爽': ['积极', '直率', '欢快'],
-            '细心': ['温和', '谨慎', '平静'],
-            '精明': ['谨慎', '灵活', '自信'],
-            '粗犷': ['直率', '豪放', '积极'],
-            '神秘': ['平静', '沉思', '谨慎'],
-            '虔诚': ['神圣', '平静', '温和'],
-            '热情': ['欢快', '积极', '轻松'],
-            '悠闲': ['轻松', '平静', '温和'],
-            '敏锐': ['专注', '警惕', '冷静'],
-            '专业': ['冷静', '专注', '严肃'],
-            '博学': ['专注', '沉思', '平静'],
-            '圆滑': ['灵活', '自信', '谨慎'],
-            '忠诚': ['严肃', '警惕', '正常'],
-            '优雅': ['平静', '温和', '正常'],
-            '野性': ['豪放', '狂野', '专注'],
-            '坚韧': ['严肃', '冷静', '正常'],
-            '孤独': ['沉思', '平静', '阴郁'],
-            '果断': ['直率', '自信', '严肃'],
-            '狡猾': ['警惕', '灵活', '谨慎'],
-            '麻木': ['麻木'],
-            '荣耀': ['自豪', '严肃', '正常'],
-            '傲慢': ['傲慢', '自信', '严肃'],
-            '勇敢': ['豪放', '积极', '直率']
-        }
-        
-        possible_moods = mood_changes.get(self.personality, ['正常'])
+        possible_moods = MOOD_CHANGES.get(self.personality, ('正常',))
         if possible_moods:
             self.mood = possible_moods[0] if len(possible_moods) == 1 else possible_moods[len(self.dialogue_history) % len(possible_moods)]
     
@@ -3,6 +3,10 @@ import math
 from src.items.item import ItemManager
 from src.items.equipment import EquipmentManager
 from src.entities.professions import ProfessionFactory
+from src.core.clock import game_clock
+from src.systems.font_cache import font_cache
+from src.systems.asset_cache import asset_cache
+from src.systems.sound_synth import sound_synth
 
 
 class Player:
@@ -183,15 +187,13 @@ class Player:
             # 加载实际的图片文件
             import os
             base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
-            self.sprites = {
-                "up": pygame.image.load(os.path.join(base_path, "sprites/player/player_up.png")),
-                "down": pygame.image.load(os.path.join(base_path, "sprites/player/player_down.png")),
-                "left": pygame.image.load(os.path.join(base_path, "sprites/player/player_left.png")),
-                "right": pygame.image.load(os.path.join(base_path, "sprites/player/player_right.png"))
-            }
             # 缩放到合适的游戏尺寸（48x72，符合盛大传奇风格）
-            for key in self.sprites:
-                self.sprites[key] = pygame.transform.scale(self.sprites[key], (48, 72))
+            self.sprites = {}
+            for direction in ["up", "down", "left", "right"]:
+                sprite = asset_cache.get_image(os.path.join(base_path, f"sprites/player/player_{direction}.png"), (48, 72))
+                if sprite is None:
+                    raise FileNotFoundError(f"player_{direction}.png")
+                self.sprites[direction] = sprite
             self.use_default_sprites = False
         except Exception as e:
             print(f"加载精灵失败: {e}")
@@ -372,17 +374,7 @@ class Player:
                 screen.blit(sprite, (screen_x, screen_y))
         
         # 绘制玩家名字（盛大传奇风格，白色）
-        try:
-            font = pygame.font.SysFont("hiraginosansgb", 12)
-        except:
-            try:
-                font = pygame.font.SysFont("songti", 12)
-            except:
-                try:
-                    font = pygame.font.SysFont("arialunicode", 12)
-                except:
-                    font = pygame.font.Font(None, 12)
-        text = font.render(self.name, True, (255, 255, 255))
+        text = font_cache.render(self.name, (255, 255, 255), 12)
         screen.blit(text, (screen_x + 8, screen_y - 15))
         
         # 绘制血条（盛大传奇风格，立体血条）
@@ -680,94 +672,15 @@ class Player:
         """使用技能"""
         try:
             import pygame
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             
             # 触发攻击动画
             self.is_attacking = True
             self.attack_frame = 0
             
-            # 播放技能使用声音
+            # 播放技能使用声音（波形已预先合成并缓存）
             if hasattr(self, 'game'):
-                try:
-                    import numpy as np
-                    sample_rate = 44100
-                    
-                    # 根据职业生成不同的技能使用声音
-                    if self.职业 == "战士":
-                        # 战士技能：强力的刀剑声音
-                        duration = 0.4
-                        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                        # 主频率
-                        frequency1 = 165  # E3音符
-                        # 泛音
-                        frequency2 = 330  # E4音符
-                        frequency3 = 495  # B4音符
-                        # 生成复合波形
-                        waveform1 = 0.5 * np.sin(2 * np.pi * frequency1 * t)
-                        waveform2 = 0.25 * np.sin(2 * np.pi * frequency2 * t)
-                        waveform3 = 0.1 * np.sin(2 * np.pi * frequency3 * t)
-                        # 添加攻击和衰减
-                        envelope = np.zeros_like(t)
-                        attack_time = int(sample_rate * 0.1)
-                        sustain_time = int(sample_rate * 0.1)
-                        release_time = int(sample_rate * 0.2)
-                        envelope[:attack_time] = np.linspace(0, 1, attack_time)
-                        envelope[attack_time:attack_time+sustain_time] = 1
-                        envelope[attack_time+sustain_time:attack_time+sustain_time+release_time] = np.linspace(1, 0, release_time)
-                        waveform = (waveform1 + waveform2 + waveform3) * envelope
-                    elif self.职业 == "法师":
-                        # 法师技能：魔法声音
-                        duration = 0.5
-                        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                        # 魔法声音：复杂波形
-                        frequency = 1320  # E6音符
-                        # 添加颤音和变化
-                        vibrato_frequency = 3  # 3Hz颤音
-                        vibrato_amplitude = 0.1
-                        # 添加上升频率
-                        frequency_modulation = frequency * (1 + 0.2 * t / duration)
-                        waveform = 0.3 * np.sin(2 * np.pi * frequency_modulation * t + vibrato_amplitude * np.sin(2 * np.pi * vibrato_frequency * t))
-                        # 添加上升和下降
-                        envelope = np.zeros_like(t)
-                        attack_time = int(sample_rate * 0.15)
-                        release_time = int(sample_rate * 0.35)
-                        envelope[:attack_time] = np.linspace(0, 1, attack_time)
-                        envelope[attack_time:attack_time+release_time] = np.linspace(1, 0, release_time)
-                        waveform *= envelope
-                    elif self.职业 == "道士":
-                        # 道士技能：符咒声音
-                        duration = 0.45
-                        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                        # 符咒声音：脉冲波 + 共鸣
-                        frequency = 660  # E5音符
-                        # 生成脉冲波
-                        pulse_wave = 0.3 * np.sign(np.sin(2 * np.pi * frequency * t))
-                        # 添加共鸣
-                        resonance_frequency = 220  # A3音符
-                        resonance = 0.1 * np.sin(2 * np.pi * resonance_frequency * t)
-                        waveform = pulse_wave + resonance
-                        # 添加衰减
-                        envelope = np.exp(-3 * t / duration)
-                        waveform *= envelope
-                    else:
-                        # 默认技能声音
-                        duration = 0.3
-                        frequency = 440  # A4音符
-                        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                        waveform = 0.4 * np.sin(2 * np.pi * frequency * t)
-                        envelope = np.exp(-4 * t / duration)
-                        waveform *= envelope
-                    
-                    # 转换为16位整数
-                    waveform = np.int16(waveform * 32767)
-                    
-                    # 创建声音对象
-                    sound = pygame.mixer.Sound(waveform)
-                    sound.set_volume(0.4)
-                    sound.play()
-                except:
-                    # 如果声音创建失败，忽略错误
-                    pass
+                sound_synth.play('skill', self.职业)
             
             # 检查技能是否已学习
             if skill_name not in self.learned_skills:
@@ -1144,75 +1057,8 @@ class Player:
         self.is_attacking = True
         self.attack_frame = 0
         
-        # 播放攻击声音
-        try:
-            import pygame
-            import numpy as np
-            sample_rate = 44100
-            
-            # 根据职业和攻击类型生成不同的声音
-            if self.职业 == "战士":
-                # 战士：物理攻击，刀剑声音
-                duration = 0.2
-                # 生成刀剑攻击的复合声音
-                t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                # 主频率
-                frequency1 = 220  # A3音符
-                # 泛音
-                frequency2 = 440  # A4音符
-                frequency3 = 660  # E5音符
-                # 生成复合波形
-                waveform1 = 0.4 * np.sin(2 * np.pi * frequency1 * t)
-                waveform2 = 0.2 * np.sin(2 * np.pi * frequency2 * t)
-                waveform3 = 0.1 * np.sin(2 * np.pi * frequency3 * t)
-                # 添加衰减
-                envelope = np.exp(-5 * t / duration)
-                waveform = (waveform1 + waveform2 + waveform3) * envelope
-            elif self.职业 == "法师":
-                # 法师：魔法攻击，魔法声音
-                duration = 0.3
-                t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                # 魔法声音：正弦波 + 颤音
-                frequency = 880  # A5音符
-                # 添加颤音
-                vibrato_frequency = 5  # 5Hz颤音
-                vibrato_amplitude = 0.05
-                waveform = 0.3 * np.sin(2 * np.pi * frequency * t + vibrato_amplitude * np.sin(2 * np.pi * vibrato_frequency * t))
-                # 添加上升和下降
-                envelope = np.zeros_like(t)
-                attack_time = int(sample_rate * 0.1)
-                release_time = int(sample_rate * 0.2)
-                envelope[:attack_time] = np.linspace(0, 1, attack_time)
-                envelope[attack_time:attack_time+release_time] = np.linspace(1, 0, release_time)
-                waveform *= envelope
-            elif self.职业 == "道士":
-                # 道士：道术攻击，符咒声音
-                duration = 0.25
-                t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                # 符咒声音：脉冲波
-                frequency = 554  # C5音符
-                # 生成脉冲波
-                waveform = 0.3 * np.sign(np.sin(2 * np.pi * frequency * t))
-                # 添加衰减
-                envelope = np.exp(-4 * t / duration)
-                waveform *= envelope
-            else:
-                # 默认声音
-                duration = 0.15
-                frequency = 330  # E4音符
-                t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-                waveform = 0.5 * np.sin(2 * np.pi * frequency * t)
-            
-            # 转换为16位整数
-            waveform = np.int16(waveform * 32767)
-            
-            # 创建声音对象
-            sound = pygame.mixer.Sound(waveform)
-            sound.set_volume(0.3)
-            sound.play()
-        except:
-            # 如果声音创建失败，忽略错误
-            pass
+        # 播放攻击声音（波形已预先合成并缓存）
+        sound_synth.play('attack', self.职业)
         
         # 计算攻击范围
         if self.职业 == "法师":
@@ -1,28 +1,135 @@
-import pygame
 import sys
 import os
+import argparse
 
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.game import Game
+# 启动追踪最先导入，计时从这里开始
+from src.systems.startup_tracer import startup_tracer
 
+with startup_tracer.phase('import pygame'):
+    import pygame
 
-def main():
-    """主函数"""
-    # 初始化游戏
-    game = Game()
+
+# 每帧最多追赶的逻辑帧数，避免卡顿后出现“死亡螺旋”
+MAX_CATCH_UP_TICKS = 5
+# 启动到主菜单显示的时间预算（毫秒）
+STARTUP_BUDGET_MS = 1500
+# 启动分析结果默认输出路径
+STARTUP_PROFILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'results', 'startup.json')
+
+
+def import_game():
+    """导入游戏主类（计入启动追踪）"""
+    with startup_tracer.phase('import core.game'):
+        from core.game import Game
+    return Game
+
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="传奇风格游戏")
+    parser.add_argument('--headless', action='store_true',
+                        help='无界面模式：不打开窗口、不渲染，以最快速度推进游戏逻辑')
+    parser.add_argument('--ticks', type=int, default=3600,
+                        help='无界面模式下模拟的逻辑帧数（默认3600，即60秒游戏时间）')
+    parser.add_argument('--monster-arrays', action='store_true',
+                        help='用numpy数组批量更新远处漫游的怪物（怪物数量很多时更快）')
+    parser.add_argument('--profession', default='战士',
+                        help='无界面模式下使用的职业（战士/法师/道士）')
+    parser.add_argument('--profile-startup', nargs='?', const=STARTUP_PROFILE_PATH, metavar='PATH',
+                        help='分析启动耗时：显示主菜单首帧后退出，并把各阶段和模块导入耗时写入JSON'
+                             '（默认benchmarks/results/startup.json）')
+    parser.add_argument('--startup-budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help=f'启动到主菜单显示的时间预算（默认{STARTUP_BUDGET_MS}毫秒），超出时返回非零退出码')
+    return parser.parse_args(argv)
+
+
+def run_headless(args):
+    """无界面模拟：直接进入游戏并推进指定帧数，输出每秒逻辑帧数"""
+    Game = import_game()
+    game = Game(headless=True, monster_arrays=args.monster_arrays)
+    game.start_game(args.profession)
+    
+    ticks_per_sec = game.step(args.ticks)
+    sim_seconds = args.ticks * game.tick_ms / 1000.0
+    print(f"Simulated {args.ticks} ticks ({sim_seconds:.1f}s game time) at {ticks_per_sec:.1f} ticks/sec")
+    
+    pygame.quit()
+
+
+def run_windowed():
+    """窗口模式：固定步长更新逻辑，渲染频率与逻辑解耦"""
+    Game = import_game()
+    with startup_tracer.phase('Game.__init__'):
+        game = Game()
+    accumulator = 0.0
     
     # 游戏主循环
     while game.running:
         game.handle_events()
-        game.update()
+        
+        # 按固定步长推进逻辑，渲染慢时补帧，渲染快时不多跑逻辑
+        accumulator += game.clock.tick(game.fps)
+        ticks = 0
+        while accumulator >= game.tick_ms and ticks < MAX_CATCH_UP_TICKS:
+            game.update()
+            accumulator -= game.tick_ms
+            ticks += 1
+        if ticks == MAX_CATCH_UP_TICKS:
+            accumulator = 0.0
+        
         game.render()
+        if not startup_tracer.marks:
+            startup_tracer.mark('menu_visible')
     
     # 退出游戏
     pygame.quit()
+
+
+def profile_startup(args):
+    """启动耗时分析：初始化游戏并显示主菜单首帧后退出
+    
+    Returns:
+        int: 退出码，主菜单显示时间超出预算时为1
+    """
+    startup_tracer.enable_import_timing()
+    try:
+        Game = import_game()
+    finally:
+        startup_tracer.disable_import_timing()
+    with startup_tracer.phase('Game.__init__'):
+        game = Game()
+    with startup_tracer.phase('first menu frame'):
+        game.handle_events()
+        game.render()
+    startup_tracer.mark('menu_visible')
+    
+    print(startup_tracer.report())
+    startup_tracer.write_json(args.profile_startup)
+    print(f"Startup profile written to {args.profile_startup}")
+    pygame.quit()
+    
+    menu_ms = startup_tracer.get_mark('menu_visible')
+    if menu_ms > args.startup_budget_ms:
+        print(f"Menu visible after {menu_ms:.0f}ms, over budget of {args.startup_budget_ms:.0f}ms")
+        return 1
+    print(f"Menu visible after {menu_ms:.0f}ms (budget {args.startup_budget_ms:.0f}ms)")
+    return 0
+
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    if args.profile_startup:
+        sys.exit(profile_startup(args))
+    if args.headless:
+        run_headless(args)
+    else:
+        run_windowed()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
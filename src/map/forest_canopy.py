@@ -0,0 +1,97 @@
+import random
+
+import pygame
+
+
+class ForestCanopy:
+    """森林装饰树木
+
+    用固定种子生成若干种树木外观，一次性烘焙成精灵；每棵树在生成时分配外观，
+    并按网格分桶，渲染时直接取出视野内的树木列表blit，画面每帧完全一致。
+    """
+
+    # 精灵尺寸与锚点（树根位置在精灵中的坐标）
+    SPRITE_WIDTH = 104
+    SPRITE_HEIGHT = 124
+    ANCHOR_X = 52
+    ANCHOR_Y = 102
+
+    def __init__(self, positions, seed, variants=6, cell_size=512):
+        """初始化森林树木
+
+        Args:
+            positions: 树根的世界坐标列表 [(x, y), ...]
+            seed: 随机种子（同一地图每次生成相同的树木）
+            variants: 烘焙的外观种类数
+            cell_size: 可见性分桶的网格大小
+        """
+        self.cell_size = cell_size
+        rng = random.Random(seed)
+
+        # 烘焙树木外观
+        self.sprites = [self._bake_tree(rng) for _ in range(variants)]
+
+        # 分配外观并按网格分桶（每个桶内保持原有绘制顺序）
+        self.cells = {}
+        for x, y in positions:
+            sprite = self.sprites[rng.randrange(variants)]
+            left = x - self.ANCHOR_X
+            top = y - self.ANCHOR_Y
+            key = (x // cell_size, y // cell_size)
+            self.cells.setdefault(key, []).append((sprite, left, top))
+
+        # 可见列表缓存：视野覆盖的网格范围不变时直接复用
+        self._visible_key = None
+        self._visible = []
+
+    def _bake_tree(self, rng):
+        """烘焙一种树木外观"""
+        sprite = pygame.Surface((self.SPRITE_WIDTH, self.SPRITE_HEIGHT), pygame.SRCALPHA)
+        x, y = self.ANCHOR_X, self.ANCHOR_Y
+
+        # 更真实的树干
+        trunk_color = (100, 60, 20)
+        pygame.draw.rect(sprite, trunk_color, (x - 12, y - 40, 24, 60))
+        # 添加树干纹理
+        for i in range(0, 60, 8):
+            texture_color = (90, 50, 15)
+            pygame.draw.line(sprite, texture_color, (x - 12, y - 40 + i), (x + 11, y - 40 + i), 2)
+        # 更真实的树叶
+        leaf_color = (40, 90, 50)
+        pygame.draw.circle(sprite, leaf_color, (x, y - 50), 40)
+        # 添加树叶细节
+        for i in range(8):
+            detail_color = (30, 80, 40)
+            detail_radius = rng.randint(12, 20)
+            offset_x = rng.randint(-30, 30)
+            offset_y = rng.randint(-30, 30)
+            pygame.draw.circle(sprite, detail_color, (x + offset_x, y - 50 + offset_y), detail_radius)
+
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    def get_visible(self, camera_x, camera_y, view_width, view_height):
+        """获取视野内（含精灵外扩范围）的树木列表 [(sprite, left, top), ...]"""
+        size = self.cell_size
+        # 树根在视野外但精灵仍可能露出的范围
+        first_x = (camera_x - self.SPRITE_WIDTH) // size
+        last_x = (camera_x + view_width + self.SPRITE_WIDTH) // size
+        first_y = (camera_y - self.SPRITE_HEIGHT) // size
+        last_y = (camera_y + view_height + self.SPRITE_HEIGHT) // size
+        key = (first_x, last_x, first_y, last_y)
+
+        if key != self._visible_key:
+            visible = []
+            for cell_x in range(first_x, last_x + 1):
+                for cell_y in range(first_y, last_y + 1):
+                    visible.extend(self.cells.get((cell_x, cell_y), ()))
+            self._visible_key = key
+            self._visible = visible
+        return self._visible
+
+    def render(self, screen, camera_x, camera_y):
+        """绘制视野内的树木"""
+        view_width, view_height = screen.get_size()
+        for sprite, left, top in self.get_visible(camera_x, camera_y, view_width, view_height):
+            screen.blit(sprite, (left - camera_x, top - camera_y))
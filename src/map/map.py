@@ -3,15 +3,43 @@ import random
 import os
 import math
 
-from src.entities.monster import Monster
+from src.entities.monsters.pool import monster_pool
 from src.entities.npc import create_npc
+from src.systems.profiler import profiler
+from src.systems.font_cache import font_cache
+from src.systems.asset_cache import asset_cache
+from src.map.tile_cache import ChunkedLayerCache
+from src.map.forest_canopy import ForestCanopy
+from src.map.spatial_hash import SpatialHash
+from src.map.terrain_index import TerrainCollisionIndex
+from src.map.simulation_lod import SimulationLOD
+
+
+# 中央大道左边缘的世界坐标
+ROAD_X = 350
+# 空间索引网格大小
+SPATIAL_CELL_SIZE = 128
+# 怪物数量上限与每帧刷新概率
+MAX_MONSTERS = 15
+MONSTER_SPAWN_CHANCE = 0.01
+# 空间查询的外扩余量（覆盖怪物尺寸，最大的Boss为48像素）
+MONSTER_QUERY_MARGIN = 48
 
 
 class Map:
     """地图类"""
     
-    def __init__(self, map_id=1, scene_type='村庄', game=None):
-        """初始化地图"""
+    def __init__(self, map_id=1, scene_type='村庄', game=None, rng=None, defer_loading=False):
+        """初始化地图
+        
+        Args:
+            map_id: 地图ID
+            scene_type: 场景类型
+            game: 游戏实例
+            rng: 生成地形布局使用的随机数生成器（random.Random），默认使用全局random
+            defer_loading: 只生成纯数据（出口、地形、NPC、空间索引），创建初始怪物、
+                加载素材和烘焙图像留给主线程调用finish_loading完成，用于后台线程预加载
+        """
         # 地图ID
         self.id = map_id
         # 增大地图尺寸
@@ -24,6 +52,11 @@ class Map:
         # 游戏引用
         self.game = game
         
+        # 地形布局的随机数生成器
+        self.rng = rng if rng is not None else random
+        # 延迟创建的初始怪物刷新点（None表示已在主线程完成加载）
+        self._pending_spawns = [] if defer_loading else None
+        
         # 地图出口（连接到其他地图的位置）
         self.exits = []
         self._initialize_exits()
@@ -41,11 +74,107 @@ class Map:
         self.terrain_elements = []
         self.initialize_terrain()
         
+        # 空间索引（怪物、NPC、地形），用于范围查询和碰撞检测
+        self._initialize_spatial_indexes()
+        
+        # 怪物模拟细节层级调度
+        self.simulation_lod = SimulationLOD(
+            frame_ms=getattr(game, 'tick_ms', 1000 / 60),
+            is_blocked=lambda monster: self.terrain_index.collides(monster.get_collision_rect())
+        )
+        
+        # 可选的数组化怪物存储（批量更新远处漫游的怪物），需要numpy
+        self.monster_store = self._create_monster_store() if getattr(game, 'monster_arrays', False) else None
+        
         # 初始化坐标系统
         self._initialize_coordinate_system()
         
+        # 静态地面层缓存（首次可见时按块烘焙）
+        self.ground_cache = ChunkedLayerCache(self.width, self.height, self._paint_ground, background=self._get_ground_color())
+        
+        self.map_assets = {'terrain': {}, 'objects': {}}
+        self.use_default_assets = True
+        self.forest_canopy = None
+        if not defer_loading:
+            self.finish_loading()
+    
+    @property
+    def loaded(self):
+        """是否已完成主线程部分的加载"""
+        return self._pending_spawns is None
+    
+    def finish_loading(self):
+        """完成需要在主线程进行的加载
+        
+        创建初始怪物（怪物初始化使用全局random）、加载地图素材和精灵、烘焙森林树木，
+        这些操作会访问pygame Surface和共享的素材缓存，不能放在后台线程。
+        """
+        pending = self._pending_spawns
+        if pending is None:
+            return
+        self._pending_spawns = None
+        for spawn in pending:
+            self.add_monster(self._create_initial_monster(spawn))
+        
+        # 预先加载精灵（同类型只加载一次）
+        for monster in self.monsters:
+            monster.monster_type.get_sprite()
+        for npc in self.npcs:
+            npc.get_sprite()
+        
         # 加载地图素材
         self.load_map_assets()
+        
+        # 森林中的装饰树木（固定种子生成，外观预烘焙）
+        self.forest_canopy = ForestCanopy(self._initialize_forest_trees(), seed=self.id) if self.scene_type == '森林' else None
+    
+    def _spawn_initial_monster(self, spawn):
+        """在刷新点生成初始怪物（延迟加载时只记录刷新点，由finish_loading创建）"""
+        if self._pending_spawns is not None:
+            self._pending_spawns.append(spawn)
+        else:
+            self.monsters.append(self._create_initial_monster(spawn))
+    
+    def _create_initial_monster(self, spawn):
+        """按刷新点数据创建怪物"""
+        monster = monster_pool.acquire(spawn['name'], spawn['x'], spawn['y'])
+        # 添加活动区域信息
+        monster.activity_area = spawn['activity_area']
+        return monster
+    
+    def _initialize_spatial_indexes(self):
+        """建立怪物、NPC的空间索引和地形碰撞索引"""
+        self.monster_index = SpatialHash(SPATIAL_CELL_SIZE)
+        for monster in self.monsters:
+            self.monster_index.insert(monster, monster.x, monster.y)
+        
+        self.npc_index = SpatialHash(SPATIAL_CELL_SIZE)
+        for npc in self.npcs:
+            self.npc_index.insert(npc, npc.x, npc.y)
+        
+        # 地形元素不会移动，碰撞盒只在加载时计算一次
+        self.terrain_index = TerrainCollisionIndex(self.terrain_elements)
+    
+    def add_monster(self, monster):
+        """添加怪物到地图并登记到空间索引"""
+        self.monsters.append(monster)
+        self.monster_index.insert(monster, monster.x, monster.y)
+        if self.monster_store is not None:
+            self.monster_store.add(monster)
+        # 预先加载精灵（同类型只加载一次）
+        monster.monster_type.get_sprite()
+    
+    def _create_monster_store(self):
+        """创建数组化怪物存储，numpy不可用时返回None（使用逐个更新）"""
+        try:
+            from src.map.monster_store import MonsterArrayStore
+            store = MonsterArrayStore(self.terrain_index, self.width, self.height, SPATIAL_CELL_SIZE)
+        except ImportError as e:
+            print(f"数组化怪物存储不可用，使用逐个更新: {e}")
+            return None
+        for monster in self.monsters:
+            store.add(monster)
+        return store
     
     def _initialize_coordinate_system(self):
         """初始化地图坐标系统"""
@@ -189,11 +318,11 @@ class Map:
                 
                 if cluster_choices:
                     # 选择一个集群
-                    selected_cluster = random.choices(cluster_choices, weights=cluster_weights_filtered, k=1)[0]
+                    selected_cluster = self.rng.choices(cluster_choices, weights=cluster_weights_filtered, k=1)[0]
                     
                     # 在集群内生成元素位置（使用高斯分布实现自然集群）
-                    angle = random.uniform(0, 2 * math.pi)
-                    distance = random.gauss(0, selected_cluster['radius'] * 0.4)  # 高斯分布，更集中在中心
+                    angle = self.rng.uniform(0, 2 * math.pi)
+                    distance = self.rng.gauss(0, selected_cluster['radius'] * 0.4)  # 高斯分布，更集中在中心
                     distance = min(abs(distance), selected_cluster['radius'])  # 限制在集群半径内
                     
                     x = selected_cluster['center'][0] + int(distance * math.cos(angle))
@@ -349,10 +478,7 @@ class Map:
                     
                     # 只有不在NPC活动区域内的刷新点才生成怪物
                     if not in_npc_area:
-                        monster = Monster(spawn['name'], spawn['x'], spawn['y'])
-                        # 添加活动区域信息
-                        monster.activity_area = spawn['activity_area']
-                        self.monsters.append(monster)
+                        self._spawn_initial_monster(spawn)
         
         # 生成Boss
         if self.scene_type in monster_spawns:
@@ -369,10 +495,7 @@ class Map:
                     
                     # 只有不在NPC活动区域内的刷新点才生成Boss
                     if not in_npc_area:
-                        boss = Monster(spawn['name'], spawn['x'], spawn['y'])
-                        # 添加活动区域信息
-                        boss.activity_area = spawn['activity_area']
-                        self.monsters.append(boss)
+                        self._spawn_initial_monster(spawn)
                         # 显示Boss刷新消息
                         boss_message = f"[Boss刷新] {spawn['name']} 在 {self.scene_type} 出现了！坐标: ({spawn['x']}, {spawn['y']})"
                         print(boss_message)
@@ -558,6 +681,17 @@ class Map:
                         npc_data['has_shop']
                     ))
     
+    def _initialize_forest_trees(self):
+        """初始化森林装饰树木位置（每150像素一棵）"""
+        trees = []
+        for x in range(100, self.width, 150):
+            for y in range(100, self.height, 150):
+                # 树冠完全落在道路范围内的树会被道路覆盖，无需绘制
+                if ROAD_X <= x - 50 and x + 50 <= ROAD_X + 150:
+                    continue
+                trees.append((x, y))
+        return trees
+    
     def _initialize_exits(self):
         """初始化地图出口"""
         if self.scene_type == '村庄':
@@ -614,19 +748,11 @@ class Map:
             terrain_path = os.path.join(base_path, 'sprites', 'terrain')
             if os.path.exists(terrain_path):
                 # 加载树素材
-                tree_path = os.path.join(terrain_path, 'tree.png')
-                if os.path.exists(tree_path):
-                    self.map_assets['terrain']['tree'] = pygame.image.load(tree_path)
-                
-                # 加载岩石素材
-                rock_path = os.path.join(terrain_path, 'rock.png')
-                if os.path.exists(rock_path):
-                    self.map_assets['terrain']['rock'] = pygame.image.load(rock_path)
-                
-                # 加载房子素材
-                house_path = os.path.join(terrain_path, 'house.png')
-                if os.path.exists(house_path):
-                    self.map_assets['terrain']['house'] = pygame.image.load(house_path)
+                # 加载树、岩石、房子素材（各地图共享同一份图片）
+                for name in ['tree', 'rock', 'house']:
+                    image = asset_cache.get_image(os.path.join(terrain_path, f'{name}.png'))
+                    if image is not None:
+                        self.map_assets['terrain'][name] = image
             
             self.use_default_assets = False if self.map_assets['terrain'] else True
         except Exception as e:
@@ -634,81 +760,200 @@ class Map:
             self.use_default_assets = True
             self.map_assets = {'terrain': {}, 'objects': {}}
     
+    @profiler.profile('Map.update')
     def update(self):
         """更新地图状态"""
-        # 更新怪物
-        for monster in self.monsters:
-            if not monster.is_dead():
-                monster.update(self.player)
-        
-        # 移除死亡的怪物
-        self.monsters = [monster for monster in self.monsters if not monster.is_dead()]
+        if self.monster_store is not None:
+            self._update_monsters_batched()
+        else:
+            self._update_monsters()
         
         # 处理碰撞检测
         self.handle_collisions()
         
         # 随机生成新怪物
-        if len(self.monsters) < 15:
-            if random.random() < 0.01:
-                # 导入ID管理器
-                from src.core.id_manager import id_manager
-                
-                # 根据地图类型选择怪物
-                if self.scene_type == '村庄':
-                    monster_ids = [1, 2, 3]  # 稻草人、鸡、鹿
-                elif self.scene_type == '森林':
-                    monster_ids = [4, 3, 1]  # 狼、鹿、稻草人
-                elif self.scene_type == '沙漠':
-                    monster_ids = [4, 5]  # 狼、骷髅
-                elif self.scene_type == '地牢':
-                    monster_ids = [5, 6]  # 骷髅、僵尸
-                else:
-                    monster_ids = [1, 2, 3, 5, 6, 4]  # 稻草人、鸡、鹿、骷髅、僵尸、狼
-                
-                # 低概率生成Boss
-                boss_spawned = False
-                if random.random() < 0.05:  # 5%概率生成Boss
-                    if self.scene_type == '沙漠':
-                        boss_id = 7  # 骷髅王
-                        boss_info = id_manager.get_monster_by_id(boss_id)
-                        if boss_info:
-                            boss_type = boss_info['name']
-                            x = random.randint(0, self.width - 32)
-                            y = random.randint(0, self.height - 32)
-                            self.monsters.append(Monster(boss_type, x, y))
-                            # 显示Boss刷新消息
-                            boss_message = f"[Boss刷新] {boss_type} 在 {self.scene_type} 出现了！坐标: ({x}, {y})"
-                            print(boss_message)
-                            # 在游戏内显示消息
-                            if self.game and hasattr(self.game, 'ui') and hasattr(self.game.ui, 'add_game_message'):
-                                self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
-                            boss_spawned = True
-                    elif self.scene_type == '地牢':
-                        boss_id = random.choice([8, 9])  # 僵尸王或沃玛教主
-                        boss_info = id_manager.get_monster_by_id(boss_id)
-                        if boss_info:
-                            boss_type = boss_info['name']
-                            x = random.randint(0, self.width - 32)
-                            y = random.randint(0, self.height - 32)
-                            self.monsters.append(Monster(boss_type, x, y))
-                            # 显示Boss刷新消息
-                            boss_message = f"[Boss刷新] {boss_type} 在 {self.scene_type} 出现了！坐标: ({x}, {y})"
-                            print(boss_message)
-                            # 在游戏内显示消息
-                            if self.game and hasattr(self.game, 'ui') and hasattr(self.game.ui, 'add_game_message'):
-                                self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
-                            boss_spawned = True
-                
-                # 如果没有生成Boss，生成普通怪物
-                if not boss_spawned:
-                    monster_id = random.choice(monster_ids)
-                    monster_info = id_manager.get_monster_by_id(monster_id)
-                    if monster_info:
-                        monster_type = monster_info['name']
-                        x = random.randint(0, self.width - 32)
-                        y = random.randint(0, self.height - 32)
-                        self.monsters.append(Monster(monster_type, x, y))
+        if len(self.monsters) < MAX_MONSTERS:
+            if random.random() < MONSTER_SPAWN_CHANCE:
+                self.spawn_random_monster()
+    
+    def _update_monsters(self):
+        """逐个更新怪物"""
+        # 更新怪物（按细节层级调度：附近完整更新，屏幕外降频，远处休眠）
+        updated = 0
+        monsters = self.monsters
+        monster_index = self.monster_index
+        simulation_lod = self.simulation_lod
+        simulation_lod.begin_frame(self.player, self._get_view_rect())
+        slot = 0
+        while slot < len(monsters):
+            monster = monsters[slot]
+            if monster.is_dead():
+                # 移除死亡的怪物（用最后一只填补空位，不重建列表）
+                self._remove_monster_at(slot)
+                continue
+            steps = simulation_lod.get_steps(monster, slot)
+            if steps:
+                old_x, old_y = monster.x, monster.y
+                monster.update(self.player, steps)
+                self._block_monster_by_terrain(monster, old_x, old_y)
+                monster_index.move(monster, monster.x, monster.y)
+                updated += 1
+            slot += 1
+        if profiler.enabled:
+            profiler.count('monsters_updated', updated)
+    
+    def _update_monsters_batched(self):
+        """用数组化存储更新怪物：玩家附近和战斗中的逐个完整更新，其余批量漫游"""
+        store = self.monster_store
+        monster_index = self.monster_index
+        scalar_monsters = store.begin_frame(self.player)
+        has_dead = False
+        for monster in scalar_monsters:
+            if monster.is_dead():
+                # 只有逐个更新的怪物会受到伤害，死亡的怪物稍后统一移除
+                has_dead = True
+                continue
+            old_x, old_y = monster.x, monster.y
+            monster.update(self.player)
+            self._block_monster_by_terrain(monster, old_x, old_y)
+            monster_index.move(monster, monster.x, monster.y)
+            store.end_scalar_update(monster)
+        
+        if has_dead:
+            # 从后往前移除（用最后一只填补空位，填补进来的怪物已检查过）
+            monsters = self.monsters
+            for slot in range(len(monsters) - 1, -1, -1):
+                if monsters[slot].is_dead():
+                    self._remove_monster_at(slot)
+        
+        for monster in store.step():
+            monster_index.move(monster, monster.x, monster.y)
+        if profiler.enabled:
+            profiler.count('monsters_updated', store.scalar_updated)
+            profiler.count('monsters_batched', store.batch_updated)
+    
+    def _remove_monster_at(self, slot):
+        """从地图移除一只怪物并回收到对象池（用最后一只怪物填补空位）"""
+        monsters = self.monsters
+        monster = monsters[slot]
+        last = monsters.pop()
+        if slot < len(monsters):
+            monsters[slot] = last
+        
+        self.monster_index.remove(monster)
+        self.simulation_lod.forget(monster)
+        if self.monster_store is not None:
+            self.monster_store.remove(monster)
+        # 对象即将被复用，不能继续作为选中目标
+        ui = getattr(self.game, 'ui', None)
+        if ui is not None and getattr(ui, 'selected_monster', None) is monster:
+            ui.selected_monster = None
+        monster_pool.release(monster)
+    
+    def spawn_random_monster(self, announce=True):
+        """在随机位置刷新一只怪物（低概率刷新Boss）
+        
+        Args:
+            announce: 是否在游戏内显示Boss刷新消息（后台地图刷新时为False，只打印日志）
+        """
+        # 导入ID管理器
+        from src.core.id_manager import id_manager
+        
+        # 根据地图类型选择怪物
+        if self.scene_type == '村庄':
+            monster_ids = [1, 2, 3]  # 稻草人、鸡、鹿
+        elif self.scene_type == '森林':
+            monster_ids = [4, 3, 1]  # 狼、鹿、稻草人
+        elif self.scene_type == '沙漠':
+            monster_ids = [4, 5]  # 狼、骷髅
+        elif self.scene_type == '地牢':
+            monster_ids = [5, 6]  # 骷髅、僵尸
+        else:
+            monster_ids = [1, 2, 3, 5, 6, 4]  # 稻草人、鸡、鹿、骷髅、僵尸、狼
+        
+        # 低概率生成Boss
+        boss_spawned = False
+        if random.random() < 0.05:  # 5%概率生成Boss
+            if self.scene_type == '沙漠':
+                boss_id = 7  # 骷髅王
+                boss_info = id_manager.get_monster_by_id(boss_id)
+                if boss_info:
+                    boss_type = boss_info['name']
+                    x = random.randint(0, self.width - 32)
+                    y = random.randint(0, self.height - 32)
+                    self.add_monster(monster_pool.acquire(boss_type, x, y))
+                    # 显示Boss刷新消息
+                    boss_message = f"[Boss刷新] {boss_type} 在 {self.scene_type} 出现了！坐标: ({x}, {y})"
+                    print(boss_message)
+                    # 在游戏内显示消息
+                    if announce and self.game and hasattr(self.game, 'ui') and hasattr(self.game.ui, 'add_game_message'):
+                        self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
+                    boss_spawned = True
+            elif self.scene_type == '地牢':
+                boss_id = random.choice([8, 9])  # 僵尸王或沃玛教主
+                boss_info = id_manager.get_monster_by_id(boss_id)
+                if boss_info:
+                    boss_type = boss_info['name']
+                    x = random.randint(0, self.width - 32)
+                    y = random.randint(0, self.height - 32)
+                    self.add_monster(monster_pool.acquire(boss_type, x, y))
+                    # 显示Boss刷新消息
+                    boss_message = f"[Boss刷新] {boss_type} 在 {self.scene_type} 出现了！坐标: ({x}, {y})"
+                    print(boss_message)
+                    # 在游戏内显示消息
+                    if announce and self.game and hasattr(self.game, 'ui') and hasattr(self.game.ui, 'add_game_message'):
+                        self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
+                    boss_spawned = True
+        
+        # 如果没有生成Boss，生成普通怪物
+        if not boss_spawned:
+            monster_id = random.choice(monster_ids)
+            monster_info = id_manager.get_monster_by_id(monster_id)
+            if monster_info:
+                monster_type = monster_info['name']
+                x = random.randint(0, self.width - 32)
+                y = random.randint(0, self.height - 32)
+                self.add_monster(monster_pool.acquire(monster_type, x, y))
+    
+    def simulate_background(self, frames):
+        """粗粒度推进不在当前显示的地图
+        
+        玩家不在该地图上，怪物只会漫游和刷新：漫游用fast_forward一次推进，
+        刷新按每帧概率的几何分布直接抽取下一次刷新间隔，开销与帧数无关。
+        
+        Args:
+            frames: 需要推进的帧数
+        """
+        frames = int(frames)
+        if frames <= 0:
+            return
+        
+        # 漫游（休眠中的怪物已一并推进，清除休眠记录）
+        is_blocked = self.simulation_lod.is_blocked
+        store = self.monster_store
+        for monster in self.monsters:
+            if not monster.is_dead():
+                if store is not None:
+                    store.push(monster)
+                monster.fast_forward(frames, is_blocked)
+                self.monster_index.move(monster, monster.x, monster.y)
+                if store is not None:
+                    store.end_scalar_update(monster)
+                    store.pull(monster)
+        self.simulation_lod.dormant_since.clear()
+        
+        # 刷新
+        remaining = frames
+        log_miss = math.log(1 - MONSTER_SPAWN_CHANCE)
+        while len(self.monsters) < MAX_MONSTERS:
+            gap = int(math.log(1 - random.random()) / log_miss) + 1
+            if gap > remaining:
+                break
+            remaining -= gap
+            # 玩家不在该地图上，Boss刷新只打印日志，不在游戏内提示
+            self.spawn_random_monster(announce=False)
     
+    @profiler.profile('Map.handle_collisions')
     def handle_collisions(self):
         """处理碰撞检测"""
         if hasattr(self, 'player') and self.player:
@@ -732,79 +977,81 @@ class Map:
             self.player.height - 12
         )
         
-        # 检测与地形元素的碰撞
-        for element in self.terrain_elements:
-            # 地形元素碰撞盒
-            terrain_rect = pygame.Rect(
-                element['x'] - 16, 
-                element['y'] - 16, 
-                32, 
-                32
-            )
+        # 检测与附近地形元素的碰撞（碰撞盒已在加载时预先计算）
+        terrain_elements = self.terrain_index.elements
+        for index in self.terrain_index.query(player_rect):
+            element = terrain_elements[index]
+            # 碰撞发生，将玩家移回碰撞前的位置
+            # 这里使用简单的碰撞响应，将玩家推出碰撞区域
+            dx = (self.player.x + self.player.width//2) - (element['x'])
+            dy = (self.player.y + self.player.height//2) - (element['y'])
             
-            if player_rect.colliderect(terrain_rect):
-                # 碰撞发生，将玩家移回碰撞前的位置
-                # 这里使用简单的碰撞响应，将玩家推出碰撞区域
-                dx = (self.player.x + self.player.width//2) - (element['x'])
-                dy = (self.player.y + self.player.height//2) - (element['y'])
-                
-                if abs(dx) > abs(dy):
-                    # 水平碰撞
-                    if dx > 0:
-                        self.player.x = element['x'] + 20
-                    else:
-                        self.player.x = element['x'] - self.player.width - 4
+            if abs(dx) > abs(dy):
+                # 水平碰撞
+                if dx > 0:
+                    self.player.x = element['x'] + 20
                 else:
-                    # 垂直碰撞
-                    if dy > 0:
-                        self.player.y = element['y'] + 20
-                    else:
-                        self.player.y = element['y'] - self.player.height - 4
+                    self.player.x = element['x'] - self.player.width - 4
+            else:
+                # 垂直碰撞
+                if dy > 0:
+                    self.player.y = element['y'] + 20
+                else:
+                    self.player.y = element['y'] - self.player.height - 4
+    
+    def _get_view_rect(self):
+        """当前屏幕对应的世界坐标范围 (left, top, right, bottom)"""
+        game = self.game
+        if game is not None and hasattr(game, 'camera_x'):
+            return (game.camera_x, game.camera_y, game.camera_x + game.width, game.camera_y + game.height)
+        # 没有相机信息时以玩家为中心估算
+        return (self.player.x - 400, self.player.y - 300, self.player.x + 400, self.player.y + 300)
+    
+    def _block_monster_by_terrain(self, monster, old_x, old_y):
+        """怪物走进地形时退回原位置并掉头"""
+        if monster.x == old_x and monster.y == old_y:
+            return
+        terrain_index = self.terrain_index
+        if not terrain_index.collides(monster.get_collision_rect()):
+            return
+        # 原位置已与地形重叠时（例如刷新在岩石上）允许继续移动，避免卡死
+        new_x, new_y = monster.x, monster.y
+        monster.x, monster.y = old_x, old_y
+        if terrain_index.collides(monster.get_collision_rect()):
+            monster.x, monster.y = new_x, new_y
+            return
+        monster.direction = (monster.direction + 2) % 4
     
     def handle_monster_collisions(self):
         """处理玩家与怪物的碰撞"""
         if not self.player:
             return
         
-        for monster in self.monsters:
+        # 只检测玩家附近的怪物
+        nearby_monsters = self.monster_index.query_rect(
+            self.player.x - MONSTER_QUERY_MARGIN,
+            self.player.y - MONSTER_QUERY_MARGIN,
+            self.player.x + self.player.width + MONSTER_QUERY_MARGIN,
+            self.player.y + self.player.height + MONSTER_QUERY_MARGIN
+        )
+        for monster in nearby_monsters:
             if not monster.is_dead() and self.player.collides_with(monster):
                 # 防止玩家被怪物推着走，只让玩家保持原位，怪物反弹
                 # 计算玩家中心点
                 player_center_x = self.player.x + self.player.width // 2
                 player_center_y = self.player.y + self.player.height // 2
                 
-                # 计算怪物中心点（根据怪物类型调整）
-                if hasattr(monster, 'name'):
-                    if monster.name in ['狼', '僵尸', '骷髅']:
-                        monster_center_x = monster.x + 15
-                        monster_center_y = monster.y + 15
-                    elif monster.name in ['稻草人', '鸡', '鹿']:
-                        monster_center_x = monster.x + 12
-                        monster_center_y = monster.y + 12
-                    else:
-                        monster_center_x = monster.x + 14
-                        monster_center_y = monster.y + 14
-                else:
-                    monster_center_x = monster.x + 14
-                    monster_center_y = monster.y + 14
+                # 计算怪物中心点（推挤半径取自怪物类型）
+                radius = monster.monster_type.contact_radius
+                monster_center_x = monster.x + radius
+                monster_center_y = monster.y + radius
                 
                 dx = player_center_x - monster_center_x
                 dy = player_center_y - monster_center_y
                 
                 # 计算碰撞深度
-                if hasattr(monster, 'name'):
-                    if monster.name in ['狼', '僵尸', '骷髅']:
-                        overlap_x = (self.player.width//2 + 15) - abs(dx)
-                        overlap_y = (self.player.height//2 + 15) - abs(dy)
-                    elif monster.name in ['稻草人', '鸡', '鹿']:
-                        overlap_x = (self.player.width//2 + 12) - abs(dx)
-                        overlap_y = (self.player.height//2 + 12) - abs(dy)
-                    else:
-                        overlap_x = (self.player.width//2 + 14) - abs(dx)
-                        overlap_y = (self.player.height//2 + 14) - abs(dy)
-                else:
-                    overlap_x = (self.player.width//2 + 14) - abs(dx)
-                    overlap_y = (self.player.height//2 + 14) - abs(dy)
+                overlap_x = (self.player.width//2 + radius) - abs(dx)
+                overlap_y = (self.player.height//2 + radius) - abs(dy)
                 
                 if abs(dx) > abs(dy):
                     # 水平碰撞
@@ -822,13 +1069,16 @@ class Map:
                     else:
                         # 玩家在怪物上方，怪物向下移动
                         monster.y += overlap_y
+                self.monster_index.move(monster, monster.x, monster.y)
     
     def handle_npc_collisions(self):
         """处理玩家与NPC的碰撞"""
         if not self.player:
             return
         
-        for npc in self.npcs:
+        # 只检测玩家附近的NPC
+        nearby_npcs = self.npc_index.query_rect(self.player.x - 24, self.player.y - 24, self.player.x + self.player.width + 24, self.player.y + self.player.height + 24)
+        for npc in nearby_npcs:
             # NPC碰撞盒
             npc_rect = pygame.Rect(npc.x - 12, npc.y - 12, 24, 24)
             player_rect = pygame.Rect(
@@ -848,18 +1098,121 @@ class Map:
                     self.player.x += (dx / distance) * push_distance
                     self.player.y += (dy / distance) * push_distance
     
+    @profiler.profile('Map.render')
     def render(self, screen, camera_x, camera_y):
         """渲染地图"""
+        self.render_terrain(screen, camera_x, camera_y)
+        self.render_entities(screen, camera_x, camera_y)
+        self.render_exits(screen, camera_x, camera_y)
+    
+    def render_terrain(self, screen, camera_x, camera_y):
+        """渲染地面、道路和地形元素"""
+        # 绘制静态地面层（地面纹理、区域标识、道路及道路文字，分块预渲染并缓存）
+        self.ground_cache.render(screen, camera_x, camera_y)
+        
+        # 绘制树木（预烘焙的树木精灵，只绘制可见区域）
+        if self.forest_canopy:
+            self.forest_canopy.render(screen, camera_x, camera_y)
+        
+        # 绘制地形元素
+        for element in self.terrain_elements:
+            # 检查元素是否在可见区域内
+            if camera_x - 80 < element['x'] < camera_x + 880 and camera_y - 80 < element['y'] < camera_y + 680:
+                if element['type'] == 'tree':
+                    # 使用树素材
+                    if not self.use_default_assets and 'tree' in self.map_assets['terrain']:
+                        tree_image = self.map_assets['terrain']['tree']
+                        # 计算树的绘制位置（居中）
+                        tree_rect = tree_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
+                        screen.blit(tree_image, tree_rect)
+                    else:
+                        # 回退到默认绘制
+                        trunk_color = (100, 60, 20)
+                        pygame.draw.rect(screen, trunk_color, (element['x'] - 5 - camera_x, element['y'] - 20 - camera_y, 10, 30))
+                        leaf_color = (0, 120, 0)
+                        pygame.draw.circle(screen, leaf_color, (element['x'] - camera_x, element['y'] - 25 - camera_y), 20)
+                elif element['type'] == 'rock':
+                    # 使用岩石素材
+                    if not self.use_default_assets and 'rock' in self.map_assets['terrain']:
+                        rock_image = self.map_assets['terrain']['rock']
+                        # 计算岩石的绘制位置（居中）
+                        rock_rect = rock_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
+                        screen.blit(rock_image, rock_rect)
+                    else:
+                        # 回退到默认绘制
+                        rock_color = (100, 100, 100)
+                        pygame.draw.circle(screen, rock_color, (element['x'] - camera_x, element['y'] - camera_y), 15)
+                elif element['type'] == 'house':
+                    # 使用房子素材
+                    if not self.use_default_assets and 'house' in self.map_assets['terrain']:
+                        house_image = self.map_assets['terrain']['house']
+                        # 计算房子的绘制位置（居中）
+                        house_rect = house_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
+                        screen.blit(house_image, house_rect)
+                    else:
+                        # 回退到默认绘制
+                        wall_color = (150, 100, 50)
+                        pygame.draw.rect(screen, wall_color, (element['x'] - 30 - camera_x, element['y'] - 20 - camera_y, 60, 40))
+                        roof_color = (200, 150, 100)
+                        pygame.draw.polygon(screen, roof_color, [(element['x'] - 35 - camera_x, element['y'] - 20 - camera_y), (element['x'] + 35 - camera_x, element['y'] - 20 - camera_y), (element['x'] - camera_x, element['y'] - 50 - camera_y)])
+                elif element['type'] == 'well':
+                    # 更真实的水井
+                    # 水井底座
+                    base_color = (100, 100, 100)
+                    pygame.draw.circle(screen, base_color, (element['x'] - camera_x, element['y'] - camera_y), 18)
+                    # 水井边缘
+                    edge_color = (120, 120, 120)
+                    pygame.draw.circle(screen, edge_color, (element['x'] - camera_x, element['y'] - camera_y), 18, 2)
+                    # 水井水面
+                    water_color = (0, 0, 120)
+                    pygame.draw.circle(screen, water_color, (element['x'] - camera_x, element['y'] - camera_y), 12)
+                    # 水井辘轳
+                    pulley_color = (80, 80, 80)
+                    pygame.draw.rect(screen, pulley_color, (element['x'] - 25 - camera_x, element['y'] - 10 - camera_y, 50, 8))
+                    pygame.draw.circle(screen, pulley_color, (element['x'] - camera_x, element['y'] - 6 - camera_y), 6)
+                    # 水井绳子
+                    rope_color = (100, 80, 60)
+                    pygame.draw.line(screen, rope_color, (element['x'] - camera_x, element['y'] - 6 - camera_y), (element['x'] - camera_x, element['y'] - camera_y), 1)
+                elif element['type'] == 'altar':
+                    # 更真实的祭坛
+                    # 祭坛底座
+                    base_color = (180, 180, 180)
+                    pygame.draw.rect(screen, base_color, (element['x'] - 30 - camera_x, element['y'] - 20 - camera_y, 60, 35))
+                    # 祭坛顶部
+                    top_color = (200, 200, 200)
+                    pygame.draw.rect(screen, top_color, (element['x'] - 25 - camera_x, element['y'] - 25 - camera_y, 50, 10))
+                    # 祭坛宝石
+                    gem_color = (255, 215, 0)
+                    pygame.draw.circle(screen, gem_color, (element['x'] - camera_x, element['y'] - 10 - camera_y), 12)
+                    # 添加祭坛纹理
+                    for i in range(0, 35, 5):
+                        texture_color = (160, 160, 160)
+                        pygame.draw.line(screen, texture_color, (element['x'] - 30 - camera_x, element['y'] - 20 + i - camera_y), (element['x'] + 29 - camera_x, element['y'] - 20 + i - camera_y), 1)
+                    # 添加宝石光芒
+                    for i in range(4):
+                        glow_color = (255, 235, 100)
+                        glow_radius = 15 + i * 3
+                        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                        pygame.draw.circle(glow_surface, (glow_color[0], glow_color[1], glow_color[2], 30 - i * 5), (glow_radius, glow_radius), glow_radius)
+                        screen.blit(glow_surface, (element['x'] - glow_radius - camera_x, element['y'] - glow_radius - 10 - camera_y))
+    
+    def _paint_ground(self, surface, origin_x, origin_y):
+        """烘焙静态地面层（地面纹理、区域标识、道路及道路文字）
+        
+        按世界坐标绘制到surface上，origin为surface左上角对应的世界坐标。
+        """
+        chunk_width, chunk_height = surface.get_size()
+        surface.fill(self._get_ground_color())
+        
+        # 多绘制一圈相邻格子，保证跨越分块边界的细节与整图绘制一致
+        start_x = max(0, (origin_x - 32) // 32 * 32)
+        end_x = min(self.width, origin_x + chunk_width + 32)
+        start_y = max(0, (origin_y - 32) // 32 * 32)
+        end_y = min(self.height, origin_y + chunk_height + 32)
+        
         # 绘制背景（参考传奇游戏的像素风格）
         if self.scene_type == '村庄':
             # 村庄背景，使用更真实的草地纹理
-            screen.fill((80, 140, 90))
-            # 绘制草地纹理（只绘制可见区域）
-            start_x = max(0, camera_x // 32) * 32
-            end_x = min(self.width, (camera_x + 1024) // 32 * 32 + 32)
-            start_y = max(0, camera_y // 32) * 32
-            end_y = min(self.height, (camera_y + 768) // 32 * 32 + 32)
-            
             for x in range(start_x, end_x, 32):
                 for y in range(start_y, end_y, 32):
                     # 使用基于坐标的固定模式，避免闪烁
@@ -872,14 +1225,14 @@ class Map:
                         color = (110, 170, 120)  # 浅绿色
                     else:
                         color = (85, 145, 95)  # 暗绿色
-                    pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
+                    pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
                     # 添加固定的草地细节
                     if (x // 64 + y // 64) % 2 == 0:
                         detail_color = (70, 130, 80)
                         detail_size = 6
                         detail_x = (x // 32) % 24
                         detail_y = (y // 32) % 24
-                        pygame.draw.rect(screen, detail_color, (x - camera_x + detail_x, y - camera_y + detail_y, detail_size, detail_size))
+                        pygame.draw.rect(surface, detail_color, (x - origin_x + detail_x, y - origin_y + detail_y, detail_size, detail_size))
             
             # 绘制区域标识
             regions = [
@@ -891,43 +1244,23 @@ class Map:
             ]
             
             for region in regions:
-                # 检查区域是否在可见范围内
-                if camera_x - 200 < region["x"] < camera_x + 1024 and camera_y - 100 < region["y"] < camera_y + 768:
-                    # 绘制区域名称
-                    try:
-                        font = pygame.font.SysFont('hiraginosansgb', 18)
-                    except:
-                        try:
-                            font = pygame.font.SysFont('songti', 18)
-                        except:
-                            try:
-                                font = pygame.font.SysFont('arialunicode', 18)
-                            except:
-                                font = pygame.font.Font(None, 18)
-                    
-                    text = font.render(region["name"], True, region["color"])
-                    text_rect = text.get_rect()
-                    text_x = region["x"] - text_rect.width // 2 - camera_x
-                    text_y = region["y"] - 30 - camera_y
-                    
-                    # 绘制文字背景
-                    bg_rect = pygame.Rect(text_x - 5, text_y - 5, text_rect.width + 10, text_rect.height + 10)
-                    pygame.draw.rect(screen, (0, 0, 0, 150), bg_rect, border_radius=5)
-                    # 绘制文字
-                    screen.blit(text, (text_x, text_y))
-                    
-                    # 绘制区域范围指示器
-                    indicator_rect = pygame.Rect(region["x"] - 100 - camera_x, region["y"] - 100 - camera_y, 200, 200)
-                    pygame.draw.rect(screen, region["color"], indicator_rect, 1, border_radius=10)
+                # 绘制区域名称
+                text = font_cache.render(region["name"], region["color"], 18)
+                text_rect = text.get_rect()
+                text_x = region["x"] - text_rect.width // 2 - origin_x
+                text_y = region["y"] - 30 - origin_y
+                
+                # 绘制文字背景
+                bg_rect = pygame.Rect(text_x - 5, text_y - 5, text_rect.width + 10, text_rect.height + 10)
+                pygame.draw.rect(surface, (0, 0, 0, 150), bg_rect, border_radius=5)
+                # 绘制文字
+                surface.blit(text, (text_x, text_y))
+                
+                # 绘制区域范围指示器
+                indicator_rect = pygame.Rect(region["x"] - 100 - origin_x, region["y"] - 100 - origin_y, 200, 200)
+                pygame.draw.rect(surface, region["color"], indicator_rect, 1, border_radius=10)
         elif self.scene_type == '森林':
             # 森林背景
-            screen.fill((60, 100, 70))
-            # 绘制森林纹理（只绘制可见区域）
-            start_x = max(0, camera_x // 32) * 32
-            end_x = min(self.width, (camera_x + 1024) // 32 * 32 + 32)
-            start_y = max(0, camera_y // 32) * 32
-            end_y = min(self.height, (camera_y + 768) // 32 * 32 + 32)
-            
             for x in range(start_x, end_x, 32):
                 for y in range(start_y, end_y, 32):
                     # 使用基于坐标的固定模式，避免闪烁
@@ -938,46 +1271,16 @@ class Map:
                         color = (80, 120, 90)  # 中林色
                     else:
                         color = (65, 105, 75)  # 暗林色
-                    pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
+                    pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
                     # 添加固定的落叶细节
                     if (x // 48 + y // 48) % 2 == 0:
                         leaf_color = (180, 100, 50) if (x // 32) % 2 == 0 else (160, 80, 40)
                         leaf_size = 4
                         leaf_x = (x // 32) % 28
                         leaf_y = (y // 32) % 28
-                        pygame.draw.rect(screen, leaf_color, (x - camera_x + leaf_x, y - camera_y + leaf_y, leaf_size, leaf_size))
-            
-            # 绘制树木（只绘制可见区域）
-            for x in range(100, self.width, 150):
-                for y in range(100, self.height, 150):
-                    # 检查树木是否在可见区域内
-                    if camera_x - 100 < x < camera_x + 1124 and camera_y - 100 < y < camera_y + 868:
-                        # 更真实的树干
-                        trunk_color = (100, 60, 20)
-                        pygame.draw.rect(screen, trunk_color, (x - 12 - camera_x, y - 40 - camera_y, 24, 60))
-                        # 添加树干纹理
-                        for i in range(0, 60, 8):
-                            texture_color = (90, 50, 15)
-                            pygame.draw.line(screen, texture_color, (x - 12 - camera_x, y - 40 + i - camera_y), (x + 11 - camera_x, y - 40 + i - camera_y), 2)
-                        # 更真实的树叶
-                        leaf_color = (40, 90, 50)
-                        pygame.draw.circle(screen, leaf_color, (x - camera_x, y - 50 - camera_y), 40)
-                        # 添加树叶细节
-                        for i in range(8):
-                            detail_color = (30, 80, 40)
-                            detail_radius = random.randint(12, 20)
-                            offset_x = random.randint(-30, 30)
-                            offset_y = random.randint(-30, 30)
-                            pygame.draw.circle(screen, detail_color, (x + offset_x - camera_x, y - 50 + offset_y - camera_y), detail_radius)
+                        pygame.draw.rect(surface, leaf_color, (x - origin_x + leaf_x, y - origin_y + leaf_y, leaf_size, leaf_size))
         elif self.scene_type == '沙漠':
             # 沙漠背景
-            screen.fill((170, 150, 110))
-            # 绘制沙地纹理（只绘制可见区域）
-            start_x = max(0, camera_x // 32) * 32
-            end_x = min(self.width, (camera_x + 1024) // 32 * 32 + 32)
-            start_y = max(0, camera_y // 32) * 32
-            end_y = min(self.height, (camera_y + 768) // 32 * 32 + 32)
-            
             for x in range(start_x, end_x, 32):
                 for y in range(start_y, end_y, 32):
                     # 使用基于坐标的固定模式，避免闪烁
@@ -990,23 +1293,16 @@ class Map:
                         color = (160, 140, 100)  # 暗沙色
                     else:
                         color = (175, 155, 115)  # 浅沙色
-                    pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
+                    pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
                     # 添加固定的沙子细节
                     if (x // 48 + y // 48) % 2 == 0:
                         detail_color = (160, 140, 100)
                         detail_size = 4
                         detail_x = (x // 32) % 24
                         detail_y = (y // 32) % 24
-                        pygame.draw.rect(screen, detail_color, (x - camera_x + detail_x, y - camera_y + detail_y, detail_size, detail_size))
+                        pygame.draw.rect(surface, detail_color, (x - origin_x + detail_x, y - origin_y + detail_y, detail_size, detail_size))
         elif self.scene_type == '地牢':
             # 地牢背景
-            screen.fill((50, 50, 50))
-            # 绘制砖块纹理（只绘制可见区域）
-            start_x = max(0, camera_x // 32) * 32
-            end_x = min(self.width, (camera_x + 1024) // 32 * 32 + 32)
-            start_y = max(0, camera_y // 32) * 32
-            end_y = min(self.height, (camera_y + 768) // 32 * 32 + 32)
-            
             for x in range(start_x, end_x, 32):
                 for y in range(start_y, end_y, 32):
                     # 使用基于坐标的固定模式，避免闪烁
@@ -1017,22 +1313,15 @@ class Map:
                         color = (50, 50, 50)  # 中砖色
                     else:
                         color = (40, 40, 40)  # 暗砖色
-                    pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
+                    pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
                     # 添加砖块纹理
                     mortar_color = (30, 30, 30)
-                    pygame.draw.rect(screen, mortar_color, (x - camera_x, y - camera_y, 32, 3))
-                    pygame.draw.rect(screen, mortar_color, (x - camera_x, y + 29 - camera_y, 32, 3))
-                    pygame.draw.rect(screen, mortar_color, (x - camera_x, y - camera_y, 3, 32))
-                    pygame.draw.rect(screen, mortar_color, (x + 29 - camera_x, y - camera_y, 3, 32))
+                    pygame.draw.rect(surface, mortar_color, (x - origin_x, y - origin_y, 32, 3))
+                    pygame.draw.rect(surface, mortar_color, (x - origin_x, y + 29 - origin_y, 32, 3))
+                    pygame.draw.rect(surface, mortar_color, (x - origin_x, y - origin_y, 3, 32))
+                    pygame.draw.rect(surface, mortar_color, (x + 29 - origin_x, y - origin_y, 3, 32))
         elif self.scene_type == '雪原':
             # 雪原背景
-            screen.fill((200, 220, 240))
-            # 绘制雪地纹理（只绘制可见区域）
-            start_x = max(0, camera_x // 32) * 32
-            end_x = min(self.width, (camera_x + 1024) // 32 * 32 + 32)
-            start_y = max(0, camera_y // 32) * 32
-            end_y = min(self.height, (camera_y + 768) // 32 * 32 + 32)
-            
             for x in range(start_x, end_x, 32):
                 for y in range(start_y, end_y, 32):
                     # 使用基于坐标的固定模式，避免闪烁
@@ -1045,176 +1334,101 @@ class Map:
                         color = (190, 210, 230)  # 暗雪色
                     else:
                         color = (205, 225, 245)  # 浅雪色
-                    pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
+                    pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
                     # 添加固定的雪花细节
                     if (x // 48 + y // 48) % 2 == 0:
                         snow_color = (255, 255, 255)
                         snow_size = 4
                         snow_x = (x // 32) % 30
                         snow_y = (y // 32) % 30
-                        pygame.draw.circle(screen, snow_color, (x - camera_x + snow_x, y - camera_y + snow_y), snow_size)
+                        pygame.draw.circle(surface, snow_color, (x - origin_x + snow_x, y - origin_y + snow_y), snow_size)
         
         # 绘制道路（更真实的道路）
-        road_left = 350 - camera_x
-        road_top = 0 - camera_y
+        self._paint_road(surface, origin_x, origin_y, start_y, end_y)
+    
+    def _paint_road(self, surface, origin_x, origin_y, start_y, end_y):
+        """烘焙道路及道路文字"""
         road_width = 150
         road_height = self.height
-        if road_left < 1024 and road_left + road_width > 0 and road_top < 768 and road_top + road_height > 0:
-            # 道路基础色
-            road_color = (140, 120, 90)
-            pygame.draw.rect(screen, road_color, (road_left, road_top, road_width, road_height))
-            # 道路纹理
-            for x in range(350, 500, 32):
-                for y in range(0, self.height, 32):
-                    # 检查道路纹理是否在可见区域内
-                    if camera_x < x < camera_x + 1024 and camera_y < y < camera_y + 768:
-                        # 使用基于坐标的固定模式，避免闪烁
-                        road_type = (x // 32 + y // 32) % 3
-                        if road_type == 0:
-                            color = (150, 130, 100)  # 亮路色
-                        elif road_type == 1:
-                            color = (140, 120, 90)  # 中路色
-                        else:
-                            color = (130, 110, 80)  # 暗路色
-                        pygame.draw.rect(screen, color, (x - camera_x, y - camera_y, 32, 32))
-                        # 添加固定的道路细节
-                        if (x // 48 + y // 48) % 2 == 0:
-                            detail_color = (120, 100, 70)
-                            detail_size = 6
-                            detail_x = (x // 32) % 24
-                            detail_y = (y // 32) % 24
-                            pygame.draw.rect(screen, detail_color, (x - camera_x + detail_x, y - camera_y + detail_y, detail_size, detail_size))
-            
-            # 绘制道路文字说明
-            try:
-                road_font = pygame.font.SysFont('hiraginosansgb', 16)
-            except:
-                try:
-                    road_font = pygame.font.SysFont('songti', 16)
-                except:
-                    try:
-                        road_font = pygame.font.SysFont('arialunicode', 16)
-                    except:
-                        road_font = pygame.font.Font(None, 16)
-            
-            # 道路名称
-            road_name = "中央大道"
-            road_text = road_font.render(road_name, True, (255, 255, 255))
-            road_text_rect = road_text.get_rect()
-            road_text_x = 350 + road_width // 2 - road_text_rect.width // 2 - camera_x
-            road_text_y = 100 - camera_y
+        chunk_width = surface.get_width()
+        if origin_x > ROAD_X + road_width + 32 or origin_x + chunk_width < ROAD_X:
+            return
+        
+        # 道路基础色
+        road_color = (140, 120, 90)
+        pygame.draw.rect(surface, road_color, (ROAD_X - origin_x, 0 - origin_y, road_width, road_height))
+        # 道路纹理
+        for x in range(ROAD_X, ROAD_X + road_width, 32):
+            for y in range(start_y, end_y, 32):
+                # 使用基于坐标的固定模式，避免闪烁
+                road_type = (x // 32 + y // 32) % 3
+                if road_type == 0:
+                    color = (150, 130, 100)  # 亮路色
+                elif road_type == 1:
+                    color = (140, 120, 90)  # 中路色
+                else:
+                    color = (130, 110, 80)  # 暗路色
+                pygame.draw.rect(surface, color, (x - origin_x, y - origin_y, 32, 32))
+                # 添加固定的道路细节
+                if (x // 48 + y // 48) % 2 == 0:
+                    detail_color = (120, 100, 70)
+                    detail_size = 6
+                    detail_x = (x // 32) % 24
+                    detail_y = (y // 32) % 24
+                    pygame.draw.rect(surface, detail_color, (x - origin_x + detail_x, y - origin_y + detail_y, detail_size, detail_size))
+        
+        # 道路名称
+        road_name = "中央大道"
+        road_text = font_cache.render(road_name, (255, 255, 255), 16)
+        road_text_rect = road_text.get_rect()
+        road_text_x = ROAD_X + road_width // 2 - road_text_rect.width // 2 - origin_x
+        road_text_y = 100 - origin_y
+        
+        # 绘制文字背景
+        bg_rect = pygame.Rect(road_text_x - 10, road_text_y - 5, road_text_rect.width + 20, road_text_rect.height + 10)
+        pygame.draw.rect(surface, (100, 80, 60, 180), bg_rect, border_radius=5)
+        # 绘制文字
+        surface.blit(road_text, (road_text_x, road_text_y))
+        
+        # 道路方向指示
+        directions = [
+            ("向北: 森林", 200),
+            ("向南: 地牢", 1000),
+            ("向东: 沙漠", 600),
+            ("向西: 雪原", 600)
+        ]
+        
+        for direction_text, y_pos in directions:
+            dir_text = font_cache.render(direction_text, (255, 255, 255), 16)
+            dir_text_rect = dir_text.get_rect()
+            dir_text_x = ROAD_X + road_width // 2 - dir_text_rect.width // 2 - origin_x
+            dir_text_y = y_pos - origin_y
             
             # 绘制文字背景
-            bg_rect = pygame.Rect(road_text_x - 10, road_text_y - 5, road_text_rect.width + 20, road_text_rect.height + 10)
-            pygame.draw.rect(screen, (100, 80, 60, 180), bg_rect, border_radius=5)
+            dir_bg_rect = pygame.Rect(dir_text_x - 8, dir_text_y - 4, dir_text_rect.width + 16, dir_text_rect.height + 8)
+            pygame.draw.rect(surface, (100, 80, 60, 150), dir_bg_rect, border_radius=3)
             # 绘制文字
-            screen.blit(road_text, (road_text_x, road_text_y))
-            
-            # 道路方向指示
-            directions = [
-                ("向北: 森林", 200),
-                ("向南: 地牢", 1000),
-                ("向东: 沙漠", 600),
-                ("向西: 雪原", 600)
-            ]
-            
-            for direction_text, y_pos in directions:
-                if camera_y - 50 < y_pos < camera_y + 768:
-                    dir_text = road_font.render(direction_text, True, (255, 255, 255))
-                    dir_text_rect = dir_text.get_rect()
-                    dir_text_x = 350 + road_width // 2 - dir_text_rect.width // 2 - camera_x
-                    dir_text_y = y_pos - camera_y
-                    
-                    # 绘制文字背景
-                    dir_bg_rect = pygame.Rect(dir_text_x - 8, dir_text_y - 4, dir_text_rect.width + 16, dir_text_rect.height + 8)
-                    pygame.draw.rect(screen, (100, 80, 60, 150), dir_bg_rect, border_radius=3)
-                    # 绘制文字
-                    screen.blit(dir_text, (dir_text_x, dir_text_y))
-        
-        # 绘制地形元素
-        for element in self.terrain_elements:
-            # 检查元素是否在可见区域内
-            if camera_x - 80 < element['x'] < camera_x + 880 and camera_y - 80 < element['y'] < camera_y + 680:
-                if element['type'] == 'tree':
-                    # 使用树素材
-                    if not self.use_default_assets and 'tree' in self.map_assets['terrain']:
-                        tree_image = self.map_assets['terrain']['tree']
-                        # 计算树的绘制位置（居中）
-                        tree_rect = tree_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
-                        screen.blit(tree_image, tree_rect)
-                    else:
-                        # 回退到默认绘制
-                        trunk_color = (100, 60, 20)
-                        pygame.draw.rect(screen, trunk_color, (element['x'] - 5 - camera_x, element['y'] - 20 - camera_y, 10, 30))
-                        leaf_color = (0, 120, 0)
-                        pygame.draw.circle(screen, leaf_color, (element['x'] - camera_x, element['y'] - 25 - camera_y), 20)
-                elif element['type'] == 'rock':
-                    # 使用岩石素材
-                    if not self.use_default_assets and 'rock' in self.map_assets['terrain']:
-                        rock_image = self.map_assets['terrain']['rock']
-                        # 计算岩石的绘制位置（居中）
-                        rock_rect = rock_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
-                        screen.blit(rock_image, rock_rect)
-                    else:
-                        # 回退到默认绘制
-                        rock_color = (100, 100, 100)
-                        pygame.draw.circle(screen, rock_color, (element['x'] - camera_x, element['y'] - camera_y), 15)
-                elif element['type'] == 'house':
-                    # 使用房子素材
-                    if not self.use_default_assets and 'house' in self.map_assets['terrain']:
-                        house_image = self.map_assets['terrain']['house']
-                        # 计算房子的绘制位置（居中）
-                        house_rect = house_image.get_rect(center=(element['x'] - camera_x, element['y'] - camera_y))
-                        screen.blit(house_image, house_rect)
-                    else:
-                        # 回退到默认绘制
-                        wall_color = (150, 100, 50)
-                        pygame.draw.rect(screen, wall_color, (element['x'] - 30 - camera_x, element['y'] - 20 - camera_y, 60, 40))
-                        roof_color = (200, 150, 100)
-                        pygame.draw.polygon(screen, roof_color, [(element['x'] - 35 - camera_x, element['y'] - 20 - camera_y), (element['x'] + 35 - camera_x, element['y'] - 20 - camera_y), (element['x'] - camera_x, element['y'] - 50 - camera_y)])
-                elif element['type'] == 'well':
-                    # 更真实的水井
-                    # 水井底座
-                    base_color = (100, 100, 100)
-                    pygame.draw.circle(screen, base_color, (element['x'] - camera_x, element['y'] - camera_y), 18)
-                    # 水井边缘
-                    edge_color = (120, 120, 120)
-                    pygame.draw.circle(screen, edge_color, (element['x'] - camera_x, element['y'] - camera_y), 18, 2)
-                    # 水井水面
-                    water_color = (0, 0, 120)
-                    pygame.draw.circle(screen, water_color, (element['x'] - camera_x, element['y'] - camera_y), 12)
-                    # 水井辘轳
-                    pulley_color = (80, 80, 80)
-                    pygame.draw.rect(screen, pulley_color, (element['x'] - 25 - camera_x, element['y'] - 10 - camera_y, 50, 8))
-                    pygame.draw.circle(screen, pulley_color, (element['x'] - camera_x, element['y'] - 6 - camera_y), 6)
-                    # 水井绳子
-                    rope_color = (100, 80, 60)
-                    pygame.draw.line(screen, rope_color, (element['x'] - camera_x, element['y'] - 6 - camera_y), (element['x'] - camera_x, element['y'] - camera_y), 1)
-                elif element['type'] == 'altar':
-                    # 更真实的祭坛
-                    # 祭坛底座
-                    base_color = (180, 180, 180)
-                    pygame.draw.rect(screen, base_color, (element['x'] - 30 - camera_x, element['y'] - 20 - camera_y, 60, 35))
-                    # 祭坛顶部
-                    top_color = (200, 200, 200)
-                    pygame.draw.rect(screen, top_color, (element['x'] - 25 - camera_x, element['y'] - 25 - camera_y, 50, 10))
-                    # 祭坛宝石
-                    gem_color = (255, 215, 0)
-                    pygame.draw.circle(screen, gem_color, (element['x'] - camera_x, element['y'] - 10 - camera_y), 12)
-                    # 添加祭坛纹理
-                    for i in range(0, 35, 5):
-                        texture_color = (160, 160, 160)
-                        pygame.draw.line(screen, texture_color, (element['x'] - 30 - camera_x, element['y'] - 20 + i - camera_y), (element['x'] + 29 - camera_x, element['y'] - 20 + i - camera_y), 1)
-                    # 添加宝石光芒
-                    for i in range(4):
-                        glow_color = (255, 235, 100)
-                        glow_radius = 15 + i * 3
-                        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(glow_surface, (glow_color[0], glow_color[1], glow_color[2], 30 - i * 5), (glow_radius, glow_radius), glow_radius)
-                        screen.blit(glow_surface, (element['x'] - glow_radius - camera_x, element['y'] - glow_radius - 10 - camera_y))
-        
+            surface.blit(dir_text, (dir_text_x, dir_text_y))
+    
+    def _get_ground_color(self):
+        """获取场景的地面底色"""
+        ground_colors = {
+            '村庄': (80, 140, 90),
+            '森林': (60, 100, 70),
+            '沙漠': (170, 150, 110),
+            '地牢': (50, 50, 50),
+            '雪原': (200, 220, 240)
+        }
+        return ground_colors.get(self.scene_type, (0, 0, 0))
+    
+    def release_render_cache(self):
+        """释放预渲染的地面缓存（切换地图时调用）"""
+        self.ground_cache.clear()
+    
+    def render_entities(self, screen, camera_x, camera_y):
+        """渲染NPC和怪物"""
         # 绘制NPC（只绘制可见区域）
-        for npc in self.npcs:
+        for npc in self.npc_index.query_rect(camera_x - 50, camera_y - 50, camera_x + 850, camera_y + 650):
             # 检查NPC是否在可见区域内
             if camera_x - 50 < npc.x < camera_x + 850 and camera_y - 50 < npc.y < camera_y + 650:
                 # 保存NPC的原始位置
@@ -1228,7 +1442,7 @@ class Map:
                 npc.x, npc.y = original_x, original_y
         
         # 绘制怪物（只绘制可见区域）
-        for monster in self.monsters:
+        for monster in self.monster_index.query_rect(camera_x - 50, camera_y - 50, camera_x + 850, camera_y + 650):
             if not monster.is_dead():
                 # 检查怪物是否在可见区域内
                 if camera_x - 50 < monster.x < camera_x + 850 and camera_y - 50 < monster.y < camera_y + 650:
@@ -1241,19 +1455,10 @@ class Map:
                     monster.render(screen)
                     # 恢复怪物的原始位置
                     monster.x, monster.y = original_x, original_y
-        
+    
+    def render_exits(self, screen, camera_x, camera_y):
+        """渲染传送点标识"""
         # 绘制传送点标识
-        try:
-            font = pygame.font.SysFont('hiraginosansgb', 20)
-        except:
-            try:
-                font = pygame.font.SysFont('songti', 20)
-            except:
-                try:
-                    font = pygame.font.SysFont('arialunicode', 20)
-                except:
-                    font = pygame.font.Font(None, 20)
-        
         for exit in self.exits:
             # 检查传送点是否在可见区域内
             if camera_x - 150 < exit['x'] < camera_x + 1174 and camera_y - 100 < exit['y'] < camera_y + 868:
@@ -1283,15 +1488,14 @@ class Map:
                 pygame.draw.rect(screen, (120, 100, 80, 150), (marker_x, marker_y, 100, 50), border_radius=5)
                 
                 # 绘制传送点文字
-                text = font.render(f'传送至: {destination}', True, (255, 255, 255))
+                text = font_cache.render(f'传送至: {destination}', (255, 255, 255), 20)
                 text_rect = text.get_rect()
                 text_x = exit['x'] + exit['width'] // 2 - text_rect.width // 2 - camera_x
                 text_y = exit['y'] + exit['height'] // 2 - text_rect.height // 2 - camera_y
                 screen.blit(text, (text_x, text_y))
                 
                 # 绘制方向指示箭头
-                arrow_font = pygame.font.Font(None, 24)
-                arrow_text = arrow_font.render('↓', True, (255, 215, 0))
+                arrow_text = font_cache.render('↓', (255, 215, 0), 24, font_cache.DEFAULT)
                 arrow_rect = arrow_text.get_rect()
                 arrow_x = exit['x'] + exit['width'] // 2 - arrow_rect.width // 2 - camera_x
                 arrow_y = exit['y'] + exit['height'] // 2 + text_rect.height // 2 + 5 - camera_y
@@ -1309,17 +1513,10 @@ class Map:
         player_center_x = player.x + player.width // 2
         player_center_y = player.y + player.height // 2
         
-        for monster in self.monsters:
-            # 计算怪物中心点（根据怪物类型调整尺寸）
-            if hasattr(monster, 'name'):
-                if monster.name in ['狼', '僵尸', '骷髅']:
-                    monster_width, monster_height = 36, 36
-                elif monster.name in ['稻草人', '鸡', '鹿']:
-                    monster_width, monster_height = 28, 28
-                else:
-                    monster_width, monster_height = 32, 32
-            else:
-                monster_width, monster_height = 32, 32
+        candidates = self.monster_index.query_radius(player_center_x, player_center_y, distance + MONSTER_QUERY_MARGIN)
+        for monster in candidates:
+            # 计算怪物中心点（尺寸取自怪物类型）
+            monster_width = monster_height = monster.monster_type.proximity_size
             
             monster_center_x = monster.x + monster_width // 2
             monster_center_y = monster.y + monster_height // 2
@@ -1335,7 +1532,7 @@ class Map:
     def get_npcs_near_player(self, player, distance=50):
         """获取靠近玩家的NPC"""
         near_npcs = []
-        for npc in self.npcs:
+        for npc in self.npc_index.query_radius(player.x, player.y, distance):
             dx = player.x - npc.x
             dy = player.y - npc.y
             dist = (dx**2 + dy**2)**0.5
@@ -1354,40 +1551,32 @@ class Map:
         Returns:
             Monster对象或None
         """
-        # 优先检测Boss怪物
-        for monster in self.monsters:
-            if not monster.is_dead():
-                # 检查是否是Boss怪物
-                is_boss = False
-                if hasattr(monster, 'name'):
-                    if '王' in monster.name or '教主' in monster.name:
-                        is_boss = True
-                
-                # 为Boss使用更大的检测距离
-                if is_boss:
-                    boss_distance = 40  # Boss使用更大的检测距离
-                    dx = x - monster.x
-                    dy = y - monster.y
-                    dist = (dx**2 + dy**2)**0.5
-                    if dist < boss_distance:
-                        return monster
-        
-        # 然后检测普通怪物
-        for monster in self.monsters:
-            if not monster.is_dead():
-                # 跳过已经检查过的Boss
-                is_boss = False
-                if hasattr(monster, 'name'):
-                    if '王' in monster.name or '教主' in monster.name:
-                        is_boss = True
-                if not is_boss:
-                    dx = x - monster.x
-                    dy = y - monster.y
-                    dist = (dx**2 + dy**2)**0.5
-                    if dist < distance:
-                        return monster
-        
-        return None
+        # 距离按怪物锚点计算，只需检查索引中附近的候选怪物
+        boss_distance = 40  # Boss使用更大的检测距离
+        candidates = self.monster_index.query_radius(x, y, max(boss_distance, distance))
+        
+        # 优先检测Boss怪物，然后检测普通怪物
+        first_normal = None
+        for monster in candidates:
+            if monster.is_dead():
+                continue
+            is_boss = monster.monster_type.is_boss
+            dx = x - monster.x
+            dy = y - monster.y
+            dist = (dx**2 + dy**2)**0.5
+            if is_boss:
+                if dist < boss_distance:
+                    return monster
+            elif first_normal is None and dist < distance:
+                first_normal = monster
+        
+        return first_normal
+    
+    def get_monsters_in_rect(self, rect):
+        """获取锚点在矩形范围内的存活怪物（世界坐标）"""
+        rect = pygame.Rect(rect)
+        return [monster for monster in self.monster_index.query_rect(rect.left, rect.top, rect.right, rect.bottom)
+                if not monster.is_dead() and rect.collidepoint(monster.x, monster.y)]
     
     def check_exit(self, player):
         """检查玩家是否进入了地图出口"""
@@ -1,45 +1,131 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 from src.map.map import Map
+from src.systems.profiler import profiler
 
 class MapManager:
     """地图管理器类"""
     
-    def __init__(self, game):
-        """初始化地图管理器"""
+    # 地图配置 {地图ID: 场景类型}，地图在首次进入时才创建
+    MAP_CONFIGS = {
+        1: '村庄',  # 默认地图
+        2: '森林',
+        3: '沙漠',
+        4: '地牢',
+        5: '雪原'
+    }
+    
+    # 后台地图每次推进的帧数（粗粒度）
+    BACKGROUND_STEP_FRAMES = 30
+    # 每帧用于推进后台地图的时间预算（毫秒）
+    BACKGROUND_BUDGET_MS = 1.0
+    
+    def __init__(self, game, prefetch=False):
+        """初始化地图管理器
+        
+        Args:
+            game: 游戏实例
+            prefetch: 是否在后台线程预先生成与当前地图相邻的地图（只做纯数据部分）
+        """
         self.game = game
+        # 已创建的地图
         self.maps = {}
         self.current_map_id = 1
-        self.initialize_maps()
+        self.player = None
+        
+        # 后台地图尚未推进的帧数 {地图ID: 帧数}
+        self.background_pending = {}
+        # 轮转推进的起点，避免总是同一张地图先用完预算
+        self._background_cursor = 0
+        
+        # 相邻地图预加载
+        self.prefetch = prefetch
+        self._prefetch_executor = None
+        self._prefetching = {}  # {地图ID: Future}
+    
+    def get_map_ids(self):
+        """获取所有地图ID（包括尚未创建的）"""
+        return sorted(self.MAP_CONFIGS)
+    
+    def get_map(self, map_id):
+        """获取地图，首次访问时创建
+        
+        Returns:
+            Map对象，地图ID不存在时返回None
+        """
+        game_map = self.maps.get(map_id)
+        if game_map is not None:
+            return game_map
+        if map_id not in self.MAP_CONFIGS:
+            return None
+        
+        future = self._prefetching.pop(map_id, None)
+        if future is not None:
+            try:
+                game_map = future.result()
+                # 素材、精灵和初始怪物在主线程完成
+                game_map.finish_loading()
+            except Exception as e:
+                print(f"预加载地图 {map_id} 失败: {e}")
+                game_map = None
+        if game_map is None:
+            game_map = self._create_map(map_id)
+        
+        self.maps[map_id] = game_map
+        self.background_pending[map_id] = 0
+        return game_map
+    
+    def _create_map(self, map_id, rng=None, defer_loading=False):
+        """创建地图"""
+        return Map(map_id=map_id, scene_type=self.MAP_CONFIGS[map_id], game=self.game,
+                   rng=rng, defer_loading=defer_loading)
     
-    def initialize_maps(self):
-        """初始化所有地图"""
-        # 创建村庄地图（默认地图）
-        self.maps[1] = Map(map_id=1, scene_type='村庄', game=self.game)
-        # 创建森林地图
-        self.maps[2] = Map(map_id=2, scene_type='森林', game=self.game)
-        # 创建沙漠地图
-        self.maps[3] = Map(map_id=3, scene_type='沙漠', game=self.game)
-        # 创建地牢地图
-        self.maps[4] = Map(map_id=4, scene_type='地牢', game=self.game)
-        # 创建雪原地图
-        self.maps[5] = Map(map_id=5, scene_type='雪原', game=self.game)
+    def prefetch_adjacent(self, map_id):
+        """在后台线程预先生成可从该地图出口到达的地图
+        
+        后台线程只生成出口、地形、NPC和索引等纯数据，不访问pygame Surface和共享缓存；
+        地形布局使用私有的随机数生成器，种子在主线程从全局random抽取，
+        不会与主线程同时使用全局random，设置了随机种子的运行仍可复现。
+        其余加载在get_map取用时由主线程调用finish_loading完成。
+        """
+        if not self.prefetch:
+            return
+        game_map = self.maps.get(map_id)
+        if game_map is None:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='map-prefetch')
+        for exit_info in game_map.exits:
+            target_id = exit_info['target_map']
+            if target_id in self.MAP_CONFIGS and target_id not in self.maps and target_id not in self._prefetching:
+                rng = random.Random(random.getrandbits(32))
+                self._prefetching[target_id] = self._prefetch_executor.submit(self._create_map, target_id, rng, True)
     
     def get_current_map(self):
         """获取当前地图"""
-        return self.maps.get(self.current_map_id)
+        return self.get_map(self.current_map_id)
     
     def switch_map(self, map_id, player_x, player_y):
         """切换地图"""
-        if map_id in self.maps:
+        if map_id in self.MAP_CONFIGS:
             # 保存当前地图的玩家引用
-            current_map = self.get_current_map()
+            current_map = self.maps.get(self.current_map_id)
             if current_map:
                 current_map.player = None
+                # 释放旧地图的预渲染缓存
+                if map_id != self.current_map_id:
+                    current_map.release_render_cache()
             
             # 切换到新地图
             self.current_map_id = map_id
             new_map = self.get_current_map()
             
+            # 一次性补齐新地图在后台欠下的时间
+            self.catch_up_map(map_id)
+            
             # 设置新地图的玩家引用
             if new_map:
                 new_map.set_player(self.game.player)
@@ -56,17 +142,24 @@ class MapManager:
                     self.game.ui.add_game_message(map_message, (255, 255, 0), 3000)
                     
                     # 显示当前地图的Boss信息
-                    current_map = self.get_current_map()
-                    if current_map:
-                        # 查找地图中的Boss
-                        boss_monsters = [monster for monster in current_map.monsters if hasattr(monster, 'name') and ('王' in monster.name or '教主' in monster.name)]
-                        for boss in boss_monsters:
-                            boss_message = f"[Boss刷新] {boss.name} 在 {current_map.scene_type} 出现了！坐标: ({int(boss.x)}, {int(boss.y)})"
-                            print(boss_message)
-                            self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
+                    self.announce_bosses(new_map)
+                
+                # 预加载相邻地图
+                self.prefetch_adjacent(map_id)
                 return True
         return False
     
+    def announce_bosses(self, game_map):
+        """在游戏内显示地图中的Boss信息"""
+        if not (hasattr(self.game, 'ui') and hasattr(self.game.ui, 'add_game_message')):
+            return
+        # 查找地图中的Boss
+        boss_monsters = [monster for monster in game_map.monsters if monster.monster_type.is_boss]
+        for boss in boss_monsters:
+            boss_message = f"[Boss刷新] {boss.name} 在 {game_map.scene_type} 出现了！坐标: ({int(boss.x)}, {int(boss.y)})"
+            print(boss_message)
+            self.game.ui.add_game_message(boss_message, (255, 0, 0), 5000)
+    
     def update(self):
         """更新当前地图"""
         current_map = self.get_current_map()
@@ -77,6 +170,47 @@ class MapManager:
             if exit_info:
                 # 切换到目标地图
                 self.switch_map(exit_info['target_map'], exit_info['target_x'], exit_info['target_y'])
+        
+        # 在时间预算内推进其他地图
+        self.update_background()
+    
+    def update_background(self):
+        """按时间预算粗粒度推进不在当前显示的地图"""
+        pending = self.background_pending
+        for map_id in pending:
+            if map_id != self.current_map_id:
+                pending[map_id] += 1
+        
+        map_ids = list(pending)
+        count = len(map_ids)
+        if not count:
+            return
+        start = time.perf_counter()
+        budget = self.BACKGROUND_BUDGET_MS / 1000
+        advanced = 0
+        for offset in range(count):
+            map_id = map_ids[(self._background_cursor + offset) % count]
+            if map_id == self.current_map_id or pending[map_id] < self.BACKGROUND_STEP_FRAMES:
+                continue
+            if time.perf_counter() - start > budget:
+                # 预算用完，下一帧从这张地图继续
+                self._background_cursor = (self._background_cursor + offset) % count
+                break
+            self.catch_up_map(map_id)
+            advanced += 1
+        else:
+            self._background_cursor = (self._background_cursor + 1) % count
+        
+        if profiler.enabled:
+            profiler.count('background_maps_advanced', advanced)
+    
+    def catch_up_map(self, map_id):
+        """把地图推进到当前时间"""
+        frames = self.background_pending.get(map_id, 0)
+        target_map = self.maps.get(map_id)
+        if frames and target_map:
+            target_map.simulate_background(frames)
+        self.background_pending[map_id] = 0
     
     def render(self, screen):
         """渲染当前地图"""
@@ -85,6 +219,15 @@ class MapManager:
             current_map.render(screen, int(self.game.camera_x), int(self.game.camera_y))
     
     def set_player(self, player):
-        """设置玩家引用到所有地图"""
-        for map in self.maps.values():
-            map.set_player(player)
\ No newline at end of file
+        """设置玩家引用（进入游戏时调用）
+        
+        只有当前地图持有玩家引用，其他地图在切换时才设置。
+        """
+        self.player = player
+        current_map = self.get_current_map()
+        if current_map:
+            current_map.set_player(player)
+            # 显示当前地图的Boss信息
+            self.announce_bosses(current_map)
+            # 预加载相邻地图
+            self.prefetch_adjacent(self.current_map_id)
\ No newline at end of file
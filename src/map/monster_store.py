@@ -0,0 +1,331 @@
+import pygame
+
+
+class MonsterArrayStore:
+    """数组化的怪物状态存储（可选，需要numpy）
+
+    把怪物的位置、刷新点、活动区域、漫游计时等字段按列存放在numpy数组中，
+    远离玩家且不在战斗中的怪物（绝大多数）由数组批量完成边界检查、回归和漫游，
+    玩家附近或处于战斗中的怪物仍交给BaseMonster.update逐个完整更新。
+    怪物对象保留为渲染和脚本使用的视图：每帧批量更新后把坐标写回对象，
+    方向只在变化时写回；漫游计时等字段在怪物转为逐个更新时才同步回对象。
+    """
+
+    FLOAT_FIELDS = ('x', 'y', 'spawn_x', 'spawn_y', 'activity_range',
+                    'area_x1', 'area_y1', 'area_x2', 'area_y2',
+                    'speed', 'wander_speed', 'aggro_range',
+                    'rect_dx', 'rect_dy', 'rect_w', 'rect_h')
+    INT_FIELDS = ('direction', 'wander_timer', 'wander_duration')
+    # owned: 漫游状态以数组为准；engaged: 处于战斗中，需要逐个更新
+    BOOL_FIELDS = ('has_area', 'owned', 'engaged')
+
+    def __init__(self, terrain_index, world_width=2400, world_height=1800, index_cell_size=128, capacity=64):
+        """初始化存储
+
+        Args:
+            terrain_index: 地形碰撞索引（TerrainCollisionIndex）
+            world_width, world_height: 地图尺寸
+            index_cell_size: 怪物空间索引的网格边长，用于判断哪些怪物需要更新索引
+            capacity: 初始容量（不足时自动翻倍）
+
+        Raises:
+            ImportError: numpy不可用
+        """
+        import numpy as np
+        self.np = np
+        self.rng = np.random.default_rng()
+        self.terrain_index = terrain_index
+        self.max_x = world_width - 32
+        self.max_y = world_height - 32
+        self.index_cell_size = index_cell_size
+
+        self.count = 0
+        self.capacity = 0
+        self.monsters = []
+        # id(怪物) -> 槽位
+        self.slots = {}
+        self._allocate(capacity)
+        self._build_terrain_mask(world_width, world_height)
+
+        self.batch_updated = 0
+        self.scalar_updated = 0
+
+    def _allocate(self, capacity):
+        """分配（或扩容）数组"""
+        np = self.np
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            if name in self.FLOAT_FIELDS:
+                array = np.zeros(capacity, dtype=np.float64)
+            elif name in self.INT_FIELDS:
+                array = np.zeros(capacity, dtype=np.int64)
+            else:
+                array = np.zeros(capacity, dtype=bool)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def _build_terrain_mask(self, world_width, world_height):
+        """按地形索引的网格生成占用表，用于批量粗筛可能撞上地形的怪物"""
+        size = self.terrain_index.cell_size
+        self.terrain_cell_size = size
+        self.terrain_mask = self.np.zeros((world_height // size + 2, world_width // size + 2), dtype=bool)
+        rows, cols = self.terrain_mask.shape
+        for cell_x, cell_y in self.terrain_index.buckets:
+            if 0 <= cell_x < cols and 0 <= cell_y < rows:
+                self.terrain_mask[cell_y, cell_x] = True
+
+    def add(self, monster):
+        """登记怪物（状态从对象读入）"""
+        if id(monster) in self.slots:
+            return
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        self.monsters.append(monster)
+        self.slots[id(monster)] = slot
+
+        self.spawn_x[slot], self.spawn_y[slot] = monster.spawn_point
+        self.activity_range[slot] = monster.activity_range
+        area = monster.activity_area
+        self.has_area[slot] = area is not None
+        if area is not None:
+            self.area_x1[slot], self.area_y1[slot] = area['x1'], area['y1']
+            self.area_x2[slot], self.area_y2[slot] = area['x2'], area['y2']
+        self.speed[slot] = monster.speed
+        self.aggro_range[slot] = monster.aggro_range
+
+        # 碰撞盒相对锚点的偏移和尺寸
+        self.rect_dx[slot], self.rect_dy[slot], self.rect_w[slot], self.rect_h[slot] = monster.monster_type.collision_box
+
+        self.engaged[slot] = bool(monster.combat_state or monster.aggro)
+        monster.array_store = self
+        if self.engaged[slot]:
+            self.x[slot], self.y[slot] = monster.x, monster.y
+            self.owned[slot] = False
+        else:
+            self.pull(monster)
+
+    def remove(self, monster):
+        """移除怪物（用最后一个槽位填补空位）"""
+        slot = self.slots.get(id(monster))
+        if slot is None:
+            return
+        # 漫游状态以数组为准时先写回对象（对象回收后复用时从对象重新读入）
+        self.push(monster)
+        del self.slots[id(monster)]
+        monster.array_store = None
+
+        last = self.count - 1
+        if slot != last:
+            for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.monsters[last]
+            self.monsters[slot] = moved
+            self.slots[id(moved)] = slot
+        self.monsters.pop()
+        self.count = last
+
+    def pull(self, monster):
+        """把对象的漫游状态读入数组，之后由数组批量更新"""
+        slot = self.slots[id(monster)]
+        self.x[slot], self.y[slot] = monster.x, monster.y
+        self.direction[slot] = monster.direction
+        self.wander_timer[slot] = monster.wander_timer
+        self.wander_duration[slot] = monster.wander_duration
+        self.wander_speed[slot] = monster.wander_speed
+        self.owned[slot] = True
+
+    def push(self, monster):
+        """把数组中的漫游状态写回对象，之后由对象逐个更新"""
+        slot = self.slots[id(monster)]
+        if self.owned[slot]:
+            monster.x, monster.y = float(self.x[slot]), float(self.y[slot])
+            monster.direction = int(self.direction[slot])
+            monster.wander_timer = int(self.wander_timer[slot])
+            monster.wander_duration = int(self.wander_duration[slot])
+            monster.wander_speed = float(self.wander_speed[slot])
+            self.owned[slot] = False
+
+    def mark_engaged(self, monster):
+        """怪物进入战斗（受到伤害或获得仇恨），转为逐个更新"""
+        slot = self.slots.get(id(monster))
+        if slot is None:
+            return
+        self.push(monster)
+        self.engaged[slot] = True
+
+    def begin_frame(self, player):
+        """开始新的一帧，返回本帧需要逐个完整更新的怪物
+
+        玩家附近（仇恨范围的1.5倍内）或处于战斗中的怪物逐个更新，状态交还给对象；
+        其余怪物的状态收回数组，由step批量更新。
+        """
+        np = self.np
+        n = self.count
+        if n == 0:
+            return []
+
+        # 逐个更新的怪物可能被外部移动（碰撞推开等），先同步坐标
+        for slot in np.flatnonzero(~self.owned[:n]).tolist():
+            monster = self.monsters[slot]
+            self.x[slot], self.y[slot] = monster.x, monster.y
+
+        dx = player.x - self.x[:n]
+        dy = player.y - self.y[:n]
+        near_distance = self.aggro_range[:n] * 1.5
+        scalar = self.engaged[:n] | (dx * dx + dy * dy <= near_distance * near_distance)
+
+        monsters = self.monsters
+        for slot in np.flatnonzero(scalar & self.owned[:n]).tolist():
+            self.push(monsters[slot])
+        for slot in np.flatnonzero(~scalar & ~self.owned[:n]).tolist():
+            self.pull(monsters[slot])
+
+        result = [monsters[slot] for slot in np.flatnonzero(scalar).tolist()]
+        self.scalar_updated = len(result)
+        return result
+
+    def end_scalar_update(self, monster):
+        """逐个更新结束后同步坐标，脱离战斗的怪物下一帧可回到批量更新"""
+        slot = self.slots.get(id(monster))
+        if slot is None:
+            return
+        self.x[slot], self.y[slot] = monster.x, monster.y
+        if not monster.combat_state and not monster.aggro:
+            self.engaged[slot] = False
+
+    def step(self):
+        """批量更新数组中的怪物一帧（与BaseMonster.update在无目标时的行为一致）
+
+        Returns:
+            list: 所在空间索引网格发生变化的怪物
+        """
+        np = self.np
+        n = self.count
+        index = np.flatnonzero(self.owned[:n])
+        self.batch_updated = len(index)
+        if not len(index):
+            return []
+
+        x = self.x[index]
+        y = self.y[index]
+        old_x, old_y = x.copy(), y.copy()
+        speed = self.speed[index]
+        has_area = self.has_area[index]
+        x1, y1 = self.area_x1[index], self.area_y1[index]
+        x2, y2 = self.area_x2[index], self.area_y2[index]
+        spawn_x, spawn_y = self.spawn_x[index], self.spawn_y[index]
+        activity_range = self.activity_range[index]
+        direction = self.direction[index]
+        old_direction = direction.copy()
+
+        # 边界检查：超出活动区域/范围时回归，接近边界时减速
+        outside_area = has_area & ((x < x1) | (x > x2) | (y < y1) | (y > y2))
+        edge_distance = np.minimum(np.minimum(x - x1, x2 - x), np.minimum(y - y1, y2 - y))
+        spawn_distance = np.hypot(x - spawn_x, y - spawn_y)
+        outside_range = ~has_area & (spawn_distance > activity_range)
+        breach = outside_area | outside_range
+        slow = np.where(has_area, edge_distance < 50, spawn_distance > activity_range * 0.8)
+        wander_speed = np.where(breach, self.wander_speed[index], np.where(slow, speed * 0.7, speed))
+
+        # 平滑回归区域中心或刷新点
+        target_x = np.where(has_area, np.floor((x1 + x2) / 2), spawn_x)
+        target_y = np.where(has_area, np.floor((y1 + y2) / 2), spawn_y)
+        return_dx = target_x - x
+        return_dy = target_y - y
+        return_distance = np.hypot(return_dx, return_dy)
+        returning = breach & (return_distance > 0)
+        safe_distance = np.where(returning, return_distance, 1)
+        move_speed = speed * 1.2
+        x = np.where(returning, x + return_dx / safe_distance * move_speed, x)
+        y = np.where(returning, y + return_dy / safe_distance * move_speed, y)
+        return_direction = np.where(np.abs(return_dx) > np.abs(return_dy),
+                                    np.where(return_dx > 0, 1, 3), np.where(return_dy > 0, 2, 0))
+        direction = np.where(returning, return_direction, direction)
+
+        # 随机漫游
+        wandering = ~breach
+        timer = self.wander_timer[index] + wandering
+        duration = self.wander_duration[index]
+        reroll = wandering & (timer >= duration)
+        reroll_count = int(reroll.sum())
+        if reroll_count:
+            direction[reroll] = self.rng.integers(0, 4, reroll_count)
+            timer[reroll] = 0
+            duration[reroll] = self.rng.integers(60, 121, reroll_count)
+        step = np.where(wandering, wander_speed, 0.0)
+        x = x + np.where(direction == 1, step, 0.0) - np.where(direction == 3, step, 0.0)
+        y = y + np.where(direction == 2, step, 0.0) - np.where(direction == 0, step, 0.0)
+
+        # 限制位置
+        np.clip(x, 0, self.max_x, out=x)
+        np.clip(y, 0, self.max_y, out=y)
+
+        # 地形阻挡：先按占用表粗筛，再逐个精确判断
+        moved = (x != old_x) | (y != old_y)
+        candidates = moved & self._may_hit_terrain(x, y, index)
+        if candidates.any():
+            collides = self.terrain_index.collides
+            rect_dx, rect_dy = self.rect_dx[index], self.rect_dy[index]
+            rect_w, rect_h = self.rect_w[index], self.rect_h[index]
+            for k in np.flatnonzero(candidates).tolist():
+                size = (rect_w[k], rect_h[k])
+                if not collides(pygame.Rect((x[k] + rect_dx[k], y[k] + rect_dy[k]), size)):
+                    continue
+                # 原位置已与地形重叠时允许继续移动，避免卡死
+                if collides(pygame.Rect((old_x[k] + rect_dx[k], old_y[k] + rect_dy[k]), size)):
+                    continue
+                x[k], y[k] = old_x[k], old_y[k]
+                direction[k] = (direction[k] + 2) % 4
+
+        self.x[index] = x
+        self.y[index] = y
+        self.direction[index] = direction
+        self.wander_timer[index] = timer
+        self.wander_duration[index] = duration
+        self.wander_speed[index] = wander_speed
+
+        # 写回对象：坐标全部写回，方向只写回变化的
+        monsters = self.monsters
+        slots = index.tolist()
+        for slot, new_x, new_y in zip(slots, x.tolist(), y.tolist()):
+            monster = monsters[slot]
+            monster.x = new_x
+            monster.y = new_y
+        turned = np.flatnonzero(direction != old_direction)
+        for k, new_direction in zip(turned.tolist(), direction[turned].tolist()):
+            monsters[slots[k]].direction = new_direction
+
+        # 所在网格变化的怪物需要更新空间索引
+        size = self.index_cell_size
+        cell_changed = ((x // size) != (old_x // size)) | ((y // size) != (old_y // size))
+        return [monsters[slots[k]] for k in np.flatnonzero(cell_changed).tolist()]
+
+    def _may_hit_terrain(self, x, y, index):
+        """碰撞盒覆盖的地形网格是否有地形（外扩1像素，覆盖取整误差）"""
+        np = self.np
+        size = self.terrain_cell_size
+        rows, cols = self.terrain_mask.shape
+        left = x + self.rect_dx[index]
+        top = y + self.rect_dy[index]
+        first_x = np.clip(((left - 1) // size).astype(np.int64), 0, cols - 1)
+        last_x = np.clip(((left + self.rect_w[index]) // size).astype(np.int64), 0, cols - 1)
+        first_y = np.clip(((top - 1) // size).astype(np.int64), 0, rows - 1)
+        last_y = np.clip(((top + self.rect_h[index]) // size).astype(np.int64), 0, rows - 1)
+        mask = self.terrain_mask
+        return mask[first_y, first_x] | mask[first_y, last_x] | mask[last_y, first_x] | mask[last_y, last_x]
+
+    def get_stats(self):
+        """获取存储统计"""
+        return {
+            'monsters': self.count,
+            'capacity': self.capacity,
+            'batch_updated': self.batch_updated,
+            'scalar_updated': self.scalar_updated
+        }
+
+    def __len__(self):
+        return self.count
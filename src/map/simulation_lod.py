@@ -0,0 +1,111 @@
+from src.core.clock import game_clock
+
+
+class SimulationLOD:
+    """怪物模拟细节层级调度
+
+    按与玩家的关系把怪物分为三档：
+    - 完整：在仇恨范围内、屏幕内或处于战斗中，每帧完整更新
+    - 降频：在屏幕外但距离不远，每隔若干帧更新一次（按帧数放大位移），按槽位错开
+    - 休眠：距离很远，不更新；重新变得相关时调用fast_forward一次性推进经过的时间
+    这样每帧的怪物AI开销只取决于玩家附近的怪物数量。
+    """
+
+    FULL = 'full'
+    REDUCED = 'reduced'
+    DORMANT = 'dormant'
+
+    def __init__(self, frame_ms=1000 / 60, reduced_interval=4, dormant_distance=1200, view_margin=64, is_blocked=None):
+        """初始化调度器
+
+        Args:
+            frame_ms: 每帧的毫秒数（用于换算休眠时长）
+            reduced_interval: 降频档的更新间隔（帧）
+            dormant_distance: 超过该距离且在屏幕外的怪物进入休眠
+            view_margin: 屏幕范围的外扩余量
+            is_blocked: 可选的判断函数 is_blocked(monster)，唤醒推进时避免把怪物放进地形
+        """
+        self.frame_ms = frame_ms
+        self.reduced_interval = reduced_interval
+        self.dormant_distance = dormant_distance
+        self.view_margin = view_margin
+        self.is_blocked = is_blocked
+        self.frame = 0
+        # id(怪物) -> 进入休眠时的游戏时间（毫秒）
+        self.dormant_since = {}
+        self._player = None
+        self._view = (0, 0, 0, 0)
+
+    def begin_frame(self, player, view_rect):
+        """开始新的一帧
+
+        Args:
+            player: 玩家
+            view_rect: 当前屏幕对应的世界坐标范围 (left, top, right, bottom)
+        """
+        self.frame += 1
+        self._player = player
+        margin = self.view_margin
+        left, top, right, bottom = view_rect
+        self._view = (left - margin, top - margin, right + margin, bottom + margin)
+
+    def get_tier(self, monster):
+        """计算怪物当前的档位"""
+        if monster.combat_state or monster.aggro:
+            return self.FULL
+
+        player = self._player
+        dx = player.x - monster.x
+        dy = player.y - monster.y
+        distance_sq = dx * dx + dy * dy
+        # 仇恨范围（含追击时的脱离距离）内需要完整AI
+        aggro_distance = monster.aggro_range * 1.5
+        if distance_sq <= aggro_distance * aggro_distance:
+            return self.FULL
+
+        left, top, right, bottom = self._view
+        if left <= monster.x <= right and top <= monster.y <= bottom:
+            return self.FULL
+
+        if distance_sq <= self.dormant_distance * self.dormant_distance:
+            return self.REDUCED
+        return self.DORMANT
+
+    def get_steps(self, monster, slot):
+        """获取怪物本帧需要推进的帧数（0表示本帧跳过）
+
+        Args:
+            monster: 怪物
+            slot: 怪物在列表中的序号（用于错开降频更新）
+        """
+        tier = self.get_tier(monster)
+        key = id(monster)
+
+        if tier == self.DORMANT:
+            if key not in self.dormant_since:
+                self.dormant_since[key] = game_clock.get_ticks()
+            return 0
+
+        # 从休眠中唤醒，推进休眠期间经过的时间
+        since = self.dormant_since.pop(key, None)
+        if since is not None:
+            monster.fast_forward((game_clock.get_ticks() - since) / self.frame_ms, self.is_blocked)
+
+        if tier == self.FULL:
+            return 1
+        interval = self.reduced_interval
+        if (self.frame + slot) % interval == 0:
+            return interval
+        return 0
+
+    def forget(self, monster):
+        """怪物移除时清理记录"""
+        self.dormant_since.pop(id(monster), None)
+
+    def get_stats(self, monsters):
+        """统计各档位的怪物数量"""
+        stats = {self.FULL: 0, self.REDUCED: 0, self.DORMANT: 0}
+        for monster in monsters:
+            if not monster.is_dead():
+                stats[self.get_tier(monster)] += 1
+        return stats
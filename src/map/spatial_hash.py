@@ -0,0 +1,115 @@
+class SpatialHash:
+    """均匀网格空间哈希
+
+    按对象锚点（通常是左上角坐标）所在的网格分桶，支持增量移动和矩形/半径/点查询。
+    查询只做网格级的粗筛，返回的候选对象需要调用方再做精确判断；
+    候选结果按插入顺序排列，与遍历原列表的顺序一致。
+    """
+
+    def __init__(self, cell_size=128):
+        """初始化空间哈希
+
+        Args:
+            cell_size: 网格边长（像素）
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        # id(对象) -> [对象, 所在网格, 插入序号]
+        self.entries = {}
+        self._next_order = 0
+
+    def _cell_of(self, x, y):
+        """计算坐标所在网格"""
+        return int(x) // self.cell_size, int(y) // self.cell_size
+
+    def insert(self, obj, x, y):
+        """插入对象（已存在时等同于move）"""
+        key = id(obj)
+        if key in self.entries:
+            self.move(obj, x, y)
+            return
+        cell = self._cell_of(x, y)
+        self.entries[key] = [obj, cell, self._next_order]
+        self._next_order += 1
+        self.cells.setdefault(cell, {})[key] = obj
+
+    def remove(self, obj):
+        """移除对象"""
+        key = id(obj)
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        bucket = self.cells.get(entry[1])
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self.cells[entry[1]]
+
+    def move(self, obj, x, y):
+        """对象移动后更新所在网格（网格未变化时几乎无开销）"""
+        key = id(obj)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.insert(obj, x, y)
+            return
+        cell = self._cell_of(x, y)
+        if cell == entry[1]:
+            return
+        bucket = self.cells.get(entry[1])
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self.cells[entry[1]]
+        self.cells.setdefault(cell, {})[key] = obj
+        entry[1] = cell
+
+    def query_rect(self, left, top, right, bottom):
+        """查询锚点可能落在矩形范围内的对象
+
+        Args:
+            left, top, right, bottom: 矩形边界（世界坐标）
+
+        Returns:
+            list: 按插入顺序排列的候选对象
+        """
+        size = self.cell_size
+        first_x, last_x = int(left) // size, int(right) // size
+        first_y, last_y = int(top) // size, int(bottom) // size
+
+        cells = self.cells
+        found = []
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(cells):
+            # 查询范围覆盖的网格比非空网格还多（例如小地图、全图查询），直接遍历非空网格
+            for (cell_x, cell_y), bucket in cells.items():
+                if first_x <= cell_x <= last_x and first_y <= cell_y <= last_y:
+                    found.extend(bucket.items())
+        else:
+            for cell_x in range(first_x, last_x + 1):
+                for cell_y in range(first_y, last_y + 1):
+                    bucket = cells.get((cell_x, cell_y))
+                    if bucket:
+                        found.extend(bucket.items())
+
+        if len(found) > 1:
+            entries = self.entries
+            found.sort(key=lambda item: entries[item[0]][2])
+        return [obj for _, obj in found]
+
+    def query_radius(self, x, y, radius):
+        """查询锚点可能落在圆形范围内的对象（按外接矩形粗筛）"""
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def query_point(self, x, y, margin=0):
+        """查询某点附近（margin范围内）的对象"""
+        return self.query_rect(x - margin, y - margin, x + margin, y + margin)
+
+    def clear(self):
+        """清空索引"""
+        self.cells.clear()
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
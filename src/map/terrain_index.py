@@ -0,0 +1,72 @@
+import pygame
+
+
+class TerrainCollisionIndex:
+    """静态地形碰撞索引
+
+    地形元素在地图加载后不再移动，所以碰撞盒只在建立索引时计算一次，
+    并按网格登记到其覆盖的每个格子中。查询时只检查目标矩形所覆盖格子里的碰撞盒。
+    """
+
+    def __init__(self, elements, half_size=16, cell_size=64):
+        """建立碰撞索引
+
+        Args:
+            elements: 地形元素列表（包含'x'、'y'中心坐标）
+            half_size: 碰撞盒半边长
+            cell_size: 网格边长（像素）
+        """
+        self.elements = list(elements)
+        self.cell_size = cell_size
+        self.rects = [
+            pygame.Rect(element['x'] - half_size, element['y'] - half_size, half_size * 2, half_size * 2)
+            for element in self.elements
+        ]
+
+        # 格子 -> 碰撞盒序号元组（序号递增，即保持元素原有顺序）
+        buckets = {}
+        for index, rect in enumerate(self.rects):
+            for cell in self._cells_of(rect):
+                buckets.setdefault(cell, []).append(index)
+        self.buckets = {cell: tuple(indices) for cell, indices in buckets.items()}
+
+    def _cells_of(self, rect):
+        """矩形覆盖的格子"""
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cell_x, cell_y
+
+    def query(self, rect):
+        """查询与矩形碰撞的地形序号
+
+        Args:
+            rect: pygame.Rect（世界坐标）
+
+        Returns:
+            list: 按元素原有顺序排列的碰撞盒序号
+        """
+        buckets = self.buckets
+        rects = self.rects
+        hits = None
+        for cell in self._cells_of(rect):
+            for index in buckets.get(cell, ()):
+                if rects[index].colliderect(rect):
+                    if hits is None:
+                        hits = {index}
+                    else:
+                        hits.add(index)
+        return sorted(hits) if hits else []
+
+    def collides(self, rect):
+        """矩形是否与任意地形碰撞"""
+        buckets = self.buckets
+        rects = self.rects
+        for cell in self._cells_of(rect):
+            for index in buckets.get(cell, ()):
+                if rects[index].colliderect(rect):
+                    return True
+        return False
+
+    def __len__(self):
+        return len(self.rects)
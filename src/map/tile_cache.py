@@ -0,0 +1,70 @@
+import pygame
+
+
+class ChunkedLayerCache:
+    """分块缓存的静态图层
+
+    把只依赖世界坐标、不会变化的图层（地面纹理、道路、道路文字等）按固定大小分块，
+    首次可见时调用绘制函数烘焙到离屏Surface，之后每帧只需少量blit。
+    """
+
+    def __init__(self, width, height, painter, chunk_size=512, background=(0, 0, 0)):
+        """初始化图层缓存
+
+        Args:
+            width: 图层宽度（世界坐标）
+            height: 图层高度（世界坐标）
+            painter: 绘制函数 painter(surface, origin_x, origin_y)，
+                     需要按世界坐标减去origin绘制
+            chunk_size: 分块边长（像素）
+            background: 视野超出图层范围时的填充色
+        """
+        self.width = width
+        self.height = height
+        self.painter = painter
+        self.chunk_size = chunk_size
+        self.background = background
+        self.chunks = {}
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """获取分块Surface，不存在时烘焙"""
+        key = (chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            origin_x = chunk_x * self.chunk_size
+            origin_y = chunk_y * self.chunk_size
+            chunk_width = min(self.chunk_size, self.width - origin_x)
+            chunk_height = min(self.chunk_size, self.height - origin_y)
+            chunk = pygame.Surface((chunk_width, chunk_height))
+            if pygame.display.get_surface() is not None:
+                chunk = chunk.convert()
+            self.painter(chunk, origin_x, origin_y)
+            self.chunks[key] = chunk
+        return chunk
+
+    def render(self, screen, camera_x, camera_y):
+        """把视野内的分块blit到屏幕"""
+        view_width, view_height = screen.get_size()
+
+        # 视野超出图层范围时先填充背景色
+        if camera_x < 0 or camera_y < 0 or camera_x + view_width > self.width or camera_y + view_height > self.height:
+            screen.fill(self.background)
+
+        size = self.chunk_size
+        first_x = max(0, camera_x // size)
+        last_x = min((self.width - 1) // size, (camera_x + view_width - 1) // size)
+        first_y = max(0, camera_y // size)
+        last_y = min((self.height - 1) // size, (camera_y + view_height - 1) // size)
+
+        for chunk_x in range(first_x, last_x + 1):
+            for chunk_y in range(first_y, last_y + 1):
+                chunk = self.get_chunk(chunk_x, chunk_y)
+                screen.blit(chunk, (chunk_x * size - camera_x, chunk_y * size - camera_y))
+
+    def clear(self):
+        """释放所有已烘焙的分块"""
+        self.chunks.clear()
+
+    def get_memory_usage(self):
+        """已烘焙分块占用的像素内存（字节）"""
+        return sum(chunk.get_width() * chunk.get_height() * chunk.get_bytesize() for chunk in self.chunks.values())
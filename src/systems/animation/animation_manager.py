@@ -1,4 +1,6 @@
 import pygame
+from src.core.clock import game_clock
+from src.systems.profiler import profiler
 from .skill_animations import FireBallAnimation, LightningAnimation, HealAnimation, SwordSlashAnimation, SummonAnimation
 
 class AnimationManager:
@@ -70,7 +72,7 @@ class AnimationManager:
     
     def update(self):
         """更新所有动画"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         active_animations = []
         
         for animation in self.animations:
@@ -91,6 +93,7 @@ class AnimationManager:
         
         self.animations = active_animations
     
+    @profiler.profile('AnimationManager.render')
     def render(self, screen, camera_offset=(0, 0)):
         """渲染所有动画"""
         for animation in self.animations:
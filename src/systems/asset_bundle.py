@@ -0,0 +1,169 @@
+"""预烘焙素材包
+
+离线把assets/sprites下的PNG按游戏中用到的尺寸缩放好，以RGBA原始像素写入一个打包文件，
+并生成JSON索引；运行时用mmap打开打包文件，按需直接从像素数据创建Surface，
+不再需要PNG解码和缩放。
+
+构建素材包：
+    python -m src.systems.asset_bundle
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+
+import pygame
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets')
+BUNDLE_DIR = os.path.join(ASSETS_DIR, 'bundle')
+BUNDLE_FILE = 'sprites.bin'
+INDEX_FILE = 'sprites.json'
+BUNDLE_VERSION = 1
+
+# 需要烘焙的目录及尺寸（None表示保持原尺寸），与游戏中的加载尺寸一致
+BAKE_SIZES = {
+    'sprites/player': [(48, 72), (50, 50)],                        # 玩家精灵、状态栏头像
+    'sprites/monster': [(24, 24), (28, 28), (30, 30), (48, 48), (60, 60)],  # 各类怪物、目标头像
+    'sprites/npc': [(32, 32)],
+    'sprites/terrain': [None]
+}
+
+
+def make_key(relative_path, size):
+    """索引键：相对assets的路径 + 尺寸"""
+    relative_path = relative_path.replace(os.sep, '/')
+    if size:
+        return f"{relative_path}@{size[0]}x{size[1]}"
+    return relative_path
+
+
+def build_bundle(assets_dir=ASSETS_DIR, output_dir=BUNDLE_DIR):
+    """构建素材包
+
+    Returns:
+        int: 写入的图片数量
+    """
+    # convert_alpha需要显示模式，离线构建时使用dummy驱动
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+    os.makedirs(output_dir, exist_ok=True)
+    entries = {}
+    offset = 0
+    with open(os.path.join(output_dir, BUNDLE_FILE), 'wb') as bundle:
+        for directory, sizes in sorted(BAKE_SIZES.items()):
+            source_dir = os.path.join(assets_dir, directory)
+            if not os.path.isdir(source_dir):
+                continue
+            for file_name in sorted(os.listdir(source_dir)):
+                if not file_name.lower().endswith('.png'):
+                    continue
+                source_path = os.path.join(source_dir, file_name)
+                relative_path = f"{directory}/{file_name}"
+                try:
+                    image = pygame.image.load(source_path).convert_alpha()
+                except Exception as e:
+                    print(f"跳过无法加载的素材: {source_path}: {e}")
+                    continue
+                stat = os.stat(source_path)
+                for size in sizes:
+                    # 与运行时相同的处理顺序：先转换像素格式再缩放
+                    scaled = pygame.transform.scale(image, size) if size else image
+                    data = pygame.image.tobytes(scaled, 'RGBA')
+                    bundle.write(data)
+                    entries[make_key(relative_path, size)] = {
+                        'offset': offset,
+                        'length': len(data),
+                        'width': scaled.get_width(),
+                        'height': scaled.get_height(),
+                        'source_mtime': stat.st_mtime,
+                        'source_size': stat.st_size
+                    }
+                    offset += len(data)
+
+    index = {'version': BUNDLE_VERSION, 'format': 'RGBA', 'entries': entries}
+    with open(os.path.join(output_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    return len(entries)
+
+
+class AssetBundle:
+    """只读素材包（mmap打开，按需创建Surface）"""
+
+    def __init__(self, bundle_dir=BUNDLE_DIR, assets_dir=ASSETS_DIR):
+        """打开素材包
+
+        Raises:
+            OSError/ValueError: 素材包不存在或格式不符
+        """
+        self.assets_dir = assets_dir
+        with open(os.path.join(bundle_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != BUNDLE_VERSION:
+            raise ValueError(f"素材包版本不符: {index.get('version')}")
+        self.entries = index['entries']
+
+        self._file = open(os.path.join(bundle_dir, BUNDLE_FILE), 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+    def get(self, path, size=None):
+        """从素材包获取图片
+
+        Args:
+            path: 图片的绝对路径（需位于assets目录下）
+            size: 目标尺寸
+
+        Returns:
+            pygame.Surface，素材包中没有或源文件已修改时返回None
+        """
+        relative_path = os.path.relpath(path, self.assets_dir)
+        if relative_path.startswith('..'):
+            return None
+        entry = self.entries.get(make_key(relative_path, tuple(size) if size else None))
+        if entry is None:
+            return None
+
+        # 源文件修改后素材包过期，回退到直接加载
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size != entry['source_size'] or stat.st_mtime != entry['source_mtime']:
+            return None
+
+        data = self._view[entry['offset']:entry['offset'] + entry['length']]
+        image = pygame.image.frombuffer(data, (entry['width'], entry['height']), 'RGBA')
+        # 复制出像素，返回的Surface不再引用mmap
+        if pygame.display.get_surface() is not None:
+            return image.convert_alpha()
+        return image.copy()
+
+    def close(self):
+        """关闭素材包"""
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def main(argv=None):
+    """构建素材包"""
+    parser = argparse.ArgumentParser(description='构建预烘焙素材包')
+    parser.add_argument('--assets', default=ASSETS_DIR, help='素材目录')
+    parser.add_argument('--output', default=BUNDLE_DIR, help='输出目录')
+    args = parser.parse_args(argv)
+
+    count = build_bundle(args.assets, args.output)
+    print(f"已写入 {count} 张图片到 {os.path.join(args.output, BUNDLE_FILE)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
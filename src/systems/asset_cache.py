@@ -0,0 +1,168 @@
+import os
+import threading
+
+import pygame
+
+
+class AssetCache:
+    """图片素材缓存
+
+    图片按(路径, 目标尺寸)只从磁盘加载和缩放一次，之后返回共享的Surface；
+    加载失败的路径也会记录下来，不再重复尝试。
+    较小的精灵可以打包进图集Surface，返回图集的子Surface，减少零散Surface的数量。
+    返回的Surface是共享的，调用方只能blit，不要修改它。
+    如果存在预烘焙素材包（见asset_bundle），优先从素材包读取已缩放好的像素，跳过PNG解码和缩放。
+    地图可能在后台线程中预加载，所以缓存的读写加锁。
+    """
+
+    # 打包进图集的精灵最大边长
+    ATLAS_MAX_SPRITE = 64
+
+    def __init__(self, use_atlas=True, atlas_size=1024, use_bundle=True):
+        """初始化素材缓存
+
+        Args:
+            use_atlas: 是否把小精灵打包进图集
+            atlas_size: 图集页的边长（像素）
+            use_bundle: 是否优先使用预烘焙素材包
+        """
+        self.use_atlas = use_atlas
+        self.atlas_size = atlas_size
+        self.use_bundle = use_bundle
+        self.images = {}
+        self.missing = set()
+        self.loads = 0
+        self.bundle_loads = 0
+        self.hits = 0
+        # 素材包在第一次加载图片时打开，None表示尚未尝试，False表示不可用
+        self._bundle = None
+        self._lock = threading.RLock()
+
+        # 图集页：[Surface, 当前行x, 当前行y, 当前行高]
+        self.atlas_pages = []
+
+    def get_image(self, path, size=None):
+        """获取图片
+
+        Args:
+            path: 图片路径
+            size: 目标尺寸 (宽, 高)，None表示保持原尺寸
+
+        Returns:
+            pygame.Surface，文件不存在或加载失败时返回None
+        """
+        key = (path, tuple(size) if size else None)
+        with self._lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.hits += 1
+                return image
+            if key in self.missing:
+                return None
+
+            image = self._load(path, size)
+            if image is None:
+                self.missing.add(key)
+                return None
+            self.images[key] = image
+            return image
+
+    def _get_bundle(self):
+        """打开预烘焙素材包（只尝试一次）"""
+        if self._bundle is None:
+            self._bundle = False
+            if self.use_bundle:
+                from src.systems.asset_bundle import AssetBundle, BUNDLE_DIR, INDEX_FILE
+                if os.path.exists(os.path.join(BUNDLE_DIR, INDEX_FILE)):
+                    try:
+                        self._bundle = AssetBundle(BUNDLE_DIR)
+                    except Exception as e:
+                        print(f"打开素材包失败: {e}")
+        return self._bundle
+
+    def _load(self, path, size):
+        """加载并缩放图片（优先从素材包读取）"""
+        bundle = self._get_bundle()
+        image = bundle.get(path, size) if bundle else None
+        if image is not None:
+            self.bundle_loads += 1
+            return self._place(image)
+
+        if not os.path.exists(path):
+            print(f"未找到素材: {path}")
+            return None
+        try:
+            image = pygame.image.load(path)
+        except Exception as e:
+            print(f"加载素材失败: {path}: {e}")
+            return None
+        self.loads += 1
+
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        return self._place(image)
+
+    def _place(self, image):
+        """较小的精灵放进图集，其余原样返回"""
+        width, height = image.get_size()
+        if self.use_atlas and max(width, height) <= self.ATLAS_MAX_SPRITE:
+            return self._pack(image)
+        return image
+
+    def _pack(self, image):
+        """把精灵放进图集，返回图集的子Surface（按行依次排放）"""
+        width, height = image.get_size()
+        for page in self.atlas_pages:
+            region = self._allocate(page, width, height)
+            if region is not None:
+                break
+        else:
+            surface = pygame.Surface((self.atlas_size, self.atlas_size), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            page = [surface, 0, 0, 0]
+            self.atlas_pages.append(page)
+            region = self._allocate(page, width, height)
+
+        atlas = page[0]
+        # 目标区域全透明，按通道取最大值即为原样复制（普通blit会按alpha混合改变颜色）
+        atlas.blit(image, region.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        return atlas.subsurface(region)
+
+    def _allocate(self, page, width, height):
+        """在图集页中分配一块区域，放不下时返回None"""
+        surface, x, y, row_height = page
+        if x + width > self.atlas_size:
+            # 换行
+            x, y, row_height = 0, y + row_height, 0
+        if y + height > self.atlas_size:
+            return None
+        page[1], page[2], page[3] = x + width, y, max(row_height, height)
+        return pygame.Rect(x, y, width, height)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self.images.clear()
+            self.missing.clear()
+            self.atlas_pages = []
+            if self._bundle:
+                self._bundle.close()
+            self._bundle = None
+
+    def get_stats(self):
+        """获取缓存统计"""
+        return {
+            'images': len(self.images),
+            'missing': len(self.missing),
+            'atlas_pages': len(self.atlas_pages),
+            'loads': self.loads,
+            'bundle_loads': self.bundle_loads,
+            'hits': self.hits
+        }
+
+
+# 创建全局素材缓存实例
+asset_cache = AssetCache()
@@ -2,6 +2,8 @@ import json
 import os
 import time
 
+from src.core.clock import game_clock
+
 class DataStorage:
     """数据存储系统"""
     
@@ -61,8 +63,7 @@ class DataStorage:
     
     def save_player_data(self, slot=1):
         """保存玩家数据到指定槽位"""
-        import pygame
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         
         player = self.game.player
         
@@ -186,8 +187,7 @@ class DataStorage:
     
     def _load_player_skills(self, player_data):
         """加载玩家技能"""
-        import pygame
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         
         player = self.game.player
         player.skills = player_data.get('skills', player.skills)
@@ -0,0 +1,123 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontCache:
+    """字体注册表与文本Surface缓存
+
+    字体按(名称, 字号)只创建一次；渲染好的文本Surface按(文本, 字体, 字号, 颜色)
+    放入LRU缓存，超出内存上限时淘汰最久未使用的条目。
+    返回的Surface是共享的，调用方只能blit，不要修改它。
+    """
+
+    # 内置字体名称
+    SYSTEM = 'system'    # 中文系统字体（依次尝试以下候选）
+    DEFAULT = 'default'  # pygame默认字体
+    SYSTEM_FONT_CANDIDATES = 'hiraginosansgb,songti,arialunicode'
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        """初始化字体缓存
+
+        Args:
+            max_bytes: 文本Surface缓存的内存上限（字节）
+        """
+        self.font_paths = {}
+        self.fonts = {}
+        self.text_cache = OrderedDict()
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def register_font(self, name, path):
+        """注册字体文件
+
+        Args:
+            name: 字体名称
+            path: 字体文件路径
+        """
+        self.font_paths[name] = path
+        # 清除该名称下已创建的字体
+        for key in [key for key in self.fonts if key[0] == name]:
+            del self.fonts[key]
+
+    def get_font(self, name=SYSTEM, size=16):
+        """获取字体对象（同名同字号只创建一次）"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self._create_font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def _create_font(self, name, size):
+        """创建字体对象"""
+        if name == self.SYSTEM:
+            try:
+                return pygame.font.SysFont(self.SYSTEM_FONT_CANDIDATES, size)
+            except Exception:
+                return pygame.font.Font(None, size)
+        if name in self.font_paths:
+            try:
+                return pygame.font.Font(self.font_paths[name], size)
+            except Exception as e:
+                print(f'字体加载失败: {e}')
+                # 加载失败后直接使用默认字体，避免重复尝试
+                del self.font_paths[name]
+        return pygame.font.Font(None, size)
+
+    def render(self, text, color, size=16, font=SYSTEM):
+        """渲染文本（抗锯齿），命中缓存时直接返回共享Surface
+
+        Args:
+            text: 文本内容
+            color: 文字颜色
+            size: 字号
+            font: 字体名称
+        """
+        key = (text, font, size, tuple(color))
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(font, size).render(text, True, color)
+        self.text_cache[key] = surface
+        self.used_bytes += self._surface_bytes(surface)
+
+        # 超出内存上限时淘汰最久未使用的文本
+        while self.used_bytes > self.max_bytes and len(self.text_cache) > 1:
+            _, old_surface = self.text_cache.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(old_surface)
+        return surface
+
+    def size(self, text, size=16, font=SYSTEM):
+        """计算文本渲染后的尺寸"""
+        return self.get_font(font, size).size(text)
+
+    def clear(self):
+        """清空文本缓存"""
+        self.text_cache.clear()
+        self.used_bytes = 0
+
+    def get_stats(self):
+        """获取缓存统计"""
+        return {
+            'fonts': len(self.fonts),
+            'texts': len(self.text_cache),
+            'bytes': self.used_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Surface占用的像素内存"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# 创建全局字体缓存实例
+font_cache = FontCache()
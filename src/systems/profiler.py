@@ -0,0 +1,246 @@
+import time
+from collections import deque
+
+import pygame
+
+
+class _ProfiledMethod:
+    """被@profiler.profile标记的方法
+
+    类创建时通过__set_name__登记到分析器，随即把原函数放回类上，
+    所以未开启分析时调用的就是原方法本身，没有任何额外开销。
+    """
+
+    def __init__(self, profiler, label, func):
+        self.profiler = profiler
+        self.label = label
+        self.func = func
+
+    def __set_name__(self, owner, name):
+        setattr(owner, name, self.func)
+        self.profiler.register(owner, name, self.label or f"{owner.__name__}.{name}")
+
+
+class Profiler:
+    """性能分析器
+
+    以“挂钩点”的方式统计各子系统每帧耗时和计数：开启时把登记过的方法替换为计时版本，
+    关闭时恢复原方法，因此挂钩点可以常驻在正式版本中。
+    """
+
+    # pygame.draw中需要统计调用次数的绘制函数
+    DRAW_FUNCTIONS = ['rect', 'circle', 'line', 'lines', 'polygon', 'ellipse', 'arc', 'aaline', 'aalines']
+
+    def __init__(self, history=120):
+        """初始化分析器
+
+        Args:
+            history: 滚动平均使用的帧数
+        """
+        self.enabled = False
+        self.show_overlay = False
+        self.history = history
+
+        # 已登记的挂钩点：(类, 方法名, 标签, 原函数)
+        self.hooks = []
+        self._draw_originals = {}
+
+        # 当前帧累计
+        self.frame_times = {}
+        self.frame_calls = {}
+        self.frame_counters = {}
+        self._frame_start = None
+
+        # 历史记录（滚动窗口）
+        self.time_history = {}
+        self.call_history = {}
+        self.counter_history = {}
+        self.frame_history = deque(maxlen=history)
+
+    def profile(self, label=None):
+        """方法装饰器：登记一个计时挂钩点
+
+        Args:
+            label: 显示名称，默认为“类名.方法名”
+        """
+        def decorator(func):
+            return _ProfiledMethod(self, label, func)
+        return decorator
+
+    def register(self, owner, name, label=None):
+        """登记类上的一个方法为计时挂钩点"""
+        func = owner.__dict__[name]
+        label = label or f"{owner.__name__}.{name}"
+        self.hooks.append((owner, name, label, func))
+        if self.enabled:
+            setattr(owner, name, self._wrap(label, func))
+
+    def register_prefix(self, owner, prefix, label_prefix=None):
+        """登记类上所有以prefix开头的方法（例如UI的render_*）"""
+        label_prefix = label_prefix or owner.__name__
+        for name in sorted(owner.__dict__):
+            if name.startswith(prefix) and callable(owner.__dict__[name]):
+                self.register(owner, name, f"{label_prefix}.{name}")
+
+    def _wrap(self, label, func):
+        """生成计时版本的方法"""
+        perf_counter = time.perf_counter
+        frame_times = self.frame_times
+        frame_calls = self.frame_calls
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                frame_times[label] = frame_times.get(label, 0.0) + (perf_counter() - start)
+                frame_calls[label] = frame_calls.get(label, 0) + 1
+
+        timed.__name__ = func.__name__
+        timed.__doc__ = func.__doc__
+        timed.__wrapped__ = func
+        return timed
+
+    def _wrap_draw(self, func):
+        """生成计数版本的pygame.draw函数"""
+        frame_counters = self.frame_counters
+
+        def counted(*args, **kwargs):
+            frame_counters['draw_calls'] = frame_counters.get('draw_calls', 0) + 1
+            return func(*args, **kwargs)
+
+        return counted
+
+    def enable(self):
+        """开启分析：安装所有挂钩点"""
+        if self.enabled:
+            return
+        self.enabled = True
+        for owner, name, label, func in self.hooks:
+            setattr(owner, name, self._wrap(label, func))
+        for name in self.DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name, None)
+            if original is not None:
+                self._draw_originals[name] = original
+                setattr(pygame.draw, name, self._wrap_draw(original))
+        self._frame_start = time.perf_counter()
+
+    def disable(self):
+        """关闭分析：恢复原方法"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, name, label, func in self.hooks:
+            setattr(owner, name, func)
+        for name, original in self._draw_originals.items():
+            setattr(pygame.draw, name, original)
+        self._draw_originals = {}
+        self._frame_start = None
+
+    def toggle_overlay(self):
+        """切换性能浮层（同时开启/关闭分析）"""
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enable()
+        else:
+            self.disable()
+
+    def count(self, name, amount=1):
+        """累加计数器（调用方应先判断profiler.enabled）"""
+        self.frame_counters[name] = self.frame_counters.get(name, 0) + amount
+
+    def add_time(self, label, seconds):
+        """手动累加一段耗时（秒）"""
+        self.frame_times[label] = self.frame_times.get(label, 0.0) + seconds
+        self.frame_calls[label] = self.frame_calls.get(label, 0) + 1
+
+    def end_frame(self):
+        """结束当前帧，把本帧统计推入滚动窗口"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_history.append((now - self._frame_start) * 1000)
+        self._frame_start = now
+
+        labels = set(self.time_history) | set(self.frame_times)
+        for label in labels:
+            if label not in self.time_history:
+                self.time_history[label] = deque(maxlen=self.history)
+                self.call_history[label] = deque(maxlen=self.history)
+            self.time_history[label].append(self.frame_times.get(label, 0.0) * 1000)
+            self.call_history[label].append(self.frame_calls.get(label, 0))
+
+        names = set(self.counter_history) | set(self.frame_counters)
+        for name in names:
+            if name not in self.counter_history:
+                self.counter_history[name] = deque(maxlen=self.history)
+            self.counter_history[name].append(self.frame_counters.get(name, 0))
+
+        self.frame_times.clear()
+        self.frame_calls.clear()
+        self.frame_counters.clear()
+
+    def reset(self):
+        """清空所有统计"""
+        self.frame_times.clear()
+        self.frame_calls.clear()
+        self.frame_counters.clear()
+        self.time_history.clear()
+        self.call_history.clear()
+        self.counter_history.clear()
+        self.frame_history.clear()
+
+    def get_stats(self):
+        """获取滚动统计
+
+        Returns:
+            dict: {'frame': {...}, 'sections': {标签: {...}}, 'counters': {名称: {...}}}
+        """
+        def summary(values):
+            if not values:
+                return {'last': 0, 'avg': 0, 'max': 0}
+            return {'last': values[-1], 'avg': sum(values) / len(values), 'max': max(values)}
+
+        sections = {}
+        for label, values in self.time_history.items():
+            stats = summary(values)
+            calls = self.call_history[label]
+            stats['calls'] = sum(calls) / len(calls) if calls else 0
+            sections[label] = stats
+
+        return {
+            'frame': summary(self.frame_history),
+            'sections': sections,
+            'counters': {name: summary(values) for name, values in self.counter_history.items()}
+        }
+
+    def report(self):
+        """生成文本报告（按平均耗时降序）"""
+        stats = self.get_stats()
+        lines = [f"frame: avg {stats['frame']['avg']:.2f}ms max {stats['frame']['max']:.2f}ms"]
+        for label, s in sorted(stats['sections'].items(), key=lambda item: -item[1]['avg']):
+            lines.append(f"{label}: avg {s['avg']:.2f}ms max {s['max']:.2f}ms calls {s['calls']:.0f}")
+        for name, s in sorted(stats['counters'].items()):
+            lines.append(f"{name}: avg {s['avg']:.0f} max {s['max']:.0f}")
+        return "\n".join(lines)
+
+    def render_overlay(self, screen, font, x=10, y=10):
+        """绘制性能浮层"""
+        if not self.show_overlay:
+            return
+        lines = self.report().split("\n")
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 20
+        height = line_height * len(lines) + 10
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        for i, line in enumerate(lines):
+            color = (255, 255, 0) if i == 0 else (200, 255, 200)
+            overlay.blit(font.render(line, True, color), (10, 5 + i * line_height))
+        screen.blit(overlay, (x, y))
+
+
+# 创建全局性能分析器实例
+profiler = Profiler()
@@ -0,0 +1,99 @@
+import os
+import threading
+
+import pygame
+
+
+class SoundBank:
+    """共享音效库
+
+    每个WAV文件只加载一次，所有实例共享同一个Sound对象；不存在或加载失败的路径会记录下来，不再重复尝试。
+    播放时按Sound统计正在播放的声道数，超过上限就不再播放，
+    避免范围技能同时击中很多怪物时叠加出大量相同的音效。
+    """
+
+    # 怪物音效类型
+    MONSTER_SOUND_TYPES = ['attack', 'hurt', 'death']
+
+    def __init__(self, max_instances=3):
+        """初始化音效库
+
+        Args:
+            max_instances: 同一音效同时播放的最大声道数
+        """
+        self.max_instances = max_instances
+        self.sounds = {}
+        self.missing = set()
+        self.monster_sounds = {}
+        self.sound_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'sounds')
+        # 地图可能在后台线程中预加载，创建怪物时会访问音效库
+        self._lock = threading.RLock()
+
+    def get_sound(self, path):
+        """获取音效（只加载一次）
+
+        Returns:
+            pygame.mixer.Sound，文件不存在、加载失败或音频不可用时返回None
+        """
+        with self._lock:
+            sound = self.sounds.get(path)
+            if sound is not None or path in self.missing:
+                return sound
+            sound = None
+            if os.path.exists(path) and pygame.mixer.get_init():
+                try:
+                    sound = pygame.mixer.Sound(path)
+                except Exception as e:
+                    print(f"加载音效失败: {path}: {e}")
+            if sound is None:
+                self.missing.add(path)
+            else:
+                self.sounds[path] = sound
+            return sound
+
+    def get_monster_sounds(self, name):
+        """获取怪物的音效表 {类型: Sound}（同名怪物共享，调用方不要修改）
+
+        优先使用怪物专属音效，没有时使用通用音效。
+        """
+        with self._lock:
+            effects = self.monster_sounds.get(name)
+            if effects is not None:
+                return effects
+            effects = {}
+            for sound_type in self.MONSTER_SOUND_TYPES:
+                monster_sound_path = os.path.join(self.sound_path, f"{name.lower().replace(' ', '_')}_{sound_type}.wav")
+                sound = self.get_sound(monster_sound_path)
+                if sound is None:
+                    sound = self.get_sound(os.path.join(self.sound_path, f"{sound_type}.wav"))
+                if sound is not None:
+                    effects[sound_type] = sound
+            self.monster_sounds[name] = effects
+            return effects
+
+    def play(self, sound, max_instances=None):
+        """播放音效，同一音效正在播放的声道数达到上限时跳过
+
+        Returns:
+            bool: 是否开始播放
+        """
+        if sound is None:
+            return False
+        limit = self.max_instances if max_instances is None else max_instances
+        try:
+            if sound.get_num_channels() >= limit:
+                return False
+            return sound.play() is not None
+        except pygame.error:
+            return False
+
+    def clear(self):
+        """清空音效库"""
+        with self._lock:
+            self.sounds.clear()
+            self.missing.clear()
+            self.monster_sounds.clear()
+
+
+# 创建全局音效库实例
+sound_bank = SoundBank()
@@ -0,0 +1,230 @@
+import os
+import threading
+
+import pygame
+
+from src.systems.sound_bank import sound_bank
+
+
+SAMPLE_RATE = 44100
+
+# 职业对应的缓存文件名
+PROFESSION_KEYS = {
+    '战士': 'warrior',
+    '法师': 'mage',
+    '道士': 'taoist'
+}
+
+
+def _attack_waveform(np, profession):
+    """普通攻击声音"""
+    sample_rate = SAMPLE_RATE
+    if profession == "战士":
+        # 战士：物理攻击，刀剑声音
+        duration = 0.2
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        # 主频率A3 + 泛音A4、E5
+        waveform1 = 0.4 * np.sin(2 * np.pi * 220 * t)
+        waveform2 = 0.2 * np.sin(2 * np.pi * 440 * t)
+        waveform3 = 0.1 * np.sin(2 * np.pi * 660 * t)
+        # 添加衰减
+        envelope = np.exp(-5 * t / duration)
+        return (waveform1 + waveform2 + waveform3) * envelope
+    elif profession == "法师":
+        # 法师：魔法攻击，正弦波A5 + 5Hz颤音
+        duration = 0.3
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        waveform = 0.3 * np.sin(2 * np.pi * 880 * t + 0.05 * np.sin(2 * np.pi * 5 * t))
+        # 添加上升和下降
+        envelope = np.zeros_like(t)
+        attack_time = int(sample_rate * 0.1)
+        release_time = int(sample_rate * 0.2)
+        envelope[:attack_time] = np.linspace(0, 1, attack_time)
+        envelope[attack_time:attack_time+release_time] = np.linspace(1, 0, release_time)
+        return waveform * envelope
+    elif profession == "道士":
+        # 道士：道术攻击，C5脉冲波
+        duration = 0.25
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        waveform = 0.3 * np.sign(np.sin(2 * np.pi * 554 * t))
+        # 添加衰减
+        return waveform * np.exp(-4 * t / duration)
+    else:
+        # 默认声音：E4
+        duration = 0.15
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        return 0.5 * np.sin(2 * np.pi * 330 * t)
+
+
+def _skill_waveform(np, profession):
+    """技能使用声音"""
+    sample_rate = SAMPLE_RATE
+    if profession == "战士":
+        # 战士技能：强力的刀剑声音，E3 + 泛音E4、B4
+        duration = 0.4
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        waveform1 = 0.5 * np.sin(2 * np.pi * 165 * t)
+        waveform2 = 0.25 * np.sin(2 * np.pi * 330 * t)
+        waveform3 = 0.1 * np.sin(2 * np.pi * 495 * t)
+        # 添加攻击和衰减
+        envelope = np.zeros_like(t)
+        attack_time = int(sample_rate * 0.1)
+        sustain_time = int(sample_rate * 0.1)
+        release_time = int(sample_rate * 0.2)
+        envelope[:attack_time] = np.linspace(0, 1, attack_time)
+        envelope[attack_time:attack_time+sustain_time] = 1
+        envelope[attack_time+sustain_time:attack_time+sustain_time+release_time] = np.linspace(1, 0, release_time)
+        return (waveform1 + waveform2 + waveform3) * envelope
+    elif profession == "法师":
+        # 法师技能：E6上升频率 + 3Hz颤音
+        duration = 0.5
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        frequency_modulation = 1320 * (1 + 0.2 * t / duration)
+        waveform = 0.3 * np.sin(2 * np.pi * frequency_modulation * t + 0.1 * np.sin(2 * np.pi * 3 * t))
+        # 添加上升和下降
+        envelope = np.zeros_like(t)
+        attack_time = int(sample_rate * 0.15)
+        release_time = int(sample_rate * 0.35)
+        envelope[:attack_time] = np.linspace(0, 1, attack_time)
+        envelope[attack_time:attack_time+release_time] = np.linspace(1, 0, release_time)
+        return waveform * envelope
+    elif profession == "道士":
+        # 道士技能：E5脉冲波 + A3共鸣
+        duration = 0.45
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        pulse_wave = 0.3 * np.sign(np.sin(2 * np.pi * 660 * t))
+        resonance = 0.1 * np.sin(2 * np.pi * 220 * t)
+        # 添加衰减
+        return (pulse_wave + resonance) * np.exp(-3 * t / duration)
+    else:
+        # 默认技能声音：A4
+        duration = 0.3
+        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        return 0.4 * np.sin(2 * np.pi * 440 * t) * np.exp(-4 * t / duration)
+
+
+class SoundSynth:
+    """程序生成的战斗音效缓存
+
+    攻击和技能音效只取决于(类型, 职业)，波形只合成一次：
+    后台线程预先计算int16采样缓冲（可选写入磁盘缓存），
+    主线程在第一次播放时才用缓冲创建Sound对象，之后直接复用。
+    numpy不可用或音频未初始化时静默跳过。
+    """
+
+    # 音效类型 -> (波形函数, 音量)
+    KINDS = {
+        'attack': (_attack_waveform, 0.3),
+        'skill': (_skill_waveform, 0.4)
+    }
+
+    def __init__(self, cache_dir=None):
+        """初始化音效合成缓存
+
+        Args:
+            cache_dir: 磁盘缓存目录，None表示不使用磁盘缓存
+        """
+        self.cache_dir = cache_dir
+        self.buffers = {}
+        self.sounds = {}
+        self.failed = set()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    @staticmethod
+    def _profession_key(profession):
+        return PROFESSION_KEYS.get(profession, 'default')
+
+    def _cache_file(self, kind, profession_key):
+        return os.path.join(self.cache_dir, f"{kind}_{profession_key}_{SAMPLE_RATE}.npy")
+
+    def _build_buffer(self, kind, profession_key, np):
+        """合成（或从磁盘缓存读取）int16采样缓冲"""
+        cache_file = self._cache_file(kind, profession_key) if self.cache_dir else None
+        if cache_file and os.path.exists(cache_file):
+            try:
+                return np.load(cache_file)
+            except Exception as e:
+                print(f"读取音效缓存失败: {e}")
+
+        profession = next((name for name, key in PROFESSION_KEYS.items() if key == profession_key), None)
+        waveform_func = self.KINDS[kind][0]
+        # 转换为16位整数
+        buffer = np.int16(waveform_func(np, profession) * 32767)
+
+        if cache_file:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(cache_file, buffer)
+            except Exception as e:
+                print(f"写入音效缓存失败: {e}")
+        return buffer
+
+    def get_buffer(self, kind, profession):
+        """获取采样缓冲（未就绪时在当前线程合成）"""
+        key = (kind, self._profession_key(profession))
+        buffer = self.buffers.get(key)
+        if buffer is not None or key in self.failed:
+            return buffer
+        try:
+            import numpy as np
+            buffer = self._build_buffer(kind, key[1], np)
+        except Exception as e:
+            print(f"合成音效失败: {e}")
+            buffer = None
+        with self._lock:
+            if buffer is None:
+                self.failed.add(key)
+            else:
+                self.buffers.setdefault(key, buffer)
+        return self.buffers.get(key)
+
+    def prebuild(self, background=True):
+        """预先合成所有音效的采样缓冲
+
+        Args:
+            background: 是否在后台线程中合成
+        """
+        if self._worker is not None:
+            return
+
+        def build_all():
+            for kind in self.KINDS:
+                for profession in list(PROFESSION_KEYS) + [None]:
+                    self.get_buffer(kind, profession)
+
+        if background:
+            self._worker = threading.Thread(target=build_all, name='sound-synth', daemon=True)
+            self._worker.start()
+        else:
+            build_all()
+
+    def get_sound(self, kind, profession):
+        """获取Sound对象（只应在主线程调用）"""
+        key = (kind, self._profession_key(profession))
+        sound = self.sounds.get(key)
+        if sound is not None or key in self.failed:
+            return sound
+        if not pygame.mixer.get_init():
+            return None
+        buffer = self.get_buffer(kind, profession)
+        if buffer is None:
+            return None
+        try:
+            sound = pygame.mixer.Sound(buffer)
+            sound.set_volume(self.KINDS[kind][1])
+        except Exception as e:
+            print(f"创建音效失败: {e}")
+            with self._lock:
+                self.failed.add(key)
+            return None
+        self.sounds[key] = sound
+        return sound
+
+    def play(self, kind, profession):
+        """播放战斗音效（同一音效同时播放的数量受音效库限制）"""
+        return sound_bank.play(self.get_sound(kind, profession))
+
+
+# 创建全局音效合成缓存实例
+sound_synth = SoundSynth()
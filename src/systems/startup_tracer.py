@@ -0,0 +1,149 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class _TimedLoader:
+    """包装模块加载器，统计exec_module耗时"""
+
+    def __init__(self, loader, tracer):
+        self.loader = loader
+        self.tracer = tracer
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.tracer.imports.append((module.__name__, (time.perf_counter() - start) * 1000))
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportTimer:
+    """放在sys.meta_path最前面的查找器：委托其他查找器找到模块，再包装其加载器"""
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self._finding = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                        spec.loader = _TimedLoader(spec.loader, self.tracer)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+
+class StartupTracer:
+    """启动耗时追踪
+
+    按阶段记录启动过程的墙钟时间（阶段可以嵌套），并在开启导入计时时记录每个模块的导入耗时。
+    未开启导入计时时只有几次perf_counter调用，可以常驻在启动流程中。
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        # (阶段名称, 开始时间ms, 耗时ms, 嵌套深度)
+        self.phases = []
+        # (里程碑名称, 距启动的时间ms)
+        self.marks = []
+        # (模块名, 耗时ms，包含其导入的子模块)
+        self.imports = []
+        self._depth = 0
+        self._import_timer = None
+
+    def elapsed_ms(self):
+        """距追踪开始的时间（毫秒）"""
+        return (time.perf_counter() - self.start_time) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """记录一个启动阶段的耗时"""
+        start = time.perf_counter()
+        entry = [name, (start - self.start_time) * 1000, 0.0, self._depth]
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry[2] = (time.perf_counter() - start) * 1000
+
+    def mark(self, name):
+        """记录一个里程碑（例如首帧菜单显示）"""
+        self.marks.append((name, self.elapsed_ms()))
+
+    def get_mark(self, name):
+        """获取里程碑时间（毫秒），不存在时返回None"""
+        for mark_name, value in self.marks:
+            if mark_name == name:
+                return value
+        return None
+
+    def enable_import_timing(self):
+        """开启模块导入计时（只统计之后首次导入的模块）"""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def disable_import_timing(self):
+        """关闭模块导入计时"""
+        if self._import_timer is not None:
+            if self._import_timer in sys.meta_path:
+                sys.meta_path.remove(self._import_timer)
+            self._import_timer = None
+
+    def to_dict(self, top_imports=30):
+        """导出追踪结果"""
+        slowest = sorted(self.imports, key=lambda item: -item[1])[:top_imports]
+        return {
+            'total_ms': self.elapsed_ms(),
+            'phases': [
+                {'name': name, 'start_ms': start, 'duration_ms': duration, 'depth': depth}
+                for name, start, duration, depth in self.phases
+            ],
+            'marks': {name: value for name, value in self.marks},
+            'imports': [{'module': name, 'duration_ms': duration} for name, duration in slowest]
+        }
+
+    def report(self, top_imports=10):
+        """生成文本报告"""
+        lines = []
+        for name, start, duration, depth in self.phases:
+            lines.append(f"{'  ' * depth}{name}: {duration:.1f}ms (at {start:.1f}ms)")
+        for name, value in self.marks:
+            lines.append(f"* {name}: {value:.1f}ms")
+        if self.imports:
+            lines.append("slowest imports (inclusive):")
+            for name, duration in sorted(self.imports, key=lambda item: -item[1])[:top_imports]:
+                lines.append(f"  {name}: {duration:.1f}ms")
+        return "\n".join(lines)
+
+    def write_json(self, path):
+        """把追踪结果写入JSON文件"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+# 创建全局启动追踪实例
+startup_tracer = StartupTracer()
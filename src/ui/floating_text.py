@@ -0,0 +1,208 @@
+import heapq
+from collections import deque
+from itertools import count, islice
+
+from src.systems.font_cache import font_cache
+
+
+class FloatingText:
+    """一条浮动文字（伤害值、掉落提示、游戏消息）
+
+    文字在创建时渲染一次，淡出通过set_alpha实现，整个生命周期复用同一个Surface。
+    对象本身由FloatingTextPool回收复用。
+    """
+
+    __slots__ = ('text', 'color', 'surface', 'x', 'y', 'start_time', 'duration', 'serial', '_key')
+
+    def blit(self, screen, pos, alpha):
+        """以指定透明度绘制"""
+        self.surface.set_alpha(max(0, int(alpha)))
+        screen.blit(self.surface, pos)
+
+
+class FloatingTextPool:
+    """浮动文字对象池
+
+    释放的条目对象和文字Surface都会保留下来复用：相同文字、颜色、字号的Surface
+    （例如反复出现的伤害数字）直接取回，不再分配新的Surface。
+    Surface是从字体缓存复制的私有副本，可以安全地修改透明度。
+    """
+
+    def __init__(self, max_free_entries=256, max_free_surfaces=128):
+        """初始化对象池
+
+        Args:
+            max_free_entries: 最多保留的空闲条目数
+            max_free_surfaces: 最多保留的空闲Surface数
+        """
+        self.max_free_entries = max_free_entries
+        self.max_free_surfaces = max_free_surfaces
+        self.free_entries = []
+        # (文字, 颜色, 字号, 字体) -> [Surface, ...]
+        self.free_surfaces = {}
+        self.free_surface_count = 0
+        self.surfaces_created = 0
+        self.surfaces_reused = 0
+        # 条目序号在整个对象池内唯一：条目被一个队列淘汰后可能被另一个队列复用，
+        # 序号不唯一时旧队列中残留的过期记录会误认复用后的条目
+        self._serials = count()
+
+    def acquire(self, text, color, size, font, x, y, start_time, duration):
+        """获取一条浮动文字
+
+        Args:
+            text: 文字内容
+            color: 文字颜色
+            size: 字号
+            font: 字体名称
+            x, y: 位置（由调用方决定是世界坐标还是屏幕坐标）
+            start_time: 开始时间（毫秒）
+            duration: 持续时间（毫秒）
+
+        Returns:
+            FloatingText
+        """
+        entry = self.free_entries.pop() if self.free_entries else FloatingText()
+        key = (text, tuple(color), size, font)
+        entry.text = text
+        entry.color = tuple(color)
+        entry.surface = self._get_surface(key)
+        entry.x = x
+        entry.y = y
+        entry.start_time = start_time
+        entry.duration = duration
+        entry.serial = None
+        entry._key = key
+        return entry
+
+    def next_serial(self):
+        """分配一个对象池内唯一的条目序号"""
+        return next(self._serials)
+    
+    def release(self, entry):
+        """回收一条浮动文字"""
+        if entry.surface is not None and self.max_free_surfaces > 0:
+            if self.free_surface_count >= self.max_free_surfaces:
+                # 淘汰最早放入的一组中的一个Surface
+                oldest_key = next(iter(self.free_surfaces))
+                surfaces = self.free_surfaces[oldest_key]
+                surfaces.pop()
+                if not surfaces:
+                    del self.free_surfaces[oldest_key]
+                self.free_surface_count -= 1
+            self.free_surfaces.setdefault(entry._key, []).append(entry.surface)
+            self.free_surface_count += 1
+        entry.surface = None
+        if len(self.free_entries) < self.max_free_entries:
+            self.free_entries.append(entry)
+
+    def _get_surface(self, key):
+        """取回空闲的Surface，没有时渲染一份私有副本"""
+        surfaces = self.free_surfaces.get(key)
+        if surfaces:
+            surface = surfaces.pop()
+            if not surfaces:
+                del self.free_surfaces[key]
+            self.free_surface_count -= 1
+            self.surfaces_reused += 1
+            return surface
+        text, color, size, font = key
+        self.surfaces_created += 1
+        return font_cache.render(text, color, size, font).copy()
+
+    def clear(self):
+        """清空对象池"""
+        self.free_entries.clear()
+        self.free_surfaces.clear()
+        self.free_surface_count = 0
+
+    def get_stats(self):
+        """获取对象池统计"""
+        return {
+            'free_entries': len(self.free_entries),
+            'free_surfaces': self.free_surface_count,
+            'surfaces_created': self.surfaces_created,
+            'surfaces_reused': self.surfaces_reused
+        }
+
+
+class FloatingTextQueue:
+    """有界的浮动文字队列
+
+    条目按加入顺序保存在环形缓冲（deque）中，超出容量时淘汰最早的条目；
+    另用按过期时间排序的小顶堆处理过期，每帧只检查堆顶，不必遍历整个队列。
+    持续时间相同的条目（伤害值、掉落提示）过期顺序与加入顺序一致，总是从队头移除；
+    持续时间不同的条目（游戏消息）也能按时移除。移除的条目回收到对象池。
+    """
+
+    def __init__(self, capacity, pool=None):
+        """初始化队列
+
+        Args:
+            capacity: 最多同时保留的条目数
+            pool: 回收条目的对象池，默认使用全局对象池
+        """
+        self.capacity = capacity
+        self.pool = pool or floating_text_pool
+        self.entries = deque()
+        # (过期时间, 序号, 条目)，条目被提前移除后其记录在出堆时跳过
+        self._expiry_heap = []
+
+    def push(self, entry):
+        """加入条目，队列已满时先淘汰最早的条目"""
+        while len(self.entries) >= self.capacity:
+            self._release(self.entries.popleft())
+        serial = self.pool.next_serial()
+        entry.serial = serial
+        self.entries.append(entry)
+        heapq.heappush(self._expiry_heap, (entry.start_time + entry.duration, serial, entry))
+        if len(self._expiry_heap) > 2 * self.capacity:
+            # 被淘汰条目的记录太多时重建堆，保证内存有界
+            self._expiry_heap = [(e.start_time + e.duration, e.serial, e) for e in self.entries]
+            heapq.heapify(self._expiry_heap)
+        return entry
+
+    def expire(self, current_time):
+        """移除已过期的条目
+
+        Returns:
+            int: 移除的条目数
+        """
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= current_time:
+            _, serial, entry = heapq.heappop(heap)
+            if entry.serial != serial:
+                # 已被淘汰（对象可能已被复用）
+                continue
+            if self.entries[0] is entry:
+                self.entries.popleft()
+            else:
+                self.entries.remove(entry)
+            self._release(entry)
+            removed += 1
+        return removed
+
+    def recent(self, count):
+        """最近加入的count个条目（按加入顺序）"""
+        return list(islice(self.entries, max(0, len(self.entries) - count), None))
+
+    def clear(self):
+        """清空队列"""
+        while self.entries:
+            self._release(self.entries.popleft())
+        self._expiry_heap.clear()
+
+    def _release(self, entry):
+        entry.serial = None
+        self.pool.release(entry)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# 创建全局浮动文字对象池实例
+floating_text_pool = FloatingTextPool()
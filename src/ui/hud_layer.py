@@ -0,0 +1,60 @@
+import pygame
+
+from src.systems.profiler import profiler
+
+
+class HudLayer:
+    """缓存的HUD图层
+
+    图层内容画在一张离屏Surface上（使用图层内的局部坐标），只有输入状态（key）变化
+    或被显式标记为脏时才重画，其余帧只需要一次blit。
+    key应为由图层用到的全部状态组成的可比较元组。
+    """
+
+    def __init__(self, name, rect, draw_func):
+        """初始化图层
+
+        Args:
+            name: 图层名称（用于性能统计）
+            rect: 图层在屏幕上的区域 (x, y, 宽, 高)
+            draw_func: 绘制函数 draw_func(surface)，在局部坐标中画出图层全部内容
+        """
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.draw_func = draw_func
+        self.surface = None
+        self.key = None
+        self.dirty = True
+        self.redraws = 0
+
+    def invalidate(self):
+        """标记为脏，下次渲染时重画"""
+        self.dirty = True
+
+    def set_rect(self, rect):
+        """修改图层区域（例如窗口大小变化），尺寸变化时重建Surface"""
+        rect = pygame.Rect(rect)
+        if rect.size != self.rect.size:
+            self.surface = None
+            self.dirty = True
+        self.rect = rect
+
+    def render(self, screen, key):
+        """把图层画到屏幕上（必要时先重画）
+
+        Args:
+            screen: 目标Surface
+            key: 当前输入状态，与上次不同时重画
+        """
+        if self.dirty or self.surface is None or key != self.key:
+            if self.surface is None:
+                self.surface = pygame.Surface(self.rect.size)
+                if pygame.display.get_surface() is not None:
+                    self.surface = self.surface.convert()
+            self.draw_func(self.surface)
+            self.key = key
+            self.dirty = False
+            self.redraws += 1
+            if profiler.enabled:
+                profiler.count('hud_redraws')
+        screen.blit(self.surface, self.rect.topleft)
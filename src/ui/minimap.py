@@ -0,0 +1,197 @@
+import weakref
+
+import pygame
+
+from src.systems.font_cache import font_cache
+from src.map.map import ROAD_X
+
+
+# 地形元素在小地图上的颜色和尺寸（世界坐标像素）
+TERRAIN_MARKS = {
+    'tree': ((20, 90, 20), 32),
+    'rock': ((110, 110, 110), 32),
+    'house': ((150, 100, 60), 64),
+    'well': ((60, 120, 200), 32),
+    'altar': ((200, 180, 80), 48)
+}
+ROAD_COLOR = (140, 120, 90)
+# 底图四周留出的边距，保证地图边缘的传送点标记完整
+BASE_MARGIN = 8
+
+
+class Minimap:
+    """小地图
+
+    地形、道路和传送点是静态的，每张地图按缩放比例只烘焙一次底图；
+    每帧只用空间索引查询小地图窗口内的怪物和NPC，画出移动的点。
+    按M键切换全地图视图，全地图同样使用缓存的底图，只遍历一次实体。
+    """
+
+    def __init__(self, scale=0.05):
+        """初始化小地图
+
+        Args:
+            scale: 小地图的缩放比例（小地图像素/世界像素）
+        """
+        self.scale = scale
+        self.full_map = False
+        # 地图 -> {缩放比例: 底图Surface}，地图对象释放后自动清除
+        self.base_images = weakref.WeakKeyDictionary()
+        self._overlay = None
+
+    def toggle_full_map(self):
+        """切换全地图视图"""
+        self.full_map = not self.full_map
+
+    def invalidate(self, game_map=None):
+        """丢弃底图缓存（不指定地图时丢弃全部）"""
+        if game_map is None:
+            self.base_images.clear()
+        else:
+            self.base_images.pop(game_map, None)
+
+    def get_base_image(self, game_map, scale):
+        """获取地图的底图（首次使用时烘焙）"""
+        images = self.base_images.get(game_map)
+        if images is None:
+            images = self.base_images[game_map] = {}
+        image = images.get(scale)
+        if image is None:
+            image = images[scale] = self._bake_base_image(game_map, scale)
+        return image
+
+    def _bake_base_image(self, game_map, scale):
+        """烘焙底图：道路、地形元素、地图边界和传送点（透明背景，原点偏移BASE_MARGIN）"""
+        width = int(game_map.width * scale) + 2 * BASE_MARGIN
+        height = int(game_map.height * scale) + 2 * BASE_MARGIN
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        def to_image(x, y):
+            return BASE_MARGIN + int(x * scale), BASE_MARGIN + int(y * scale)
+
+        # 道路
+        road_x, road_y = to_image(ROAD_X, 0)
+        pygame.draw.rect(image, ROAD_COLOR, (road_x, road_y, max(1, int(150 * scale)), int(game_map.height * scale)))
+
+        # 地形元素
+        for element in game_map.terrain_elements:
+            color, size = TERRAIN_MARKS.get(element['type'], ((90, 90, 90), 32))
+            mark_size = max(1, int(size * scale))
+            x, y = to_image(element['x'], element['y'])
+            pygame.draw.rect(image, color, (x - mark_size // 2, y - mark_size // 2, mark_size, mark_size))
+
+        # 地图边界
+        pygame.draw.rect(image, (100, 100, 100), (BASE_MARGIN, BASE_MARGIN,
+                                                   int(game_map.width * scale), int(game_map.height * scale)), 1)
+
+        # 传送点
+        for exit in game_map.exits:
+            # 计算传送点中心点
+            exit_x, exit_y = to_image(exit['x'] + exit.get('width', 50) // 2, exit['y'] + exit.get('height', 50) // 2)
+            # 绘制外圈
+            pygame.draw.circle(image, (255, 255, 0), (exit_x, exit_y), 6, 2)
+            # 绘制内圈
+            pygame.draw.circle(image, (255, 215, 0), (exit_x, exit_y), 4)
+            # 绘制中心点
+            pygame.draw.circle(image, (255, 255, 255), (exit_x, exit_y), 2)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        return image
+
+    def is_boss(self, monster):
+        """判断怪物是否为Boss（读取怪物类型描述）"""
+        return monster.monster_type.is_boss
+
+    def _draw_monster(self, screen, monster, x, y):
+        """绘制怪物点"""
+        if self.is_boss(monster):
+            # Boss怪物突出显示：外圈、内圈和特殊标识
+            pygame.draw.circle(screen, (255, 255, 0), (x, y), 6, 2)
+            pygame.draw.circle(screen, (255, 0, 0), (x, y), 4)
+            pygame.draw.circle(screen, (255, 215, 0), (x, y), 8, 1)
+        else:
+            pygame.draw.circle(screen, (0, 255, 0), (x, y), 3)
+
+    def render(self, screen, game_map, player, rect):
+        """绘制以玩家为中心的小地图内容（背景和边框由调用方绘制）
+
+        Args:
+            screen: 目标Surface
+            game_map: 当前地图
+            player: 玩家
+            rect: 小地图在屏幕上的区域
+        """
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        center_x, center_y = rect.centerx, rect.centery
+        old_clip = screen.get_clip()
+        screen.set_clip(rect.inflate(-4, -4).clip(old_clip))
+
+        # 静态底图
+        base_image = self.get_base_image(game_map, scale)
+        screen.blit(base_image, (center_x - int(player.x * scale) - BASE_MARGIN,
+                                 center_y - int(player.y * scale) - BASE_MARGIN))
+
+        # 小地图窗口对应的世界坐标范围
+        half_width = rect.width / 2 / scale
+        half_height = rect.height / 2 / scale
+        left, top = player.x - half_width, player.y - half_height
+        right, bottom = player.x + half_width, player.y + half_height
+
+        # 绘制NPC位置
+        for npc in game_map.npc_index.query_rect(left, top, right, bottom):
+            npc_x = center_x + (npc.x - player.x) * scale
+            npc_y = center_y + (npc.y - player.y) * scale
+            if rect.left < npc_x < rect.right and rect.top < npc_y < rect.bottom:
+                pygame.draw.circle(screen, (0, 0, 255), (int(npc_x), int(npc_y)), 3)
+
+        # 绘制怪物位置
+        for monster in game_map.monster_index.query_rect(left, top, right, bottom):
+            if monster.is_dead():
+                continue
+            monster_x = center_x + (monster.x - player.x) * scale
+            monster_y = center_y + (monster.y - player.y) * scale
+            if rect.left < monster_x < rect.right and rect.top < monster_y < rect.bottom:
+                self._draw_monster(screen, monster, int(monster_x), int(monster_y))
+
+        # 绘制玩家位置
+        pygame.draw.circle(screen, (255, 255, 0), (center_x, center_y), 5)
+        screen.set_clip(old_clip)
+
+    def render_full_map(self, screen, game_map, player):
+        """绘制全地图视图（覆盖在游戏画面上）"""
+        screen_width, screen_height = screen.get_size()
+        # 按屏幕大小选择缩放比例（保留四周边距）
+        scale = min((screen_width - 120) / game_map.width, (screen_height - 160) / game_map.height)
+        scale = max(0.05, int(scale * 100) / 100)
+
+        # 半透明遮罩
+        if self._overlay is None or self._overlay.get_size() != (screen_width, screen_height):
+            self._overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 180))
+            if pygame.display.get_surface() is not None:
+                self._overlay = self._overlay.convert_alpha()
+        screen.blit(self._overlay, (0, 0))
+
+        map_width = int(game_map.width * scale)
+        map_height = int(game_map.height * scale)
+        origin_x = (screen_width - map_width) // 2
+        origin_y = (screen_height - map_height) // 2 + 20
+
+        # 地图底色和静态底图
+        pygame.draw.rect(screen, game_map._get_ground_color(), (origin_x, origin_y, map_width, map_height))
+        screen.blit(self.get_base_image(game_map, scale), (origin_x - BASE_MARGIN, origin_y - BASE_MARGIN))
+
+        # 标题和提示
+        title = font_cache.render(f'地图 - {game_map.scene_type}', (255, 215, 0), 36, 'ui')
+        screen.blit(title, (screen_width // 2 - title.get_width() // 2, origin_y - title.get_height() - 10))
+        hint = font_cache.render('按M关闭', (200, 200, 200), 16, 'ui')
+        screen.blit(hint, (origin_x + map_width - hint.get_width(), origin_y + map_height + 5))
+
+        # 实体只遍历一次
+        for npc in game_map.npcs:
+            pygame.draw.circle(screen, (0, 0, 255), (origin_x + int(npc.x * scale), origin_y + int(npc.y * scale)), 3)
+        for monster in game_map.monsters:
+            if not monster.is_dead():
+                self._draw_monster(screen, monster, origin_x + int(monster.x * scale), origin_y + int(monster.y * scale))
+        pygame.draw.circle(screen, (255, 255, 0), (origin_x + int(player.x * scale), origin_y + int(player.y * scale)), 5)
@@ -2,7 +2,14 @@ import pygame
 import time
 
 from src.core.states import GameState
+from src.core.clock import game_clock
+from src.systems.profiler import profiler
+from src.systems.font_cache import font_cache
+from src.systems.asset_cache import asset_cache
 from src.entities.player import Player
+from src.ui.hud_layer import HudLayer
+from src.ui.floating_text import floating_text_pool, FloatingTextQueue
+from src.ui.minimap import Minimap
 
 
 class UI:
@@ -17,23 +24,16 @@ class UI:
         base_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
         font_path = os.path.join(base_path, 'fonts', 'NotoSansCJKsc-Regular.otf')
         
-        # 强制使用字体文件，不使用系统字体
-        try:
-            # 加载主字体
-            self.font = pygame.font.Font(font_path, 24)
-            # 加载小字体
-            self.small_font = pygame.font.Font(font_path, 16)
-            # 加载标题字体
-            self.title_font = pygame.font.Font(font_path, 48)
-            # 加载大字体（用于界面标题）
-            self.large_font = pygame.font.Font(font_path, 36)
-        except Exception as e:
-            print('字体加载失败:', e)
-            # 如果字体文件加载失败，使用默认字体
-            self.font = pygame.font.Font(None, 24)
-            self.small_font = pygame.font.Font(None, 16)
-            self.title_font = pygame.font.Font(None, 48)
-            self.large_font = pygame.font.Font(None, 36)
+        # 强制使用字体文件，不使用系统字体（加载失败时字体缓存会回退到默认字体）
+        font_cache.register_font('ui', font_path)
+        # 加载主字体
+        self.font = font_cache.get_font('ui', 24)
+        # 加载小字体
+        self.small_font = font_cache.get_font('ui', 16)
+        # 加载标题字体
+        self.title_font = font_cache.get_font('ui', 48)
+        # 加载大字体（用于界面标题）
+        self.large_font = font_cache.get_font('ui', 36)
         
         # 菜单选项
         self.menu_options = ['返回游戏', '任务状态', '背包装备', '技能天赋', '保存游戏', '退出游戏']
@@ -75,13 +75,14 @@ class UI:
         self.help_pages = ['快捷键说明', '技能系统', '物品系统', '游戏系统']  # 帮助页面
         
         # 掉落物品提示
-        self.item_drops = []
+        self.item_drops = FloatingTextQueue(32)
         
-        # 伤害值显示
-        self.damage_texts = []
+        # 伤害值显示（大量技能连发时最多保留128条）
+        self.damage_texts = FloatingTextQueue(128)
         
-        # 游戏内消息显示
-        self.game_messages = []
+        # 游戏内消息显示（最多保留10条）
+        self.game_messages = FloatingTextQueue(10)
+        self.message_version = 0  # 消息列表变化时递增，用于聊天框图层失效
         
         # 选中的怪物
         self.selected_monster = None
@@ -110,6 +111,12 @@ class UI:
         self.show_recycle = False
         self.selected_recycle_item = 0
         self.recycle_prices = {}  # 物品回收价格
+
+        # HUD缓存图层
+        self._init_hud_layers()
+
+        # 小地图
+        self.minimap = Minimap()
     
     def render_menu(self):
         """渲染菜单"""
@@ -118,7 +125,7 @@ class UI:
         
         # 绘制标题
         # 使用预加载的标题字体
-        title = self.title_font.render('传奇游戏', True, (255, 215, 0))
+        title = font_cache.render('传奇游戏', (255, 215, 0), 48, 'ui')
         title_x = self.game.width // 2 - title.get_width() // 2
         title_y = 100
         self.game.screen.blit(title, (title_x, title_y))
@@ -126,7 +133,7 @@ class UI:
         # 绘制菜单选项、职业选择或存档选择
         if self.show_class_selection:
             # 绘制职业选择
-            class_title = self.large_font.render('选择职业', True, (255, 255, 255))
+            class_title = font_cache.render('选择职业', (255, 255, 255), 36, 'ui')
             class_title_x = self.game.width // 2 - class_title.get_width() // 2
             class_title_y = 180
             self.game.screen.blit(class_title, (class_title_x, class_title_y))
@@ -134,7 +141,7 @@ class UI:
             # 绘制职业选项
             for i, class_name in enumerate(self.class_options):
                 color = (255, 255, 255) if i == self.selected_class_option else (150, 150, 150)
-                text = self.font.render(class_name, True, color)
+                text = font_cache.render(class_name, color, 24, 'ui')
                 text_x = self.game.width // 2 - text.get_width() // 2
                 text_y = 250 + i * 60
                 self.game.screen.blit(text, (text_x, text_y))
@@ -146,13 +153,13 @@ class UI:
                     desc = '高魔法伤害，远程攻击'
                 elif class_name == '道士':
                     desc = '平衡型，可治疗可召唤'
-                desc_text = self.small_font.render(desc, True, (200, 200, 200))
+                desc_text = font_cache.render(desc, (200, 200, 200), 16, 'ui')
                 desc_x = self.game.width // 2 - desc_text.get_width() // 2
                 desc_y = text_y + 25
                 self.game.screen.blit(desc_text, (desc_x, desc_y))
         elif self.show_load_selection:
             # 绘制加载存档选择
-            load_title = self.large_font.render('选择存档', True, (255, 255, 255))
+            load_title = font_cache.render('选择存档', (255, 255, 255), 36, 'ui')
             load_title_x = self.game.width // 2 - load_title.get_width() // 2
             load_title_y = 180
             self.game.screen.blit(load_title, (load_title_x, load_title_y))
@@ -165,39 +172,39 @@ class UI:
                 for i, save in enumerate(saves):
                     color = (255, 255, 255) if i == self.selected_load_slot else (150, 150, 150)
                     save_info = f"存档 {save['id']} (槽位 {save['slot']}): {save['name']} (等级 {save['level']}, {save['职业']})"
-                    text = self.font.render(save_info, True, color)
+                    text = font_cache.render(save_info, color, 24, 'ui')
                     text_x = self.game.width // 2 - text.get_width() // 2
                     text_y = 250 + i * 80
                     self.game.screen.blit(text, (text_x, text_y))
                     
                     # 存档详情
                     details = f"攻击力: {save.get('attack', 10)}, 防御力: {save.get('defense', 5)}, 魔法力: {save.get('magic', 5)}"
-                    detail_text = self.small_font.render(details, True, (200, 200, 200))
+                    detail_text = font_cache.render(details, (200, 200, 200), 16, 'ui')
                     detail_x = self.game.width // 2 - detail_text.get_width() // 2
                     detail_y = text_y + 25
                     self.game.screen.blit(detail_text, (detail_x, detail_y))
                     
                     # 更多详情
                     more_details = f"生命值: {save.get('health', 100)}, 金币: {save['gold']}, 上次保存: {time.strftime('%Y-%m-%d %H:%M', time.localtime(save['timestamp']))}"
-                    more_detail_text = self.small_font.render(more_details, True, (150, 150, 150))
+                    more_detail_text = font_cache.render(more_details, (150, 150, 150), 16, 'ui')
                     more_detail_x = self.game.width // 2 - more_detail_text.get_width() // 2
                     more_detail_y = detail_y + 20
                     self.game.screen.blit(more_detail_text, (more_detail_x, more_detail_y))
             else:
                 # 没有存档
-                no_save_text = self.font.render('没有找到存档', True, (150, 150, 150))
+                no_save_text = font_cache.render('没有找到存档', (150, 150, 150), 24, 'ui')
                 no_save_x = self.game.width // 2 - no_save_text.get_width() // 2
                 no_save_y = 250
                 self.game.screen.blit(no_save_text, (no_save_x, no_save_y))
             
             # 绘制返回选项
-            back_text = self.font.render('返回', True, (200, 200, 200))
+            back_text = font_cache.render('返回', (200, 200, 200), 24, 'ui')
             back_x = self.game.width // 2 - back_text.get_width() // 2
             back_y = 250 + max(len(saves), 1) * 40 + 20
             self.game.screen.blit(back_text, (back_x, back_y))
         elif self.show_save_selection:
             # 绘制保存存档选择
-            save_title = self.large_font.render('选择保存槽位', True, (255, 255, 255))
+            save_title = font_cache.render('选择保存槽位', (255, 255, 255), 36, 'ui')
             save_title_x = self.game.width // 2 - save_title.get_width() // 2
             save_title_y = 180
             self.game.screen.blit(save_title, (save_title_x, save_title_y))
@@ -218,13 +225,13 @@ class UI:
                 else:
                     slot_info = f"槽位 {slot}: 空"
                 
-                text = self.font.render(slot_info, True, color)
+                text = font_cache.render(slot_info, color, 24, 'ui')
                 text_x = self.game.width // 2 - text.get_width() // 2
                 text_y = 250 + i * 40
                 self.game.screen.blit(text, (text_x, text_y))
             
             # 绘制返回选项
-            back_text = self.font.render('返回', True, (200, 200, 200))
+            back_text = font_cache.render('返回', (200, 200, 200), 24, 'ui')
             back_x = self.game.width // 2 - back_text.get_width() // 2
             back_y = 250 + max_slots * 40 + 20
             self.game.screen.blit(back_text, (back_x, back_y))
@@ -239,7 +246,7 @@ class UI:
                 basic_options = ['开始游戏', '继续游戏', '退出游戏']
                 for i, option in enumerate(basic_options):
                     color = (255, 255, 255) if i == self.selected_menu_option else (150, 150, 150)
-                    text = self.font.render(option, True, color)
+                    text = font_cache.render(option, color, 24, 'ui')
                     text_x = self.game.width // 2 - text.get_width() // 2
                     text_y = 200 + i * 50
                     self.game.screen.blit(text, (text_x, text_y))
@@ -247,78 +254,167 @@ class UI:
                 # 进游戏后的菜单，显示所有选项
                 for i, option in enumerate(self.menu_options):
                     color = (255, 255, 255) if i == self.selected_menu_option else (150, 150, 150)
-                    text = self.font.render(option, True, color)
+                    text = font_cache.render(option, color, 24, 'ui')
                     text_x = self.game.width // 2 - text.get_width() // 2
                     text_y = 200 + i * 50
                     self.game.screen.blit(text, (text_x, text_y))
     
+    def _init_hud_layers(self):
+        """创建HUD图层（区域在每帧渲染时按窗口大小更新）"""
+        self.hud_layers = {
+            'consumables': HudLayer('consumables', (0, 0, 310, 50), self._draw_consumable_bar),
+            'skills': HudLayer('skills', (0, 0, 510, 50), self._draw_skill_bar),
+            'status': HudLayer('status', (0, 0, 200, 150), self._draw_status_panel),
+            'target': HudLayer('target', (0, 0, 200, 80), self._draw_target_panel),
+            'minimap': HudLayer('minimap', (0, 0, 200, 150), self._draw_minimap_frame),
+            'buttons': HudLayer('buttons', (0, 0, 180, 140), self._draw_system_buttons),
+            'chat': HudLayer('chat', (0, 0, 330, 180), self._draw_chat_box)
+        }
+
+    def invalidate_hud(self, *names):
+        """标记HUD图层需要重画（不指定名称时标记全部）"""
+        for name in names or self.hud_layers:
+            self.hud_layers[name].invalidate()
+
+    def _notify_messages_changed(self):
+        """聊天记录变化，通知聊天框图层重画"""
+        self.message_version += 1
+        self.hud_layers['chat'].invalidate()
+
     def render_game_ui(self):
-        """渲染游戏UI"""
+        """渲染游戏UI
+
+        HUD分为若干缓存图层，只有图层用到的状态变化时才重画，通常每帧只需几次blit。
+        小地图上的实体位置每帧变化，直接画在屏幕上。
+        """
         player = self.game.player
-        
-        # 左侧UI布局
+        screen = self.game.screen
+        width, height = self.game.width, self.game.height
+        layers = self.hud_layers
+
         # 左侧第一排：快捷消耗品
-        consumables_x = 20
-        consumables_y = self.game.height - 150
+        consumables = []
+        for i in range(6):
+            item_index = player.item_hotkeys.get(f'F{i+1}', -1)
+            item = None
+            if item_index >= 0 and item_index < player.item_manager.get_item_count():
+                item = player.item_manager.get_item(item_index)
+            consumables.append((item.name, item.quantity) if item else None)
+        layers['consumables'].set_rect((15, height - 155, 310, 50))
+        layers['consumables'].render(screen, tuple(consumables))
+
+        # 左侧第二行：技能快捷键
+        skills = []
+        for skill in getattr(player, 'skills', [])[:10]:
+            skills.append(skill.get('name', '未知技能') if skill.get('level', 0) > 0 else None)
+        layers['skills'].set_rect((15, height - 95, 510, 50))
+        layers['skills'].render(screen, tuple(skills))
+
+        # 上方：用户状态
+        layers['status'].set_rect((20, 20, 200, 150))
+        layers['status'].render(screen, (getattr(player, 'name', '玩家'), player.职业, self.game.level,
+                                         player.health, player.max_health))
+
+        # 上方右侧：目标怪物头像
+        if self.selected_monster and not self.selected_monster.is_dead():
+            monster = self.selected_monster
+            layers['target'].set_rect((width - 220, 20, 200, 80))
+            layers['target'].render(screen, (id(monster), monster.name, monster.health, monster.max_health))
+
+        # 上方右侧：小地图
+        minimap_x = width - 220
+        minimap_y = 120
+        minimap_width = 200
+        minimap_height = 150
+
+        # 根据当前地图类型设置小地图背景色
+        current_map = self.game.map_manager.get_current_map()
+        map_type = getattr(current_map, 'scene_type', '森林') if current_map else None
+        layers['minimap'].set_rect((minimap_x, minimap_y, minimap_width, minimap_height))
+        layers['minimap'].render(screen, map_type)
+
+        # 绘制小地图内容（静态底图 + 窗口内的怪物和NPC）
+        if current_map:
+            self.minimap.render(screen, current_map, player, (minimap_x, minimap_y, minimap_width, minimap_height))
+
+        # 右下角：系统按钮和聊天框（聊天框与按钮有重叠，后画）
+        layers['buttons'].set_rect((width - 200, height - 300, 180, 140))
+        layers['buttons'].render(screen, None)
+
+        layers['chat'].set_rect((width - 350, height - 200, 330, 180))
+        layers['chat'].render(screen, (self.message_version, self.game.gold,
+                                       self.game.experience, self.game.experience_to_next_level))
+
+        # 全地图视图覆盖在HUD之上
+        if self.minimap.full_map and current_map:
+            self.minimap.render_full_map(screen, current_map, player)
+
+    def _draw_consumable_bar(self, surface):
+        """绘制快捷消耗品栏（图层局部坐标）"""
+        player = self.game.player
+        consumables_x = 5
+        consumables_y = 5
         consumables_width = 40
         consumables_height = 40
         consumables_spacing = 10
-        
+
         # 绘制消耗品快捷栏背景
-        pygame.draw.rect(self.game.screen, (0, 0, 0), (consumables_x - 5, consumables_y - 5, 6 * (consumables_width + consumables_spacing) + 10, consumables_height + 10))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (consumables_x - 3, consumables_y - 3, 6 * (consumables_width + consumables_spacing) + 6, consumables_height + 6), 2)
-        
+        pygame.draw.rect(surface, (0, 0, 0), (consumables_x - 5, consumables_y - 5, 6 * (consumables_width + consumables_spacing) + 10, consumables_height + 10))
+        pygame.draw.rect(surface, (100, 100, 100), (consumables_x - 3, consumables_y - 3, 6 * (consumables_width + consumables_spacing) + 6, consumables_height + 6), 2)
+
         # 绘制快捷消耗品
         for i in range(6):
             hotkey = f'F{i+1}'
             item_index = player.item_hotkeys.get(hotkey, -1)
-            
+
             # 绘制消耗品格子
             item_x = consumables_x + i * (consumables_width + consumables_spacing)
-            pygame.draw.rect(self.game.screen, (50, 50, 50), (item_x, consumables_y, consumables_width, consumables_height))
-            pygame.draw.rect(self.game.screen, (100, 100, 100), (item_x, consumables_y, consumables_width, consumables_height), 1)
-            
+            pygame.draw.rect(surface, (50, 50, 50), (item_x, consumables_y, consumables_width, consumables_height))
+            pygame.draw.rect(surface, (100, 100, 100), (item_x, consumables_y, consumables_width, consumables_height), 1)
+
             # 绘制快捷键标识
-            hotkey_text = self.small_font.render(hotkey, True, (255, 215, 0))
-            self.game.screen.blit(hotkey_text, (item_x + 2, consumables_y + 2))
-            
+            hotkey_text = font_cache.render(hotkey, (255, 215, 0), 16, 'ui')
+            surface.blit(hotkey_text, (item_x + 2, consumables_y + 2))
+
             # 如果有物品，绘制物品信息
             if item_index >= 0 and item_index < player.item_manager.get_item_count():
                 item = player.item_manager.get_item(item_index)
                 if item:
                     # 绘制物品名称
                     item_name = item.name[:6]  # 截取前6个字符
-                    item_text = self.small_font.render(item_name, True, (255, 255, 255))
-                    self.game.screen.blit(item_text, (item_x + 2, consumables_y + 15))
-                    
+                    item_text = font_cache.render(item_name, (255, 255, 255), 16, 'ui')
+                    surface.blit(item_text, (item_x + 2, consumables_y + 15))
+
                     # 绘制物品数量
-                    quantity_text = self.small_font.render(f'x{item.quantity}', True, (255, 215, 0))
-                    self.game.screen.blit(quantity_text, (item_x + 2, consumables_y + 30))
-        
-        # 左侧第二行：技能快捷键
-        skills_x = 20
-        skills_y = self.game.height - 90
+                    quantity_text = font_cache.render(f'x{item.quantity}', (255, 215, 0), 16, 'ui')
+                    surface.blit(quantity_text, (item_x + 2, consumables_y + 30))
+
+    def _draw_skill_bar(self, surface):
+        """绘制技能快捷栏（图层局部坐标）"""
+        player = self.game.player
+        skills_x = 5
+        skills_y = 5
         skills_width = 40
         skills_height = 40
         skills_spacing = 10
-        
+
         # 绘制技能快捷栏背景
-        pygame.draw.rect(self.game.screen, (30, 30, 30), (skills_x - 5, skills_y - 5, 10 * (skills_width + skills_spacing) + 10, skills_height + 10))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (skills_x - 3, skills_y - 3, 10 * (skills_width + skills_spacing) + 6, skills_height + 6), 2)
-        
+        pygame.draw.rect(surface, (30, 30, 30), (skills_x - 5, skills_y - 5, 10 * (skills_width + skills_spacing) + 10, skills_height + 10))
+        pygame.draw.rect(surface, (100, 100, 100), (skills_x - 3, skills_y - 3, 10 * (skills_width + skills_spacing) + 6, skills_height + 6), 2)
+
         # 绘制技能快捷键
         for i in range(10):
             hotkey = str(i+1)
-            
+
             # 绘制技能格子
             skill_x = skills_x + i * (skills_width + skills_spacing)
-            pygame.draw.rect(self.game.screen, (50, 50, 50), (skill_x, skills_y, skills_width, skills_height))
-            pygame.draw.rect(self.game.screen, (100, 100, 100), (skill_x, skills_y, skills_width, skills_height), 1)
-            
+            pygame.draw.rect(surface, (50, 50, 50), (skill_x, skills_y, skills_width, skills_height))
+            pygame.draw.rect(surface, (100, 100, 100), (skill_x, skills_y, skills_width, skills_height), 1)
+
             # 绘制快捷键标识
-            hotkey_text = self.small_font.render(hotkey, True, (255, 215, 0))
-            self.game.screen.blit(hotkey_text, (skill_x + 2, skills_y + 2))
-            
+            hotkey_text = font_cache.render(hotkey, (255, 215, 0), 16, 'ui')
+            surface.blit(hotkey_text, (skill_x + 2, skills_y + 2))
+
             # 绘制技能信息
             if hasattr(player, 'skills') and i < len(player.skills):
                 skill = player.skills[i]
@@ -326,132 +422,130 @@ class UI:
                 if skill_level > 0:
                     # 绘制技能名称
                     skill_name = skill.get('name', '未知技能')[:6]  # 截取前6个字符
-                    skill_text = self.small_font.render(skill_name, True, (255, 255, 255))
-                    self.game.screen.blit(skill_text, (skill_x + 2, skills_y + 15))
-        
-        # 上方：用户状态
-        status_x = 20
-        status_y = 20
+                    skill_text = font_cache.render(skill_name, (255, 255, 255), 16, 'ui')
+                    surface.blit(skill_text, (skill_x + 2, skills_y + 15))
+
+    def _draw_status_panel(self, surface):
+        """绘制用户状态面板（图层局部坐标）"""
+        player = self.game.player
+        status_x = 0
+        status_y = 0
         status_width = 200
         status_height = 150
-        
+
         # 绘制用户状态背景
-        pygame.draw.rect(self.game.screen, (30, 30, 30), (status_x, status_y, status_width, status_height))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (status_x, status_y, status_width, status_height), 2)
-        
+        pygame.draw.rect(surface, (30, 30, 30), (status_x, status_y, status_width, status_height))
+        pygame.draw.rect(surface, (100, 100, 100), (status_x, status_y, status_width, status_height), 2)
+
         # 绘制玩家头像
         import os
         assets_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
         player_sprite_path = os.path.join(assets_path, 'sprites', 'player', 'player_down.png')
-        
-        try:
-            # 尝试加载玩家头像
-            player_avatar = pygame.image.load(player_sprite_path)
-            player_avatar = pygame.transform.scale(player_avatar, (50, 50))
-            self.game.screen.blit(player_avatar, (status_x + 10, status_y + 10))
-        except Exception as e:
+
+        # 尝试加载玩家头像（缓存，只加载一次）
+        player_avatar = asset_cache.get_image(player_sprite_path, (50, 50))
+        if player_avatar is not None:
+            surface.blit(player_avatar, (status_x + 10, status_y + 10))
+        else:
             # 如果加载失败，使用默认颜色块
             player_color = (255, 165, 0)  # 战士 - 橙色
             if getattr(player, '职业', '') == '法师':
                 player_color = (0, 0, 255)  # 法师 - 蓝色
             elif getattr(player, '职业', '') == '道士':
                 player_color = (0, 255, 0)  # 道士 - 绿色
-            pygame.draw.rect(self.game.screen, player_color, (status_x + 10, status_y + 10, 50, 50))
-        
+            pygame.draw.rect(surface, player_color, (status_x + 10, status_y + 10, 50, 50))
+
         # 绘制玩家信息
         player_name = getattr(player, 'name', '玩家')
-        name_text = self.small_font.render(player_name, True, (255, 255, 255))
-        self.game.screen.blit(name_text, (status_x + 70, status_y + 15))
-        
+        name_text = font_cache.render(player_name, (255, 255, 255), 16, 'ui')
+        surface.blit(name_text, (status_x + 70, status_y + 15))
+
         # 绘制职业信息
-        profession_text = self.small_font.render(f'职业: {player.职业}', True, (255, 255, 255))
-        self.game.screen.blit(profession_text, (status_x + 70, status_y + 35))
-        
+        profession_text = font_cache.render(f'职业: {player.职业}', (255, 255, 255), 16, 'ui')
+        surface.blit(profession_text, (status_x + 70, status_y + 35))
+
         # 绘制等级信息
-        level_text = self.small_font.render(f'等级: {self.game.level}', True, (255, 215, 0))
-        self.game.screen.blit(level_text, (status_x + 70, status_y + 55))
-        
+        level_text = font_cache.render(f'等级: {self.game.level}', (255, 215, 0), 16, 'ui')
+        surface.blit(level_text, (status_x + 70, status_y + 55))
+
         # 绘制血条
         health_bar_width = 180
         health_ratio = player.health / player.max_health
-        pygame.draw.rect(self.game.screen, (0, 0, 0), (status_x + 10, status_y + 70, health_bar_width + 4, 14))
-        pygame.draw.rect(self.game.screen, (100, 0, 0), (status_x + 12, status_y + 72, health_bar_width, 10))
-        pygame.draw.rect(self.game.screen, (255, 0, 0), (status_x + 12, status_y + 72, health_bar_width * health_ratio, 10))
-        health_text = self.small_font.render(f'HP: {player.health}/{player.max_health}', True, (255, 255, 255))
-        self.game.screen.blit(health_text, (status_x + 10, status_y + 85))
-        
+        pygame.draw.rect(surface, (0, 0, 0), (status_x + 10, status_y + 70, health_bar_width + 4, 14))
+        pygame.draw.rect(surface, (100, 0, 0), (status_x + 12, status_y + 72, health_bar_width, 10))
+        pygame.draw.rect(surface, (255, 0, 0), (status_x + 12, status_y + 72, health_bar_width * health_ratio, 10))
+        health_text = font_cache.render(f'HP: {player.health}/{player.max_health}', (255, 255, 255), 16, 'ui')
+        surface.blit(health_text, (status_x + 10, status_y + 85))
+
         # 绘制魔法条
         magic_bar_width = 180
         magic_ratio = 0.8  # 临时值
-        pygame.draw.rect(self.game.screen, (0, 0, 0), (status_x + 10, status_y + 100, magic_bar_width + 4, 14))
-        pygame.draw.rect(self.game.screen, (0, 0, 100), (status_x + 12, status_y + 102, magic_bar_width, 10))
-        pygame.draw.rect(self.game.screen, (0, 0, 255), (status_x + 12, status_y + 102, magic_bar_width * magic_ratio, 10))
-        magic_text = self.small_font.render(f'MP: {int(magic_ratio * 100)}/100', True, (255, 255, 255))
-        self.game.screen.blit(magic_text, (status_x + 10, status_y + 115))
-        
-        # 上方右侧：目标怪物头像
-        if self.selected_monster and not self.selected_monster.is_dead():
-            target_x = self.game.width - 220
-            target_y = 20
-            target_width = 200
-            target_height = 80
-            
-            # 绘制目标怪物背景
-            pygame.draw.rect(self.game.screen, (0, 0, 0), (target_x, target_y, target_width, target_height))
-            pygame.draw.rect(self.game.screen, (100, 100, 100), (target_x, target_y, target_width, target_height), 2)
-            
-            # 绘制怪物头像
-            import os
-            assets_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
-            
-            # 根据怪物名称选择对应的图片文件
-            monster_name = self.selected_monster.name
-            monster_image_map = {
-                '稻草人': '稻草人.png',
-                '鸡': '鸡.png',
-                '鹿': '鹿.png',
-                '狼': '狼.png',
-                '骷髅': '骷髅.png',
-                '僵尸': '僵尸.png',
-                '骷髅王': '骷髅王.png',
-                '僵尸王': '僵尸王.png',
-                '沃玛教主': '沃玛教主.png',
-                '祖玛教主': '祖玛教主.png'
-            }
-            
-            monster_image_file = monster_image_map.get(monster_name, '稻草人.png')
-            monster_sprite_path = os.path.join(assets_path, 'sprites', 'monster', monster_image_file)
-            
-            try:
-                # 尝试加载怪物头像
-                monster_avatar = pygame.image.load(monster_sprite_path)
-                monster_avatar = pygame.transform.scale(monster_avatar, (60, 60))
-                self.game.screen.blit(monster_avatar, (target_x + 10, target_y + 10))
-            except Exception as e:
-                # 如果加载失败，使用默认颜色块
-                monster_color = (255, 0, 0)
-                pygame.draw.rect(self.game.screen, monster_color, (target_x + 10, target_y + 10, 60, 60))
-            
-            # 绘制怪物信息
-            monster_name = self.selected_monster.name
-            name_text = self.small_font.render(f'目标: {monster_name}', True, (255, 255, 255))
-            self.game.screen.blit(name_text, (target_x + 80, target_y + 15))
-            
-            # 绘制怪物血条
-            health_ratio = self.selected_monster.health / self.selected_monster.max_health
-            health_bar_width = 100
-            pygame.draw.rect(self.game.screen, (0, 0, 0), (target_x + 80, target_y + 40, health_bar_width + 4, 14))
-            pygame.draw.rect(self.game.screen, (100, 0, 0), (target_x + 82, target_y + 42, health_bar_width, 10))
-            pygame.draw.rect(self.game.screen, (255, 0, 0), (target_x + 82, target_y + 42, health_bar_width * health_ratio, 10))
-            health_text = self.small_font.render(f'HP: {self.selected_monster.health}/{self.selected_monster.max_health}', True, (255, 255, 255))
-            self.game.screen.blit(health_text, (target_x + 80, target_y + 60))
-        
-        # 上方右侧：小地图
-        minimap_x = self.game.width - 220
-        minimap_y = 120
+        pygame.draw.rect(surface, (0, 0, 0), (status_x + 10, status_y + 100, magic_bar_width + 4, 14))
+        pygame.draw.rect(surface, (0, 0, 100), (status_x + 12, status_y + 102, magic_bar_width, 10))
+        pygame.draw.rect(surface, (0, 0, 255), (status_x + 12, status_y + 102, magic_bar_width * magic_ratio, 10))
+        magic_text = font_cache.render(f'MP: {int(magic_ratio * 100)}/100', (255, 255, 255), 16, 'ui')
+        surface.blit(magic_text, (status_x + 10, status_y + 115))
+
+    def _draw_target_panel(self, surface):
+        """绘制目标怪物面板（图层局部坐标）"""
+        target_x = 0
+        target_y = 0
+        target_width = 200
+        target_height = 80
+
+        # 绘制目标怪物背景
+        pygame.draw.rect(surface, (0, 0, 0), (target_x, target_y, target_width, target_height))
+        pygame.draw.rect(surface, (100, 100, 100), (target_x, target_y, target_width, target_height), 2)
+
+        # 绘制怪物头像
+        import os
+        assets_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets')
+
+        # 根据怪物名称选择对应的图片文件
+        monster_name = self.selected_monster.name
+        monster_image_map = {
+            '稻草人': '稻草人.png',
+            '鸡': '鸡.png',
+            '鹿': '鹿.png',
+            '狼': '狼.png',
+            '骷髅': '骷髅.png',
+            '僵尸': '僵尸.png',
+            '骷髅王': '骷髅王.png',
+            '僵尸王': '僵尸王.png',
+            '沃玛教主': '沃玛教主.png',
+            '祖玛教主': '祖玛教主.png'
+        }
+
+        monster_image_file = monster_image_map.get(monster_name, '稻草人.png')
+        monster_sprite_path = os.path.join(assets_path, 'sprites', 'monster', monster_image_file)
+
+        # 尝试加载怪物头像（缓存，只加载一次）
+        monster_avatar = asset_cache.get_image(monster_sprite_path, (60, 60))
+        if monster_avatar is not None:
+            surface.blit(monster_avatar, (target_x + 10, target_y + 10))
+        else:
+            # 如果加载失败，使用默认颜色块
+            monster_color = (255, 0, 0)
+            pygame.draw.rect(surface, monster_color, (target_x + 10, target_y + 10, 60, 60))
+
+        # 绘制怪物信息
+        name_text = font_cache.render(f'目标: {monster_name}', (255, 255, 255), 16, 'ui')
+        surface.blit(name_text, (target_x + 80, target_y + 15))
+
+        # 绘制怪物血条
+        health_ratio = self.selected_monster.health / self.selected_monster.max_health
+        health_bar_width = 100
+        pygame.draw.rect(surface, (0, 0, 0), (target_x + 80, target_y + 40, health_bar_width + 4, 14))
+        pygame.draw.rect(surface, (100, 0, 0), (target_x + 82, target_y + 42, health_bar_width, 10))
+        pygame.draw.rect(surface, (255, 0, 0), (target_x + 82, target_y + 42, health_bar_width * health_ratio, 10))
+        health_text = font_cache.render(f'HP: {self.selected_monster.health}/{self.selected_monster.max_health}', (255, 255, 255), 16, 'ui')
+        surface.blit(health_text, (target_x + 80, target_y + 60))
+
+    def _draw_minimap_frame(self, surface):
+        """绘制小地图背景、边框和标题（图层局部坐标）"""
         minimap_width = 200
         minimap_height = 150
-        
+
         # 根据当前地图类型设置小地图背景色
         current_map = self.game.map_manager.get_current_map()
         map_background_color = (0, 0, 0)
@@ -470,103 +564,27 @@ class UI:
                 map_background_color = (80, 140, 90)  # 村庄绿色
             else:
                 map_background_color = (80, 140, 90)  # 默认绿色
-        
+
         # 绘制小地图背景
-        pygame.draw.rect(self.game.screen, map_background_color, (minimap_x, minimap_y, minimap_width, minimap_height))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (minimap_x, minimap_y, minimap_width, minimap_height), 2)
-        
+        pygame.draw.rect(surface, map_background_color, (0, 0, minimap_width, minimap_height))
+        pygame.draw.rect(surface, (100, 100, 100), (0, 0, minimap_width, minimap_height), 2)
+
         # 绘制小地图标题
-        minimap_title = self.font.render('小地图', True, (255, 215, 0))
-        self.game.screen.blit(minimap_title, (minimap_x + 10, minimap_y + 5))
-        
-        # 绘制小地图内容
-        if hasattr(self.game, 'map_manager') and hasattr(self.game.map_manager, 'get_current_map'):
-            current_map = self.game.map_manager.get_current_map()
-            if current_map:
-                # 绘制玩家位置
-                player_x = minimap_x + minimap_width // 2
-                player_y = minimap_y + minimap_height // 2
-                pygame.draw.circle(self.game.screen, (255, 255, 0), (player_x, player_y), 5)
-                
-                # 绘制怪物位置
-                if hasattr(current_map, 'monsters'):
-                    for monster in current_map.monsters:
-                        if not monster.is_dead():
-                            # 计算怪物在小地图上的位置
-                            monster_x = minimap_x + minimap_width // 2 + (monster.x - player.x) * 0.05
-                            monster_y = minimap_y + minimap_height // 2 + (monster.y - player.y) * 0.05
-                            
-                            # 确保怪物在小地图范围内
-                            if minimap_x < monster_x < minimap_x + minimap_width and minimap_y < monster_y < minimap_y + minimap_height:
-                                # 根据怪物ID判断类型
-                                from src.core.id_manager import id_manager
-                                monster_id = id_manager.get_monster_id_by_name(monster.name)
-                                is_boss = False
-                                if monster_id:
-                                    monster_info = id_manager.get_monster_by_id(monster_id)
-                                    if monster_info and monster_info.get('type') == 'boss':
-                                        is_boss = True
-                                # 同时保留名称判断作为备份
-                                elif 'Boss' in monster.name or '王' in monster.name or '教主' in monster.name:
-                                    is_boss = True
-                                
-                                if is_boss:
-                                    # Boss怪物突出显示
-                                    monster_color = (255, 0, 0)
-                                    # 绘制Boss外圈
-                                    pygame.draw.circle(self.game.screen, (255, 255, 0), (int(monster_x), int(monster_y)), 6, 2)
-                                    # 绘制Boss内圈
-                                    pygame.draw.circle(self.game.screen, monster_color, (int(monster_x), int(monster_y)), 4)
-                                    # 绘制Boss特殊标识（闪烁效果）
-                                    pygame.draw.circle(self.game.screen, (255, 215, 0), (int(monster_x), int(monster_y)), 8, 1)
-                                else:
-                                    monster_color = (0, 255, 0)
-                                    pygame.draw.circle(self.game.screen, monster_color, (int(monster_x), int(monster_y)), 3)
-                
-                # 绘制NPC位置
-                if hasattr(current_map, 'npcs'):
-                    for npc in current_map.npcs:
-                        # 计算NPC在小地图上的位置
-                        npc_x = minimap_x + minimap_width // 2 + (npc.x - player.x) * 0.05
-                        npc_y = minimap_y + minimap_height // 2 + (npc.y - player.y) * 0.05
-                        
-                        # 确保NPC在小地图范围内
-                        if minimap_x < npc_x < minimap_x + minimap_width and minimap_y < npc_y < minimap_y + minimap_height:
-                            pygame.draw.circle(self.game.screen, (0, 0, 255), (int(npc_x), int(npc_y)), 3)
-                
-                # 绘制传送点位置
-                if hasattr(current_map, 'exits'):
-                    for exit in current_map.exits:
-                        # 计算传送点中心点
-                        exit_center_x = exit['x'] + exit.get('width', 50) // 2
-                        exit_center_y = exit['y'] + exit.get('height', 50) // 2
-                        
-                        # 计算传送点在小地图上的位置
-                        exit_x = minimap_x + minimap_width // 2 + (exit_center_x - player.x) * 0.05
-                        exit_y = minimap_y + minimap_height // 2 + (exit_center_y - player.y) * 0.05
-                        
-                        # 确保传送点在小地图范围内
-                        if minimap_x - 10 < exit_x < minimap_x + minimap_width + 10 and minimap_y - 10 < exit_y < minimap_y + minimap_height + 10:
-                            # 传送点突出显示
-                            # 绘制外圈
-                            pygame.draw.circle(self.game.screen, (255, 255, 0), (int(exit_x), int(exit_y)), 6, 2)
-                            # 绘制内圈
-                            pygame.draw.circle(self.game.screen, (255, 215, 0), (int(exit_x), int(exit_y)), 4)
-                            # 绘制中心点
-                            pygame.draw.circle(self.game.screen, (255, 255, 255), (int(exit_x), int(exit_y)), 2)
-        
-        # 右下角：系统按钮和聊天框
-        # 右下角：系统按钮
-        buttons_x = self.game.width - 200
-        buttons_y = self.game.height - 300
+        minimap_title = font_cache.render('小地图', (255, 215, 0), 24, 'ui')
+        surface.blit(minimap_title, (10, 5))
+
+    def _draw_system_buttons(self, surface):
+        """绘制系统按钮（图层局部坐标）"""
+        buttons_x = 0
+        buttons_y = 0
         buttons_width = 180
         buttons_height = 30
         buttons_spacing = 5
-        
+
         # 绘制系统按钮背景
-        pygame.draw.rect(self.game.screen, (0, 0, 0), (buttons_x, buttons_y, buttons_width, 4 * (buttons_height + buttons_spacing)))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (buttons_x, buttons_y, buttons_width, 4 * (buttons_height + buttons_spacing)), 2)
-        
+        pygame.draw.rect(surface, (0, 0, 0), (buttons_x, buttons_y, buttons_width, 4 * (buttons_height + buttons_spacing)))
+        pygame.draw.rect(surface, (100, 100, 100), (buttons_x, buttons_y, buttons_width, 4 * (buttons_height + buttons_spacing)), 2)
+
         # 系统按钮列表
         system_buttons = [
             ('用户状态', 'status'),
@@ -574,64 +592,56 @@ class UI:
             ('技能天赋', 'skills'),
             ('任务状态', 'quests')
         ]
-        
+
         # 绘制系统按钮
         for i, (text, action) in enumerate(system_buttons):
             button_y = buttons_y + i * (buttons_height + buttons_spacing)
             # 绘制按钮背景
-            pygame.draw.rect(self.game.screen, (50, 50, 50), (buttons_x, button_y, buttons_width, buttons_height))
-            pygame.draw.rect(self.game.screen, (100, 100, 100), (buttons_x, button_y, buttons_width, buttons_height), 1)
+            pygame.draw.rect(surface, (50, 50, 50), (buttons_x, button_y, buttons_width, buttons_height))
+            pygame.draw.rect(surface, (100, 100, 100), (buttons_x, button_y, buttons_width, buttons_height), 1)
             # 绘制按钮文本
-            button_text = self.small_font.render(text, True, (255, 255, 255))
+            button_text = font_cache.render(text, (255, 255, 255), 16, 'ui')
             text_x = buttons_x + (buttons_width - button_text.get_width()) // 2
             text_y = button_y + (buttons_height - button_text.get_height()) // 2
-            self.game.screen.blit(button_text, (text_x, text_y))
-        
-        # 右下角：聊天框
-        chat_x = self.game.width - 350
-        chat_y = self.game.height - 200
+            surface.blit(button_text, (text_x, text_y))
+
+    def _draw_chat_box(self, surface):
+        """绘制聊天框、金币和经验（图层局部坐标）"""
+        chat_x = 0
+        chat_y = 0
         chat_width = 330
         chat_height = 180
-        
+
         # 绘制聊天框背景
-        pygame.draw.rect(self.game.screen, (255, 255, 255), (chat_x, chat_y, chat_width, chat_height))
-        pygame.draw.rect(self.game.screen, (100, 100, 100), (chat_x, chat_y, chat_width, chat_height), 2)
-        
+        pygame.draw.rect(surface, (255, 255, 255), (chat_x, chat_y, chat_width, chat_height))
+        pygame.draw.rect(surface, (100, 100, 100), (chat_x, chat_y, chat_width, chat_height), 2)
+
         # 绘制聊天框标题
-        chat_title = self.font.render('聊天记录', True, (255, 215, 0))
-        self.game.screen.blit(chat_title, (chat_x + 10, chat_y + 5))
-        
+        chat_title = font_cache.render('聊天记录', (255, 215, 0), 24, 'ui')
+        surface.blit(chat_title, (chat_x + 10, chat_y + 5))
+
         # 绘制聊天内容
         chat_content_y = chat_y + 30
         chat_line_height = 20
-        
+
         # 显示游戏内消息和击杀记录
-        for i, message in enumerate(self.game_messages[-8:]):  # 显示最近8条消息
-            text = message.get('message', '')
-            color = message.get('color', (255, 255, 255))
-            message_text = self.small_font.render(text, True, color)
-            self.game.screen.blit(message_text, (chat_x + 10, chat_content_y + i * chat_line_height))
-        
+        for i, message in enumerate(self.game_messages.recent(8)):  # 显示最近8条消息
+            message_text = font_cache.render(message.text, message.color, 16, 'ui')
+            surface.blit(message_text, (chat_x + 10, chat_content_y + i * chat_line_height))
+
         # 绘制金币和经验信息
-        gold_text = self.small_font.render(f'金币: {self.game.gold}', True, (255, 215, 0))
-        self.game.screen.blit(gold_text, (chat_x + 10, chat_y + chat_height - 40))
-        
+        gold_text = font_cache.render(f'金币: {self.game.gold}', (255, 215, 0), 16, 'ui')
+        surface.blit(gold_text, (chat_x + 10, chat_y + chat_height - 40))
+
         exp_ratio = self.game.experience / self.game.experience_to_next_level
-        exp_text = self.small_font.render(f'经验: {self.game.experience}/{self.game.experience_to_next_level}', True, (255, 255, 255))
-        self.game.screen.blit(exp_text, (chat_x + 10, chat_y + chat_height - 20))
-        
+        exp_text = font_cache.render(f'经验: {self.game.experience}/{self.game.experience_to_next_level}', (255, 255, 255), 16, 'ui')
+        surface.blit(exp_text, (chat_x + 10, chat_y + chat_height - 20))
+
         # 绘制经验条
         exp_bar_width = 260
-        pygame.draw.rect(self.game.screen, (0, 0, 0), (chat_x + 10, chat_y + chat_height - 15, exp_bar_width + 4, 10))
-        pygame.draw.rect(self.game.screen, (100, 100, 0), (chat_x + 12, chat_y + chat_height - 13, exp_bar_width, 6))
-        pygame.draw.rect(self.game.screen, (255, 215, 0), (chat_x + 12, chat_y + chat_height - 13, exp_bar_width * exp_ratio, 6))
-
-        
-
-        
-
-        
-
+        pygame.draw.rect(surface, (0, 0, 0), (chat_x + 10, chat_y + chat_height - 15, exp_bar_width + 4, 10))
+        pygame.draw.rect(surface, (100, 100, 0), (chat_x + 12, chat_y + chat_height - 13, exp_bar_width, 6))
+        pygame.draw.rect(surface, (255, 215, 0), (chat_x + 12, chat_y + chat_height - 13, exp_bar_width * exp_ratio, 6))
     
     def render_battle(self):
         """渲染战斗界面"""
@@ -640,13 +650,13 @@ class UI:
         
         # 绘制战斗信息
         # 使用预加载的大字体
-        battle_text = self.large_font.render('战斗', True, (255, 255, 255))
+        battle_text = font_cache.render('战斗', (255, 255, 255), 36, 'ui')
         self.game.screen.blit(battle_text, (self.game.width // 2 - battle_text.get_width() // 2, 50))
         
         # 绘制战斗选项
         for i, option in enumerate(self.battle_options):
             color = (255, 255, 255) if i == self.selected_battle_option else (150, 150, 150)
-            text = self.font.render(option, True, color)
+            text = font_cache.render(option, color, 24, 'ui')
             self.game.screen.blit(text, (self.game.width // 2 - text.get_width() // 2, 200 + i * 50))
     
     def render_shop(self):
@@ -656,17 +666,17 @@ class UI:
         
         # 绘制商店标题
         # 使用预加载的大字体
-        shop_text = self.large_font.render('商店', True, (255, 215, 0))
+        shop_text = font_cache.render('商店', (255, 215, 0), 36, 'ui')
         self.game.screen.blit(shop_text, (self.game.width // 2 - shop_text.get_width() // 2, 50))
         
         # 绘制商店物品
         for i, item in enumerate(self.current_shop_items):
             color = (255, 255, 255) if i == self.selected_shop_item else (150, 150, 150)
-            item_text = self.font.render(f'{item["name"]} - {item["price"]}金币', True, color)
+            item_text = font_cache.render(f'{item["name"]} - {item["price"]}金币', color, 24, 'ui')
             self.game.screen.blit(item_text, (self.game.width // 2 - item_text.get_width() // 2, 150 + i * 40))
         
         # 绘制金币数量
-        gold_text = self.font.render(f'金币: {self.game.gold}', True, (255, 215, 0))
+        gold_text = font_cache.render(f'金币: {self.game.gold}', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(gold_text, (10, 10))
     
     def render_dialogue(self):
@@ -677,11 +687,11 @@ class UI:
         pygame.draw.rect(self.game.screen, (255, 255, 255), dialogue_box, 2)
         
         # 绘制对话
-        dialogue_text = self.font.render(self.current_dialogue, True, (255, 255, 255))
+        dialogue_text = font_cache.render(self.current_dialogue, (255, 255, 255), 24, 'ui')
         self.game.screen.blit(dialogue_text, (70, self.game.height - 120))
         
         # 绘制提示
-        prompt_text = self.small_font.render('按任意键继续...', True, (150, 150, 150))
+        prompt_text = font_cache.render('按任意键继续...', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width - 150, self.game.height - 40))
     
     def handle_menu_events(self, event):
@@ -1021,16 +1031,10 @@ class UI:
             color: 消息颜色
             duration: 消息持续时间（毫秒）
         """
-        self.game_messages.append({
-            'message': message,
-            'color': color,
-            'duration': duration,
-            'start_time': pygame.time.get_ticks()
-        })
-        
-        # 限制消息数量
-        if len(self.game_messages) > 10:
-            self.game_messages.pop(0)
+        # 超出数量上限时队列会淘汰最早的消息
+        self.game_messages.push(floating_text_pool.acquire(
+            message, color, 24, 'ui', 0, 0, game_clock.get_ticks(), duration))
+        self._notify_messages_changed()
     
     def render_inventory(self):
         """渲染背包界面（整合装备系统）"""
@@ -1039,7 +1043,7 @@ class UI:
         
         # 绘制标题
         # 使用预加载的大字体
-        inventory_text = self.large_font.render('背包装备', True, (255, 255, 255))
+        inventory_text = font_cache.render('背包装备', (255, 255, 255), 36, 'ui')
         self.game.screen.blit(inventory_text, (self.game.width // 2 - inventory_text.get_width() // 2, 50))
         
         player = self.game.player
@@ -1055,7 +1059,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (equipment_x, equipment_y, equipment_width, equipment_height), 2)
         
         # 装备栏标题
-        equipment_title = self.font.render('装备栏', True, (255, 215, 0))
+        equipment_title = font_cache.render('装备栏', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(equipment_title, (equipment_x + 10, equipment_y + 10))
         
         # 装备位置
@@ -1073,26 +1077,26 @@ class UI:
             pygame.draw.rect(self.game.screen, (100, 100, 100), (slot_x - 45, slot_y - 35, 90, 70), 2)
             
             # 装备槽名称
-            slot_text = self.small_font.render(slot_name, True, (255, 255, 255))
+            slot_text = font_cache.render(slot_name, (255, 255, 255), 16, 'ui')
             self.game.screen.blit(slot_text, (slot_x - 20, slot_y - 25))
             
             # 显示当前装备
             equipped_item = player.equipment_manager.get_equipped_item(slot_type)
             if equipped_item:
                 # 装备名称
-                item_text = self.small_font.render(equipped_item.name, True, (0, 255, 0))
+                item_text = font_cache.render(equipped_item.name, (0, 255, 0), 16, 'ui')
                 self.game.screen.blit(item_text, (slot_x - 40, slot_y))
                 
                 # 装备属性
                 if equipped_item.attack > 0:
-                    attr_text = self.small_font.render(f'攻击+{equipped_item.attack}', True, (255, 0, 0))
+                    attr_text = font_cache.render(f'攻击+{equipped_item.attack}', (255, 0, 0), 16, 'ui')
                     self.game.screen.blit(attr_text, (slot_x - 40, slot_y + 20))
                 if equipped_item.defense > 0:
-                    attr_text = self.small_font.render(f'防御+{equipped_item.defense}', True, (0, 255, 0))
+                    attr_text = font_cache.render(f'防御+{equipped_item.defense}', (0, 255, 0), 16, 'ui')
                     self.game.screen.blit(attr_text, (slot_x - 40, slot_y + 20))
             else:
                 # 空装备槽
-                empty_text = self.small_font.render('未装备', True, (100, 100, 100))
+                empty_text = font_cache.render('未装备', (100, 100, 100), 16, 'ui')
                 self.game.screen.blit(empty_text, (slot_x - 20, slot_y))
         
         # 绘制物品栏
@@ -1106,7 +1110,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (inventory_x, inventory_y, inventory_width, inventory_height), 2)
         
         # 物品栏标题
-        inventory_title = self.font.render('物品栏', True, (255, 215, 0))
+        inventory_title = font_cache.render('物品栏', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(inventory_title, (inventory_x + 10, inventory_y + 10))
         
         # 绘制物品
@@ -1128,19 +1132,19 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (item_x, item_y, item_width, item_height), 1)
             
             # 物品名称
-            item_name = self.small_font.render(item.name, True, (255, 255, 255))
+            item_name = font_cache.render(item.name, (255, 255, 255), 16, 'ui')
             self.game.screen.blit(item_name, (item_x + 5, item_y + 5))
             
             # 物品数量
-            quantity_text = self.small_font.render(f'x{item.quantity}', True, (255, 215, 0))
+            quantity_text = font_cache.render(f'x{item.quantity}', (255, 215, 0), 16, 'ui')
             self.game.screen.blit(quantity_text, (item_x + 5, item_y + 30))
             
             # 物品属性
             if item.attack > 0:
-                attack_text = self.small_font.render(f'攻击+{item.attack}', True, (255, 0, 0))
+                attack_text = font_cache.render(f'攻击+{item.attack}', (255, 0, 0), 16, 'ui')
                 self.game.screen.blit(attack_text, (item_x + 5, item_y + 45))
             if item.defense > 0:
-                defense_text = self.small_font.render(f'防御+{item.defense}', True, (0, 255, 0))
+                defense_text = font_cache.render(f'防御+{item.defense}', (0, 255, 0), 16, 'ui')
                 self.game.screen.blit(defense_text, (item_x + 60, item_y + 45))
             
             # 物品类型说明
@@ -1153,13 +1157,13 @@ class UI:
                 'consumable': '消耗品',
                 'material': '材料'
             }.get(item_type, '材料')
-            type_text = self.small_font.render(f'{type_description}', True, (200, 200, 200))
+            type_text = font_cache.render(f'{type_description}', (200, 200, 200), 16, 'ui')
             self.game.screen.blit(type_text, (item_x + 5, item_y + 60))
             
             # 显示物品快捷键
             if hasattr(self.game.player, 'hotkey_items') and i in self.game.player.hotkey_items:
                 hotkey = self.game.player.hotkey_items[i]
-                hotkey_text = self.small_font.render(f'快捷键: {hotkey}', True, (255, 215, 0))
+                hotkey_text = font_cache.render(f'快捷键: {hotkey}', (255, 215, 0), 16, 'ui')
                 self.game.screen.blit(hotkey_text, (item_x + 5, item_y + 75))
         
         # 绘制选中物品的详细说明
@@ -1191,19 +1195,19 @@ class UI:
                 '腐烂的肉': '任务材料，用于制作或兑换物品'
             }.get(item_name, selected_item.description)
             
-            description_text = self.small_font.render(f'作用: {item_description}', True, (255, 255, 255))
+            description_text = font_cache.render(f'作用: {item_description}', (255, 255, 255), 16, 'ui')
             self.game.screen.blit(description_text, (description_x + 10, description_y + 10))
             
             # 物品类型说明
             item_type = selected_item.type
             if item_type in ['weapon', 'armor', 'helmet', 'boots']:
-                equip_text = self.small_font.render('按Enter装备，按R卸下', True, (0, 255, 0))
+                equip_text = font_cache.render('按Enter装备，按R卸下', (0, 255, 0), 16, 'ui')
             else:
-                equip_text = self.small_font.render('按Enter使用', True, (255, 0, 0))
+                equip_text = font_cache.render('按Enter使用', (255, 0, 0), 16, 'ui')
             self.game.screen.blit(equip_text, (description_x + 10, description_y + 35))
         
         # 绘制提示
-        prompt_text = self.small_font.render('按Escape关闭背包', True, (150, 150, 150))
+        prompt_text = font_cache.render('按Escape关闭背包', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, self.game.height - 50))
     
     def handle_inventory_events(self, event):
@@ -1253,11 +1257,11 @@ class UI:
         
         # 绘制标题
         # 使用预加载的大字体
-        help_text = self.large_font.render('帮助系统', True, (255, 255, 255))
+        help_text = font_cache.render('帮助系统', (255, 255, 255), 36, 'ui')
         self.game.screen.blit(help_text, (self.game.width // 2 - help_text.get_width() // 2, 50))
         
         # 绘制当前页面标题
-        page_title = self.font.render(f'[{self.help_pages[self.help_page]}]', True, (255, 215, 0))
+        page_title = font_cache.render(f'[{self.help_pages[self.help_page]}]', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(page_title, (self.game.width // 2 - page_title.get_width() // 2, 100))
         
         # 帮助内容背景
@@ -1285,8 +1289,8 @@ class UI:
             
             # 绘制快捷键说明
             for i, (key, desc) in enumerate(shortcuts):
-                key_text = self.font.render(key, True, (255, 215, 0))
-                desc_text = self.font.render(desc, True, (255, 255, 255))
+                key_text = font_cache.render(key, (255, 215, 0), 24, 'ui')
+                desc_text = font_cache.render(desc, (255, 255, 255), 24, 'ui')
                 self.game.screen.blit(key_text, (help_x + 50, help_y + 30 + i * 40))
                 self.game.screen.blit(desc_text, (help_x + 200, help_y + 30 + i * 40))
         elif self.help_page == 1:
@@ -1303,7 +1307,7 @@ class UI:
             ]
             
             for i, desc in enumerate(skill_desc):
-                desc_text = self.font.render(desc, True, (255, 255, 255))
+                desc_text = font_cache.render(desc, (255, 255, 255), 24, 'ui')
                 self.game.screen.blit(desc_text, (help_x + 50, help_y + 30 + i * 40))
         elif self.help_page == 2:
             # 页面2：物品系统
@@ -1319,7 +1323,7 @@ class UI:
             ]
             
             for i, desc in enumerate(item_desc):
-                desc_text = self.font.render(desc, True, (255, 255, 255))
+                desc_text = font_cache.render(desc, (255, 255, 255), 24, 'ui')
                 self.game.screen.blit(desc_text, (help_x + 50, help_y + 30 + i * 40))
         elif self.help_page == 3:
             # 页面3：游戏系统
@@ -1335,15 +1339,15 @@ class UI:
             ]
             
             for i, desc in enumerate(game_desc):
-                desc_text = self.font.render(desc, True, (255, 255, 255))
+                desc_text = font_cache.render(desc, (255, 255, 255), 24, 'ui')
                 self.game.screen.blit(desc_text, (help_x + 50, help_y + 30 + i * 40))
         
         # 绘制页面导航提示
-        nav_text = self.small_font.render('← 左箭头键 切换页面 → 右箭头键', True, (150, 150, 150))
+        nav_text = font_cache.render('← 左箭头键 切换页面 → 右箭头键', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(nav_text, (self.game.width // 2 - nav_text.get_width() // 2, help_y + help_height + 20))
         
         # 绘制提示
-        prompt_text = self.small_font.render('按任意键关闭帮助', True, (150, 150, 150))
+        prompt_text = font_cache.render('按任意键关闭帮助', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, self.game.height - 50))
     
     def handle_help_events(self, event):
@@ -1384,7 +1388,7 @@ class UI:
         self.game.screen.fill((50, 50, 50))
         
         # 绘制标题
-        title = self.large_font.render('人物状态', True, (255, 215, 0))
+        title = font_cache.render('人物状态', (255, 215, 0), 36, 'ui')
         title_x = self.game.width // 2 - title.get_width() // 2
         title_y = 50
         self.game.screen.blit(title, (title_x, title_y))
@@ -1406,25 +1410,25 @@ class UI:
         ]
         
         for i, (attr_name, attr_value) in enumerate(attributes):
-            attr_text = self.font.render(f'{attr_name}: {attr_value}', True, (255, 255, 255))
+            attr_text = font_cache.render(f'{attr_name}: {attr_value}', (255, 255, 255), 24, 'ui')
             self.game.screen.blit(attr_text, (200, 150 + i * 40))
         
         # 显示任务状态
-        quest_title = self.font.render('任务状态', True, (255, 215, 0))
+        quest_title = font_cache.render('任务状态', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(quest_title, (600, 150))
         
         # 显示任务列表
         quests = getattr(self.game, 'quest_system', None)
         if quests and hasattr(quests, 'active_quests'):
             for i, quest in enumerate(quests.active_quests):
-                quest_text = self.small_font.render(f'{quest.name}: {quest.status}', True, (255, 255, 255))
+                quest_text = font_cache.render(f'{quest.name}: {quest.status}', (255, 255, 255), 16, 'ui')
                 self.game.screen.blit(quest_text, (600, 200 + i * 30))
         else:
-            no_quests_text = self.small_font.render('无活动任务', True, (150, 150, 150))
+            no_quests_text = font_cache.render('无活动任务', (150, 150, 150), 16, 'ui')
             self.game.screen.blit(no_quests_text, (600, 200))
         
         # 绘制提示
-        prompt_text = self.small_font.render('按Escape关闭人物状态', True, (150, 150, 150))
+        prompt_text = font_cache.render('按Escape关闭人物状态', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, self.game.height - 50))
     
     def render_skills(self):
@@ -1433,7 +1437,7 @@ class UI:
         self.game.screen.fill((50, 50, 50))
         
         # 绘制标题
-        title = self.large_font.render('技能天赋', True, (255, 215, 0))
+        title = font_cache.render('技能天赋', (255, 215, 0), 36, 'ui')
         title_x = self.game.width // 2 - title.get_width() // 2
         title_y = 50
         self.game.screen.blit(title, (title_x, title_y))
@@ -1463,11 +1467,11 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (active_area_x, active_area_y, active_area_width, active_area_height), 2)
         
         # 主动技能标题
-        active_title = self.font.render('主动技能', True, (0, 255, 255))
+        active_title = font_cache.render('主动技能', (0, 255, 255), 24, 'ui')
         self.game.screen.blit(active_title, (active_area_x + 20, active_area_y + 10))
         
         # 显示分页信息
-        page_info = self.font.render(f'页 {self.skill_page + 1}/{total_pages}', True, (255, 255, 255))
+        page_info = font_cache.render(f'页 {self.skill_page + 1}/{total_pages}', (255, 255, 255), 24, 'ui')
         self.game.screen.blit(page_info, (active_area_x + active_area_width - page_info.get_width() - 20, active_area_y + 10))
         
         # 技能列表
@@ -1491,7 +1495,7 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (active_area_x + 20, skill_slot_y, active_area_width - 40, 80), 2)
                 
                 # 技能名称和等级
-                skill_text = self.font.render(f'{skill_name} (等级 {skill_level})', True, (255, 215, 0))
+                skill_text = font_cache.render(f'{skill_name} (等级 {skill_level})', (255, 215, 0), 24, 'ui')
                 self.game.screen.blit(skill_text, (active_area_x + 30, skill_slot_y + 10))
                 
                 # 技能详细信息
@@ -1503,19 +1507,19 @@ class UI:
                 else:
                     damage_text = '无伤害'
                 
-                info_text = self.small_font.render(f'{damage_text}', True, (255, 255, 255))
+                info_text = font_cache.render(f'{damage_text}', (255, 255, 255), 16, 'ui')
                 self.game.screen.blit(info_text, (active_area_x + 30, skill_slot_y + 35))
                 
                 # 技能其他信息
-                other_info = self.small_font.render(f'范围: {skill_range}, 冷却: {skill_cooldown}秒', True, (200, 200, 200))
+                other_info = font_cache.render(f'范围: {skill_range}, 冷却: {skill_cooldown}秒', (200, 200, 200), 16, 'ui')
                 self.game.screen.blit(other_info, (active_area_x + 30, skill_slot_y + 55))
                 
                 # 技能等级要求
-                required_level_text = self.small_font.render(f'等级要求: {skill_required_level}', True, (0, 255, 255))
+                required_level_text = font_cache.render(f'等级要求: {skill_required_level}', (0, 255, 255), 16, 'ui')
                 self.game.screen.blit(required_level_text, (active_area_x + 300, skill_slot_y + 10))
                 
                 # 技能描述
-                desc_text = self.small_font.render(f'描述: {skill_description}', True, (150, 150, 150))
+                desc_text = font_cache.render(f'描述: {skill_description}', (150, 150, 150), 16, 'ui')
                 self.game.screen.blit(desc_text, (active_area_x + 300, skill_slot_y + 35))
             except Exception as e:
                 print(f"渲染技能 {i} 错误: {e}")
@@ -1531,7 +1535,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (passive_area_x, passive_area_y, passive_area_width, passive_area_height), 2)
         
         # 被动技能标题
-        passive_title = self.font.render('被动技能', True, (255, 165, 0))
+        passive_title = font_cache.render('被动技能', (255, 165, 0), 24, 'ui')
         self.game.screen.blit(passive_title, (passive_area_x + 20, passive_area_y + 10))
         
         # 显示被动技能列表
@@ -1551,21 +1555,21 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (passive_area_x + 20, passive_slot_y, passive_area_width - 40, 60), 2)
                 
                 # 被动技能名称和等级
-                passive_text = self.font.render(f'{passive_name} (等级 {passive_level})', True, (255, 255, 255))
+                passive_text = font_cache.render(f'{passive_name} (等级 {passive_level})', (255, 255, 255), 24, 'ui')
                 self.game.screen.blit(passive_text, (passive_area_x + 30, passive_slot_y + 10))
                 
                 # 被动技能详细信息
-                passive_info = self.small_font.render(f'效果: {passive_effect}, 值: {passive_value}', True, (200, 200, 200))
+                passive_info = font_cache.render(f'效果: {passive_effect}, 值: {passive_value}', (200, 200, 200), 16, 'ui')
                 self.game.screen.blit(passive_info, (passive_area_x + 30, passive_slot_y + 35))
             except Exception as e:
                 print(f"渲染被动技能 {i} 错误: {e}")
         
         # 绘制提示
-        prompt_text = self.small_font.render('按Escape关闭技能天赋 | 按左右箭头键翻页', True, (150, 150, 150))
+        prompt_text = font_cache.render('按Escape关闭技能天赋 | 按左右箭头键翻页', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, self.game.height - 50))
         
         # 绘制技能设置提示
-        setup_prompt = self.small_font.render('提示: 点击游戏中的技能快捷栏可以设置技能快捷键', True, (100, 200, 100))
+        setup_prompt = font_cache.render('提示: 点击游戏中的技能快捷栏可以设置技能快捷键', (100, 200, 100), 16, 'ui')
         self.game.screen.blit(setup_prompt, (self.game.width // 2 - setup_prompt.get_width() // 2, self.game.height - 25))
     
     def handle_save_prompt_events(self, event):
@@ -1622,131 +1626,87 @@ class UI:
 
     def add_item_drop(self, item_name, quantity, x, y):
         """添加掉落物品提示"""
-        self.item_drops.append({
-            'name': item_name,
-            'quantity': quantity,
-            'x': x,
-            'y': y,
-            'time': pygame.time.get_ticks(),
-            'duration': 3000  # 提示持续3秒
-        })
+        # 提示持续3秒
+        self.item_drops.push(floating_text_pool.acquire(
+            f"获得: {item_name} × {quantity}", (255, 215, 0), 24, 'ui', x, y, game_clock.get_ticks(), 3000))
     
     def add_damage_text(self, damage, x, y, is_critical=False):
         """添加伤害值显示"""
-        self.damage_texts.append({
-            'damage': damage,
-            'x': x,
-            'y': y,
-            'time': pygame.time.get_ticks(),
-            'duration': 2000,  # 伤害值显示持续2秒
-            'is_critical': is_critical,
-            'y_offset': 0  # 向上飘动的偏移量
-        })
+        # 根据是否为暴击选择颜色和字体大小
+        if is_critical:
+            # 暴击伤害为金色，添加感叹号
+            text, color, font_size = f"-{damage}!!!", (255, 215, 0), 28
+        else:
+            # 普通伤害为黄色
+            text, color, font_size = f"-{damage}", (255, 255, 0), 20
+        # 伤害值显示持续2秒
+        self.damage_texts.push(floating_text_pool.acquire(
+            text, color, font_size, font_cache.DEFAULT, x, y, game_clock.get_ticks(), 2000))
     
     def update_item_drops(self):
         """更新掉落物品提示"""
-        current_time = pygame.time.get_ticks()
-        self.item_drops = [drop for drop in self.item_drops if current_time - drop['time'] < drop['duration']]
+        self.item_drops.expire(game_clock.get_ticks())
     
     def update_damage_texts(self):
         """更新伤害值显示"""
-        current_time = pygame.time.get_ticks()
-        # 过滤掉过期的伤害值显示
-        self.damage_texts = [text for text in self.damage_texts if current_time - text['time'] < text['duration']]
-        # 更新伤害值显示的位置（向上飘动效果）
-        for text in self.damage_texts:
-            text['y_offset'] = (current_time - text['time']) * 0.1  # 向上飘动的速度
+        # 移除过期的伤害值显示（飘动位置在渲染时根据时间计算）
+        self.damage_texts.expire(game_clock.get_ticks())
     
     def update_game_messages(self):
         """更新游戏内消息"""
-        current_time = pygame.time.get_ticks()
-        # 过滤掉过期的消息
-        self.game_messages = [msg for msg in self.game_messages if current_time - msg['start_time'] < msg['duration']]
+        # 移除过期的消息
+        if self.game_messages.expire(game_clock.get_ticks()):
+            self._notify_messages_changed()
     
     def render_item_drops(self):
         """渲染掉落物品提示"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         for drop in self.item_drops:
             # 计算提示的位置（向上飘移动画）
-            elapsed_time = current_time - drop['time']
+            elapsed_time = current_time - drop.start_time
             float_offset = min(50, elapsed_time * 0.016)  # 向上飘动50像素
-            alpha = max(0, 255 - (elapsed_time * 0.085))  # 逐渐透明
-            
-            # 创建文本
-            text = self.font.render(f"获得: {drop['name']} × {drop['quantity']}", True, (255, 215, 0))
-            
-            # 创建一个临时表面用于设置透明度
-            temp_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-            temp_surface.fill((255, 215, 0, alpha))
-            temp_surface.blit(text, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            alpha = 255 - (elapsed_time * 0.085)  # 逐渐透明
             
             # 计算屏幕位置（考虑相机偏移）
-            screen_x = drop['x'] - self.game.camera_x
-            screen_y = drop['y'] - self.game.camera_y - float_offset
+            screen_x = drop.x - self.game.camera_x
+            screen_y = drop.y - self.game.camera_y - float_offset
             
             # 渲染提示
-            self.game.screen.blit(temp_surface, (screen_x, screen_y))
+            drop.blit(self.game.screen, (screen_x, screen_y), alpha)
     
     def render_damage_texts(self):
         """渲染伤害值显示"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         for damage_text in self.damage_texts:
             # 计算透明度
-            elapsed_time = current_time - damage_text['time']
-            alpha = max(0, 255 - (elapsed_time * 0.128))  # 逐渐透明
-            
-            # 根据是否为暴击选择颜色和字体大小
-            if damage_text['is_critical']:
-                color = (255, 215, 0)  # 暴击伤害为金色
-                font_size = 28
-                # 暴击伤害添加感叹号
-                display_text = f"-{damage_text['damage']}!!!"
-            else:
-                color = (255, 255, 0)  # 普通伤害为黄色
-                font_size = 20
-                display_text = f"-{damage_text['damage']}"
-            
-            # 创建字体
-            font = pygame.font.Font(None, font_size)
-            text = font.render(display_text, True, color)
-            
-            # 创建一个临时表面用于设置透明度
-            temp_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-            temp_surface.fill((color[0], color[1], color[2], alpha))
-            temp_surface.blit(text, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            elapsed_time = current_time - damage_text.start_time
+            alpha = 255 - (elapsed_time * 0.128)  # 逐渐透明
+            y_offset = elapsed_time * 0.1  # 向上飘动的速度
             
             # 计算屏幕位置（考虑相机偏移和向上飘动）
-            screen_x = damage_text['x'] - self.game.camera_x - text.get_width() // 2
-            screen_y = damage_text['y'] - self.game.camera_y - damage_text['y_offset'] - 20
+            screen_x = damage_text.x - self.game.camera_x - damage_text.surface.get_width() // 2
+            screen_y = damage_text.y - self.game.camera_y - y_offset - 20
             
             # 渲染伤害值
-            self.game.screen.blit(temp_surface, (screen_x, screen_y))
+            damage_text.blit(self.game.screen, (screen_x, screen_y), alpha)
     
     def render_game_messages(self):
         """渲染游戏内消息"""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         message_y = 100  # 消息显示的起始Y坐标
         line_height = 25  # 每条消息的高度
         
         for i, message in enumerate(self.game_messages):
             # 计算透明度
-            elapsed_time = current_time - message['start_time']
-            alpha = max(0, 255 - (elapsed_time * 0.0512))  # 逐渐透明
-            
-            # 创建文本
-            text_surface = self.font.render(message['message'], True, message['color'])
-            
-            # 创建一个临时表面用于设置透明度
-            temp_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            temp_surface.fill(message['color'] + (alpha,))
-            temp_surface.blit(text_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            elapsed_time = current_time - message.start_time
+            alpha = 255 - (elapsed_time * 0.0512)  # 逐渐透明
             
             # 计算屏幕位置（顶部居中显示）
-            screen_x = self.game.width // 2 - text_surface.get_width() // 2
+            screen_x = self.game.width // 2 - message.surface.get_width() // 2
             screen_y = message_y + i * line_height
             
             # 渲染消息
-            self.game.screen.blit(temp_surface, (screen_x, screen_y))
+            message.blit(self.game.screen, (screen_x, screen_y), alpha)
     
     def render_save_prompt(self):
         """渲染保存提示对话框"""
@@ -1756,11 +1716,11 @@ class UI:
         pygame.draw.rect(self.game.screen, (255, 255, 255), prompt_bg, 2)
         
         # 提示标题
-        title_text = self.font.render('退出游戏', True, (255, 255, 255))
+        title_text = font_cache.render('退出游戏', (255, 255, 255), 24, 'ui')
         self.game.screen.blit(title_text, (450, 270))
         
         # 提示内容
-        content_text = self.small_font.render('是否保存游戏进度？', True, (255, 255, 255))
+        content_text = font_cache.render('是否保存游戏进度？', (255, 255, 255), 16, 'ui')
         self.game.screen.blit(content_text, (350, 320))
         
         # 选项按钮
@@ -1772,7 +1732,7 @@ class UI:
                 pygame.draw.rect(self.game.screen, (50, 50, 100), button_rect)
             pygame.draw.rect(self.game.screen, (255, 255, 255), button_rect, 2)
             
-            button_text = self.font.render(option, True, (255, 255, 255))
+            button_text = font_cache.render(option, (255, 255, 255), 24, 'ui')
             self.game.screen.blit(button_text, (400, 365 + i * 50))
     
     def render_name_input(self):
@@ -1781,11 +1741,11 @@ class UI:
         self.game.screen.fill((50, 50, 50))
         
         # 标题
-        title_text = self.title_font.render('创建角色', True, (255, 255, 255))
+        title_text = font_cache.render('创建角色', (255, 255, 255), 48, 'ui')
         self.game.screen.blit(title_text, (self.game.width // 2 - title_text.get_width() // 2, 100))
         
         # 提示文字
-        prompt_text = self.font.render('请输入角色名称:', True, (255, 255, 255))
+        prompt_text = font_cache.render('请输入角色名称:', (255, 255, 255), 24, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, 200))
         
         # 输入框
@@ -1794,7 +1754,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (255, 255, 255), input_box, 2)
         
         # 输入文字
-        input_text = self.font.render(self.name_input, True, (255, 255, 255))
+        input_text = font_cache.render(self.name_input, (255, 255, 255), 24, 'ui')
         self.game.screen.blit(input_text, (input_box.x + 10, input_box.y + 5))
         
         # 光标
@@ -1803,7 +1763,7 @@ class UI:
             pygame.draw.line(self.game.screen, (255, 255, 255), (cursor_x, input_box.y + 10), (cursor_x, input_box.y + 30), 2)
         
         # 提示信息
-        info_text = self.small_font.render('按Enter确认，按Backspace删除，最多10个字符', True, (150, 150, 150))
+        info_text = font_cache.render('按Enter确认，按Backspace删除，最多10个字符', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(info_text, (self.game.width // 2 - info_text.get_width() // 2, 320))
     
     def render_storage(self):
@@ -1812,7 +1772,7 @@ class UI:
         self.game.screen.fill((50, 50, 50))
         
         # 绘制仓库标题
-        storage_text = self.large_font.render('公共仓库', True, (255, 215, 0))
+        storage_text = font_cache.render('公共仓库', (255, 215, 0), 36, 'ui')
         self.game.screen.blit(storage_text, (self.game.width // 2 - storage_text.get_width() // 2, 50))
         
         # 绘制仓库物品
@@ -1826,7 +1786,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (storage_x, storage_y, storage_width, storage_height), 2)
         
         # 仓库标题
-        storage_title = self.font.render('仓库物品', True, (255, 215, 0))
+        storage_title = font_cache.render('仓库物品', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(storage_title, (storage_x + 10, storage_y + 10))
         
         # 绘制物品
@@ -1847,11 +1807,11 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (item_x, item_y, item_width, item_height), 1)
             
             # 物品名称
-            item_name = self.small_font.render(item['name'], True, (255, 255, 255))
+            item_name = font_cache.render(item['name'], (255, 255, 255), 16, 'ui')
             self.game.screen.blit(item_name, (item_x + 5, item_y + 5))
             
             # 物品数量
-            quantity_text = self.small_font.render(f'x{item.get("quantity", 1)}', True, (255, 215, 0))
+            quantity_text = font_cache.render(f'x{item.get("quantity", 1)}', (255, 215, 0), 16, 'ui')
             self.game.screen.blit(quantity_text, (item_x + 5, item_y + 30))
         
         # 绘制背包物品
@@ -1865,7 +1825,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (inventory_x, inventory_y, inventory_width, inventory_height), 2)
         
         # 背包标题
-        inventory_title = self.font.render('背包物品', True, (255, 215, 0))
+        inventory_title = font_cache.render('背包物品', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(inventory_title, (inventory_x + 10, inventory_y + 10))
         
         # 确保selected_inventory_item属性存在
@@ -1890,11 +1850,11 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (item_x, item_y, item_width, item_height), 1)
             
             # 物品名称
-            item_name = self.small_font.render(item.name, True, (255, 255, 255))
+            item_name = font_cache.render(item.name, (255, 255, 255), 16, 'ui')
             self.game.screen.blit(item_name, (item_x + 5, item_y + 5))
             
             # 物品数量
-            quantity_text = self.small_font.render(f'x{item.quantity}', True, (255, 215, 0))
+            quantity_text = font_cache.render(f'x{item.quantity}', (255, 215, 0), 16, 'ui')
             self.game.screen.blit(quantity_text, (item_x + 5, item_y + 30))
         
         # 确保选择模式存在
@@ -1903,9 +1863,9 @@ class UI:
         
         # 绘制提示
         current_mode = '仓库' if self.storage_selection_mode == 'storage' else '背包'
-        mode_text = self.small_font.render(f'当前模式: {current_mode}', True, (255, 215, 0))
-        prompt_text1 = self.small_font.render('操作: 方向键选择物品 | Enter操作 | Tab切换模式 | Escape关闭', True, (150, 150, 150))
-        prompt_text2 = self.small_font.render('仓库模式: 取出物品到背包 | 背包模式: 存入物品到仓库', True, (150, 150, 150))
+        mode_text = font_cache.render(f'当前模式: {current_mode}', (255, 215, 0), 16, 'ui')
+        prompt_text1 = font_cache.render('操作: 方向键选择物品 | Enter操作 | Tab切换模式 | Escape关闭', (150, 150, 150), 16, 'ui')
+        prompt_text2 = font_cache.render('仓库模式: 取出物品到背包 | 背包模式: 存入物品到仓库', (150, 150, 150), 16, 'ui')
         
         self.game.screen.blit(mode_text, (self.game.width // 2 - mode_text.get_width() // 2, self.game.height - 90))
         self.game.screen.blit(prompt_text1, (self.game.width // 2 - prompt_text1.get_width() // 2, self.game.height - 60))
@@ -2003,7 +1963,7 @@ class UI:
         self.game.screen.fill((50, 50, 50))
         
         # 绘制回收标题
-        recycle_text = self.large_font.render('物品回收', True, (255, 215, 0))
+        recycle_text = font_cache.render('物品回收', (255, 215, 0), 36, 'ui')
         self.game.screen.blit(recycle_text, (self.game.width // 2 - recycle_text.get_width() // 2, 50))
         
         # 绘制背包物品
@@ -2017,7 +1977,7 @@ class UI:
         pygame.draw.rect(self.game.screen, (100, 100, 100), (inventory_x, inventory_y, inventory_width, inventory_height), 2)
         
         # 背包标题
-        inventory_title = self.font.render('背包物品', True, (255, 215, 0))
+        inventory_title = font_cache.render('背包物品', (255, 215, 0), 24, 'ui')
         self.game.screen.blit(inventory_title, (inventory_x + 10, inventory_y + 10))
         
         # 绘制物品
@@ -2041,20 +2001,20 @@ class UI:
                 pygame.draw.rect(self.game.screen, (100, 100, 100), (item_x, item_y, item_width, item_height), 1)
             
             # 物品名称
-            item_name = self.small_font.render(item.name, True, (255, 255, 255))
+            item_name = font_cache.render(item.name, (255, 255, 255), 16, 'ui')
             self.game.screen.blit(item_name, (item_x + 5, item_y + 5))
             
             # 物品数量
-            quantity_text = self.small_font.render(f'x{item.quantity}', True, (255, 215, 0))
+            quantity_text = font_cache.render(f'x{item.quantity}', (255, 215, 0), 16, 'ui')
             self.game.screen.blit(quantity_text, (item_x + 5, item_y + 30))
             
             # 回收价格
             recycle_price = self.get_recycle_price(item)
-            price_text = self.small_font.render(f'回收价: {recycle_price}金币', True, (0, 255, 0))
+            price_text = font_cache.render(f'回收价: {recycle_price}金币', (0, 255, 0), 16, 'ui')
             self.game.screen.blit(price_text, (item_x + 5, item_y + 50))
         
         # 绘制提示
-        prompt_text = self.small_font.render('按Escape关闭回收 | 按Enter回收物品', True, (150, 150, 150))
+        prompt_text = font_cache.render('按Escape关闭回收 | 按Enter回收物品', (150, 150, 150), 16, 'ui')
         self.game.screen.blit(prompt_text, (self.game.width // 2 - prompt_text.get_width() // 2, self.game.height - 50))
     
     def handle_recycle_events(self, event):
@@ -2113,4 +2073,8 @@ class UI:
         # 根据物品名称获取基础价格
         base_price = base_prices.get(item.name, 1)
         # 计算总价（数量 * 单价）
-        return base_price * item.quantity
\ No newline at end of file
+        return base_price * item.quantity
+
+
+# 为所有UI.render_*方法登记性能分析挂钩点（未开启时无开销）
+profiler.register_prefix(UI, 'render_')
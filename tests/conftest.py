@@ -0,0 +1,9 @@
+import os
+import sys
+
+# 无界面运行：测试不打开窗口、不使用声卡
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# 与 python -m src.main 一致，以项目根目录作为导入根
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
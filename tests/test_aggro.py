@@ -0,0 +1,113 @@
+from src.entities.monsters.aggro import AGGRO_GRACE_MS, FRAME_MS, LEASH_SWEEP_MS, AggroTable
+
+
+class Target:
+    def __init__(self, x=0, y=0):
+        self.x, self.y = x, y
+
+
+LEASH = 225
+
+
+def top(table, current_time):
+    return table.top(current_time, 0, 0, LEASH)
+
+
+def test_highest_aggro_wins():
+    table = AggroTable(0.5)
+    player, pet = Target(), Target()
+    table.add(player, 10, 0)
+    table.add(pet, 30, 0)
+    assert top(table, 100) is pet
+    table.add(player, 25, 200)
+    assert top(table, 300) is player
+    assert table.get(player, 300) == 35
+
+
+def test_decay_starts_after_grace_period():
+    table = AggroTable(0.5)
+    player = Target()
+    table.add(player, 100, 0)
+    assert table.get(player, AGGRO_GRACE_MS) == 100
+    # 每帧衰减decay_rate
+    assert table.get(player, AGGRO_GRACE_MS + 10 * FRAME_MS) == 95
+
+
+def test_decaying_target_loses_to_fresh_target():
+    table = AggroTable(0.5)
+    old, fresh = Target(), Target()
+    table.add(old, 100, 0)
+    table.add(fresh, 60, AGGRO_GRACE_MS + 90 * FRAME_MS)
+    assert top(table, AGGRO_GRACE_MS + 70 * FRAME_MS) is old
+    # old衰减到55，低于仍在不衰减期的fresh
+    assert top(table, AGGRO_GRACE_MS + 90 * FRAME_MS) is fresh
+
+
+def test_all_decayed_clears_table():
+    table = AggroTable(0.5)
+    player = Target()
+    table.add(player, 10, 0)
+    assert top(table, AGGRO_GRACE_MS + 20 * FRAME_MS) is None
+    assert not table
+
+
+def test_targets_decaying_to_zero_at_different_times_are_pruned():
+    table = AggroTable(0.5)
+    weak, strong = Target(), Target()
+    table.add(weak, 5, 0)
+    table.add(strong, 500, 0)
+    # weak已衰减到0，strong仍有仇恨：weak不能让仇恨表一直非空
+    current_time = AGGRO_GRACE_MS + 20 * FRAME_MS
+    assert top(table, current_time) is strong
+    assert top(table, current_time + LEASH_SWEEP_MS) is strong
+    assert weak not in table and len(table) == 1
+
+    # strong也衰减到0后仇恨表清空
+    assert top(table, AGGRO_GRACE_MS + 1000 * FRAME_MS + LEASH_SWEEP_MS) is None
+    assert not table
+
+
+def test_leash_removes_far_targets():
+    table = AggroTable(0.5)
+    near, far = Target(10, 10), Target(10, 10)
+    table.add(near, 10, 0)
+    table.add(far, 50, 0)
+    far.x = 1000
+    # 当前目标超出追击范围时立即移除
+    assert top(table, 10) is near
+    assert far not in table
+
+    # 非当前目标在定期检查时移除
+    near.x = 1000
+    other = Target()
+    table.add(other, 100, 20)
+    assert top(table, 20 + LEASH_SWEEP_MS) is other
+    assert near not in table
+
+
+def test_heaps_stay_bounded_under_repeated_proximity_aggro():
+    table = AggroTable(0.5)
+    player = Target()
+    for frame in range(10000):
+        table.add(player, 1, frame * FRAME_MS)
+        top(table, frame * FRAME_MS)
+    assert len(table._grace_heap) + len(table._decay_heap) <= 4 * len(table) + 16
+    assert len(table._grace_end_heap) <= 4 * len(table) + 16 + AGGRO_GRACE_MS // FRAME_MS
+
+
+def test_monster_leaves_full_tier_when_weaker_target_decays():
+    from src.core.clock import game_clock
+    from src.entities.monsters import MonsterFactory
+
+    game_clock.enable_fixed_step(0)
+    try:
+        monster = MonsterFactory.create_monster('狼', 0, 0)
+        weak, strong = Target(10, 10), Target(20, 20)
+        monster.take_damage(5, weak)
+        monster.take_damage(100, strong)
+        game_clock.advance(AGGRO_GRACE_MS + 20 * FRAME_MS + LEASH_SWEEP_MS)
+        monster.update_target()
+        assert monster.target is strong
+        assert list(monster.aggro) == [strong]
+    finally:
+        game_clock.disable_fixed_step()
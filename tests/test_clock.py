@@ -0,0 +1,57 @@
+import pygame
+
+from src.core.clock import GameClock
+
+
+def test_follows_real_clock_by_default():
+    clock = GameClock()
+    assert not clock.fixed_step
+    before = pygame.time.get_ticks()
+    assert clock.get_ticks() >= before
+
+
+def test_fixed_step_advances_only_on_demand():
+    clock = GameClock()
+    clock.enable_fixed_step(start_time=1000)
+    assert clock.get_ticks() == 1000
+    for _ in range(3):
+        clock.advance(1000 / 60)
+    assert clock.get_ticks() == 1050
+
+
+def test_disable_fixed_step_returns_to_real_clock():
+    clock = GameClock()
+    clock.enable_fixed_step(start_time=10 ** 9)
+    clock.disable_fixed_step()
+    assert clock.get_ticks() < 10 ** 9
+
+
+def test_headless_step_advances_game_time():
+    from src.core.clock import game_clock
+    from src.core.game import Game
+
+    game = Game(headless=True)
+    try:
+        game.start_game('战士')
+        start = game_clock.get_ticks()
+        assert game.step(30) > 0
+        assert game_clock.get_ticks() - start == int(30 * game.tick_ms)
+    finally:
+        game_clock.disable_fixed_step()
+
+
+def test_headless_step_stops_when_game_quits():
+    from src.core.clock import game_clock
+    from src.core.game import Game
+
+    game = Game(headless=True)
+    try:
+        game.start_game('战士')
+        game.running = False
+        game_clock.enable_fixed_step(start_time=5000)
+        start = game_clock.get_ticks()
+        assert game.step(30) == 0.0
+        assert game_clock.fixed_step
+        assert game_clock.get_ticks() == start
+    finally:
+        game_clock.disable_fixed_step()
@@ -0,0 +1,65 @@
+import pygame
+import pytest
+
+from src.ui.floating_text import FloatingTextPool, FloatingTextQueue
+
+
+@pytest.fixture
+def pool():
+    pygame.font.init()
+    return FloatingTextPool()
+
+
+def push(queue, pool, text, start_time, duration=1000):
+    return queue.push(pool.acquire(text, (255, 255, 255), 16, 'ui', 0, 0, start_time, duration))
+
+
+def test_expire_in_order_of_expiry_time(pool):
+    queue = FloatingTextQueue(10, pool)
+    long_entry = push(queue, pool, 'long', 0, duration=3000)
+    push(queue, pool, 'short', 0, duration=1000)
+    push(queue, pool, 'medium', 0, duration=2000)
+    assert queue.expire(999) == 0
+    assert queue.expire(2000) == 2
+    assert list(queue) == [long_entry]
+    assert queue.expire(3000) == 1
+    assert len(queue) == 0
+
+
+def test_capacity_evicts_oldest(pool):
+    queue = FloatingTextQueue(3, pool)
+    entries = [push(queue, pool, str(i), i) for i in range(5)]
+    assert list(queue) == entries[2:]
+    assert queue.recent(2) == entries[3:]
+    # 被淘汰条目的过期记录被跳过
+    assert queue.expire(10000) == 3
+
+
+def test_entry_reused_by_another_queue_is_not_expired_twice(pool):
+    messages = FloatingTextQueue(10, pool)
+    damage_texts = FloatingTextQueue(10, pool)
+    for i in range(11):
+        push(messages, pool, f'消息{i}', 0, duration=3000)
+    # 第一条消息被淘汰，它的条目对象被伤害数字复用
+    reused = push(damage_texts, pool, '99', 0, duration=10000)
+    assert messages.expire(5000) == 10
+    assert list(damage_texts) == [reused]
+    assert damage_texts.expire(5000) == 0
+
+
+def test_released_surfaces_are_reused(pool):
+    queue = FloatingTextQueue(10, pool)
+    push(queue, pool, '42', 0)
+    queue.expire(1000)
+    push(queue, pool, '42', 2000)
+    assert pool.get_stats()['surfaces_created'] == 1
+    assert pool.get_stats()['surfaces_reused'] == 1
+
+
+def test_clear_releases_entries(pool):
+    queue = FloatingTextQueue(10, pool)
+    push(queue, pool, 'a', 0)
+    push(queue, pool, 'b', 0)
+    queue.clear()
+    assert len(queue) == 0 and queue.expire(10000) == 0
+    assert pool.get_stats()['free_entries'] == 2
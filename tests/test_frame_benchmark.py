@@ -0,0 +1,39 @@
+import pygame
+import pytest
+
+from benchmarks.frame_benchmark import build_camera_path, point_on_path
+from src.map.map import Map
+
+
+def make_exits(scene_type):
+    game_map = Map.__new__(Map)
+    game_map.scene_type = scene_type
+    game_map._initialize_exits()
+    return game_map.exits
+
+
+@pytest.mark.parametrize('scene_type', ['村庄', '森林', '沙漠', '地牢', '雪原'])
+def test_camera_path_stays_clear_of_exits(scene_type):
+    exits = make_exits(scene_type)
+    exit_rects = [pygame.Rect(e['x'], e['y'], e['width'], e['height']) for e in exits]
+    path = build_camera_path(2400, 1800, exits, (24, 36))
+    for i in range(1001):
+        x, y = point_on_path(path, i / 1000)
+        assert pygame.Rect(x, y, 24, 36).collidelist(exit_rects) == -1, (scene_type, x, y)
+
+
+def test_unblocked_map_keeps_original_loop():
+    assert build_camera_path(2400, 1800) == [(300, 250), (2100, 250), (2100, 1550),
+                                             (1200, 900), (300, 1550), (300, 250)]
+
+
+@pytest.mark.parametrize('require_baseline, exit_code', [(False, 0), (True, 2)])
+def test_missing_baseline(monkeypatch, tmp_path, require_baseline, exit_code):
+    import benchmarks.frame_benchmark as frame_benchmark
+
+    monkeypatch.setattr(frame_benchmark, 'run_benchmark', lambda *args, **kwargs: {'maps': {}})
+    argv = ['--output', str(tmp_path / 'latest.json'), '--baseline', str(tmp_path / 'missing.json')]
+    if require_baseline:
+        argv.append('--require-baseline')
+    assert frame_benchmark.main(argv) == exit_code
+    assert (tmp_path / 'latest.json').exists()
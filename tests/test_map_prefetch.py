@@ -0,0 +1,85 @@
+import random
+import threading
+
+import pygame
+import pytest
+
+from src.map.map import Map
+from src.map.map_manager import MapManager
+from src.systems.asset_cache import asset_cache
+from src.systems.font_cache import font_cache
+
+
+@pytest.fixture
+def surface_calls(monkeypatch):
+    """记录访问素材缓存和字体缓存的线程"""
+    calls = []
+    get_image, render = asset_cache.get_image, font_cache.render
+
+    def record_get_image(*args, **kwargs):
+        calls.append(threading.current_thread())
+        return get_image(*args, **kwargs)
+
+    def record_render(*args, **kwargs):
+        calls.append(threading.current_thread())
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(asset_cache, 'get_image', record_get_image)
+    monkeypatch.setattr(font_cache, 'render', record_render)
+    return calls
+
+
+def build_in_thread(scene_type, seed):
+    result = {}
+
+    def worker():
+        result['map'] = Map(map_id=2, scene_type=scene_type, rng=random.Random(seed), defer_loading=True)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    return result['map']
+
+
+@pytest.mark.parametrize('scene_type', ['村庄', '森林'])
+def test_deferred_map_does_only_data_work_off_main_thread(scene_type, surface_calls):
+    pygame.display.init()
+    random.seed(7)
+    state = random.getstate()
+    game_map = build_in_thread(scene_type, seed=1)
+
+    # 后台线程不访问Surface缓存，也不消耗全局random
+    assert surface_calls == []
+    assert random.getstate() == state
+    assert not game_map.loaded
+    assert game_map.monsters == [] and game_map.forest_canopy is None
+
+    game_map.finish_loading()
+    assert game_map.loaded
+    assert game_map.monsters and len(game_map.monster_index) == len(game_map.monsters)
+    assert all(thread is threading.main_thread() for thread in surface_calls)
+    assert (game_map.forest_canopy is not None) == (scene_type == '森林')
+
+    # 重复调用没有副作用
+    count = len(game_map.monsters)
+    game_map.finish_loading()
+    assert len(game_map.monsters) == count
+
+
+def test_deferred_layout_is_reproducible():
+    first = build_in_thread('森林', seed=3)
+    second = build_in_thread('森林', seed=3)
+    assert first.terrain_elements == second.terrain_elements
+
+
+def test_get_map_finishes_prefetched_map():
+    class FakeGame:
+        tick_ms = 1000 / 60
+
+    manager = MapManager(FakeGame(), prefetch=True)
+    manager.maps[1] = Map(map_id=1, scene_type='村庄')
+    manager.prefetch_adjacent(1)
+    assert set(manager._prefetching) == {2, 3, 4, 5}
+    game_map = manager.get_map(2)
+    assert game_map.loaded and game_map.monsters
+    assert 2 not in manager._prefetching
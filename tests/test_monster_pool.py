@@ -0,0 +1,52 @@
+from src.entities.monsters import MonsterPool, Wolf
+
+
+def kill(monster):
+    monster.health = 0
+    return monster
+
+
+def test_creates_new_monsters_when_empty():
+    pool = MonsterPool()
+    monster = pool.acquire('狼', 10, 20)
+    assert isinstance(monster, Wolf)
+    assert (monster.x, monster.y, monster.spawn_point) == (10, 20, (10, 20))
+    assert pool.get_stats() == {'free': 0, 'created': 1, 'reused': 0}
+
+
+def test_reused_monster_is_reset():
+    pool = MonsterPool()
+    monster = pool.acquire('狼', 10, 20)
+    other = object()
+    monster.add_aggro(other, 50)
+    monster.activity_area = {'x1': 0, 'y1': 0, 'x2': 100, 'y2': 100}
+    pool.release(kill(monster))
+
+    reused = pool.acquire('狼', 300, 400)
+    assert reused is monster
+    assert reused.health == reused.max_health
+    assert (reused.x, reused.y, reused.spawn_point) == (300, 400, (300, 400))
+    assert reused.activity_area is None
+    assert not reused.aggro and not reused.combat_state and reused.target is None
+    assert pool.get_stats() == {'free': 0, 'created': 1, 'reused': 1}
+
+
+def test_free_lists_are_per_type_and_fifo():
+    pool = MonsterPool()
+    first, second = pool.acquire('狼', 0, 0), pool.acquire('狼', 0, 0)
+    chicken = pool.acquire('鸡', 0, 0)
+    pool.release(kill(first))
+    pool.release(kill(chicken))
+    pool.release(kill(second))
+    assert pool.acquire('狼', 0, 0) is first
+    assert pool.acquire('狼', 0, 0) is second
+    assert pool.acquire('鸡', 0, 0) is chicken
+
+
+def test_free_list_is_bounded():
+    pool = MonsterPool(max_free_per_type=2)
+    for monster in [pool.acquire('鸡', 0, 0) for _ in range(5)]:
+        pool.release(kill(monster))
+    assert pool.get_stats()['free'] == 2
+    pool.clear()
+    assert pool.get_stats()['free'] == 0
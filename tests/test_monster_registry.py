@@ -0,0 +1,47 @@
+import pytest
+
+from src.entities.monsters import BaseMonster, MonsterFactory, MonsterRegistry, MonsterType, monster_registry
+from src.entities.monsters.normal import Chicken
+from src.entities.monsters.advanced import Wolf, ZumaBoss
+
+
+def test_lookup_by_name_and_id():
+    assert monster_registry.get_entry('狼') == (Wolf, Wolf.TYPE)
+    assert monster_registry.get_name(4) == '狼'
+    assert monster_registry.get_id('狼') == 4
+    assert monster_registry.get_name(999) is None
+
+
+def test_unregistered_name_uses_default_type():
+    monster_class, monster_type = monster_registry.get_entry('史莱姆')
+    assert monster_class is BaseMonster
+    assert monster_type is MonsterType.for_name('史莱姆')
+    monster = monster_registry.create('史莱姆', 5, 6)
+    assert type(monster) is BaseMonster and monster.name == '史莱姆'
+
+
+@pytest.mark.parametrize('name, is_boss, body_size', [
+    ('狼', False, 'large'),
+    ('鸡', False, 'small'),
+    ('沃玛卫士', False, 'normal'),
+    ('僵尸王', True, 'boss'),
+    ('祖玛教主', True, 'boss'),
+])
+def test_type_descriptors(name, is_boss, body_size):
+    monster_type = monster_registry.get_type(name)
+    assert monster_registry.is_boss(name) == is_boss
+    assert monster_type.body_size == body_size
+
+
+def test_factory_delegates_to_registry():
+    assert isinstance(MonsterFactory.create_monster('祖玛教主', 0, 0), ZumaBoss)
+    assert isinstance(MonsterFactory.create_monster_by_id(2, 0, 0), Chicken)
+    assert MonsterFactory.create_monster_by_id(999, 0, 0).name == '未知怪物'
+    assert MonsterFactory.get_available_monsters()[:3] == ['稻草人', '鸡', '鹿']
+
+
+def test_custom_tables():
+    registry = MonsterRegistry(monster_classes=[Wolf], monster_ids={1: {'name': '狼'}})
+    assert registry.get_available_monsters() == ['狼']
+    assert isinstance(registry.create_by_id(1, 0, 0), Wolf)
+    assert type(registry.create('鸡', 0, 0)) is BaseMonster
@@ -0,0 +1,204 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from src.entities.monsters import MonsterFactory
+from src.map.map import Map
+from src.map.monster_store import MonsterArrayStore
+from src.map.terrain_index import TerrainCollisionIndex
+
+
+# 远离所有怪物的玩家：怪物不会获得仇恨，只漫游和回归
+FAR_PLAYER = SimpleNamespace(x=-100000, y=-100000)
+
+
+def make_store(terrain=()):
+    terrain_index = TerrainCollisionIndex(terrain)
+    return MonsterArrayStore(terrain_index, capacity=2)
+
+
+def make_pair(x, y, direction=1, wander_timer=0, wander_duration=100):
+    """两只状态相同的狼，一只交给数组批量更新，一只逐个更新作为对照"""
+    pair = []
+    for _ in range(2):
+        monster = MonsterFactory.create_monster('狼', x, y)
+        monster.direction = direction
+        monster.wander_timer = wander_timer
+        monster.wander_duration = wander_duration
+        pair.append(monster)
+    return pair
+
+
+def scalar_step(monster, terrain_index):
+    """与Map._update_monsters相同的逐个更新：update后按地形退回"""
+    old_x, old_y = monster.x, monster.y
+    monster.update(FAR_PLAYER)
+    Map._block_monster_by_terrain(SimpleNamespace(terrain_index=terrain_index), monster, old_x, old_y)
+
+
+def assert_same_state(store, batched, scalar):
+    slot = store.slots[id(batched)]
+    assert batched.x == pytest.approx(scalar.x)
+    assert batched.y == pytest.approx(scalar.y)
+    assert batched.direction == scalar.direction
+    assert store.wander_timer[slot] == scalar.wander_timer
+    assert store.wander_duration[slot] == scalar.wander_duration
+    assert store.wander_speed[slot] == pytest.approx(scalar.wander_speed)
+
+
+def run_both(store, batched, scalar, frames):
+    for _ in range(frames):
+        store.step()
+        scalar_step(scalar, store.terrain_index)
+        assert_same_state(store, batched, scalar)
+
+
+@pytest.mark.parametrize('start, area', [
+    # 正常漫游
+    ((500, 500), None),
+    # 接近活动范围边界，减速
+    ((500, 500), 'near_range'),
+    # 超出活动范围，回归刷新点
+    ((500, 500), 'outside_range'),
+    # 超出活动区域，回归区域中心
+    ((500, 500), 'outside_area'),
+    # 地图边缘，位置被限制
+    ((1, 500), 'clamp'),
+])
+def test_step_matches_scalar_update(start, area):
+    store = make_store()
+    batched, scalar = make_pair(*start, direction=3 if area == 'clamp' else 1)
+    for monster in (batched, scalar):
+        if area == 'near_range':
+            monster.x += monster.activity_range * 0.9
+        elif area == 'outside_range':
+            monster.x += monster.activity_range + 20
+            monster.y += 15
+        elif area == 'outside_area':
+            monster.activity_area = {'x1': 600, 'y1': 400, 'x2': 900, 'y2': 700}
+    store.add(batched)
+
+    run_both(store, batched, scalar, frames=20)
+
+
+def test_step_bounces_off_terrain_like_scalar_update():
+    # 怪物右侧的岩石（碰撞盒32x32，中心在(560, 510)）
+    store = make_store([{'x': 560, 'y': 510}])
+    batched, scalar = make_pair(500, 500, direction=1)
+    store.add(batched)
+
+    run_both(store, batched, scalar, frames=20)
+    # 撞上岩石后掉头向左
+    assert batched.direction == 3
+    assert batched.x < 500
+
+
+def test_step_rerolls_wander_direction():
+    store = make_store()
+    monster = MonsterFactory.create_monster('狼', 500, 500)
+    monster.wander_timer, monster.wander_duration = 99, 100
+    store.add(monster)
+    slot = store.slots[id(monster)]
+
+    store.step()
+    assert store.wander_timer[slot] == 0
+    assert 60 <= store.wander_duration[slot] <= 120
+    # 按新方向移动一步
+    step = monster.speed
+    offsets = {0: (0, -step), 1: (step, 0), 2: (0, step), 3: (-step, 0)}
+    assert (monster.x - 500, monster.y - 500) == pytest.approx(offsets[monster.direction])
+
+
+def test_step_reports_monsters_that_changed_cell():
+    store = make_store()
+    crossing = MonsterFactory.create_monster('狼', 127, 500)
+    staying = MonsterFactory.create_monster('狼', 500, 500)
+    for monster in (crossing, staying):
+        monster.direction = 1
+        monster.wander_duration = 100
+        store.add(monster)
+    assert store.step() == [crossing]
+
+
+def test_add_and_remove_swap_slots():
+    store = make_store()
+    monsters = [MonsterFactory.create_monster('狼', 100 * k, 500) for k in range(1, 5)]
+    for monster in monsters:
+        store.add(monster)
+    # 超出初始容量时扩容，已有数据保留
+    assert store.capacity == 4 and len(store) == 4
+    assert [store.x[store.slots[id(m)]] for m in monsters] == [100, 200, 300, 400]
+
+    store.remove(monsters[0])
+    assert len(store) == 3
+    assert store.monsters == [monsters[3], monsters[1], monsters[2]]
+    assert store.slots == {id(monsters[3]): 0, id(monsters[1]): 1, id(monsters[2]): 2}
+    assert store.x[0] == 400 and store.spawn_x[0] == 400
+    assert monsters[0].array_store is None
+
+    # 移除最后一个槽位、重复移除
+    store.remove(monsters[2])
+    store.remove(monsters[2])
+    assert store.monsters == [monsters[3], monsters[1]]
+    assert len(store.slots) == 2
+
+
+def test_remove_writes_back_array_state():
+    store = make_store()
+    monster = MonsterFactory.create_monster('狼', 500, 500)
+    monster.direction, monster.wander_duration = 1, 100
+    store.add(monster)
+    for _ in range(3):
+        store.step()
+    slot = store.slots[id(monster)]
+    timer = int(store.wander_timer[slot])
+
+    store.remove(monster)
+    assert monster.wander_timer == timer == 3
+    assert monster.x == pytest.approx(500 + 3 * monster.speed)
+
+
+def test_engaged_monster_moves_between_array_and_scalar_update():
+    store = make_store()
+    monster = MonsterFactory.create_monster('狼', 500, 500)
+    monster.direction, monster.wander_duration = 1, 100
+    store.add(monster)
+    slot = store.slots[id(monster)]
+    store.step()
+    assert store.owned[slot] and monster.wander_timer == 0
+
+    # 进入战斗：漫游状态写回对象，之后逐个更新，不再由数组移动
+    store.mark_engaged(monster)
+    assert not store.owned[slot] and store.engaged[slot]
+    assert monster.wander_timer == 1
+    assert store.begin_frame(FAR_PLAYER) == [monster]
+    x = monster.x
+    store.step()
+    assert monster.x == x and store.batch_updated == 0
+
+    # 逐个更新期间对象被移动，结束后坐标同步回数组
+    monster.x += 10
+    store.end_scalar_update(monster)
+    assert store.x[slot] == monster.x
+    assert not store.engaged[slot]
+
+    # 脱离战斗且远离玩家：下一帧状态收回数组，继续批量更新
+    monster.wander_timer = 5
+    assert store.begin_frame(FAR_PLAYER) == []
+    assert store.owned[slot] and store.wander_timer[slot] == 5
+    store.step()
+    assert monster.x == pytest.approx(x + 10 + monster.speed)
+
+
+def test_monster_near_player_is_updated_by_scalar_path():
+    store = make_store()
+    near = MonsterFactory.create_monster('狼', 500, 500)
+    far = MonsterFactory.create_monster('狼', 1500, 1500)
+    store.add(near)
+    store.add(far)
+
+    assert store.begin_frame(SimpleNamespace(x=520, y=500)) == [near]
+    assert not store.owned[store.slots[id(near)]]
+    assert store.owned[store.slots[id(far)]]
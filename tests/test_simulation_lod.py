@@ -0,0 +1,139 @@
+import pytest
+
+from src.core.clock import game_clock
+from src.entities.monsters import MonsterFactory
+from src.map.simulation_lod import SimulationLOD
+
+
+class FakePlayer:
+    def __init__(self, x=0, y=0):
+        self.x, self.y = x, y
+
+
+class FakeMonster:
+    aggro_range = 150
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.combat_state = False
+        self.aggro = ()
+        self.fast_forwarded = []
+
+    def fast_forward(self, elapsed_frames, is_blocked=None):
+        self.fast_forwarded.append(elapsed_frames)
+
+    def is_dead(self):
+        return False
+
+
+@pytest.fixture
+def fixed_clock():
+    game_clock.enable_fixed_step(0)
+    yield game_clock
+    game_clock.disable_fixed_step()
+
+
+def make_lod(player=None, **kwargs):
+    lod = SimulationLOD(frame_ms=10, **kwargs)
+    lod.begin_frame(player or FakePlayer(), (0, 0, 800, 600))
+    return lod
+
+
+def test_tiers():
+    lod = make_lod(dormant_distance=1200)
+    assert lod.get_tier(FakeMonster(400, 300)) == SimulationLOD.FULL
+    assert lod.get_tier(FakeMonster(1000, 0)) == SimulationLOD.REDUCED
+    assert lod.get_tier(FakeMonster(3000, 3000)) == SimulationLOD.DORMANT
+
+    engaged = FakeMonster(3000, 3000)
+    engaged.combat_state = True
+    assert lod.get_tier(engaged) == SimulationLOD.FULL
+
+
+def test_reduced_updates_are_staggered():
+    lod = SimulationLOD(reduced_interval=4)
+    player = FakePlayer()
+    monsters = [FakeMonster(1000, 0) for _ in range(4)]
+    updated = []
+    for _ in range(4):
+        lod.begin_frame(player, (0, 0, 800, 600))
+        updated.append([slot for slot, monster in enumerate(monsters) if lod.get_steps(monster, slot)])
+    # 每帧只更新一个槽位，四帧内每个怪物各更新一次（每次推进4帧）
+    assert sorted(sum(updated, [])) == [0, 1, 2, 3]
+    assert all(len(slots) == 1 for slots in updated)
+
+
+def test_dormant_monster_fast_forwards_on_wake(fixed_clock):
+    player = FakePlayer()
+    lod = make_lod(player)
+    monster = FakeMonster(3000, 3000)
+    assert lod.get_steps(monster, 0) == 0
+    fixed_clock.advance(500)
+    assert lod.get_steps(monster, 0) == 0
+    assert monster.fast_forwarded == []
+
+    # 玩家靠近后唤醒，按休眠经过的时间一次性推进
+    monster.x, monster.y = 100, 100
+    assert lod.get_steps(monster, 0) == 1
+    assert monster.fast_forwarded == [50]
+    assert lod.dormant_since == {}
+
+
+def test_forget_drops_dormant_record(fixed_clock):
+    lod = make_lod()
+    monster = FakeMonster(3000, 3000)
+    lod.get_steps(monster, 0)
+    lod.forget(monster)
+    assert lod.dormant_since == {}
+
+
+@pytest.mark.parametrize('frames', [30, 10000])
+def test_monster_fast_forward_stays_in_activity_area(frames):
+    monster = MonsterFactory.create_monster('鸡', 500, 500)
+    monster.activity_area = {'x1': 400, 'y1': 400, 'x2': 600, 'y2': 600}
+    monster.combat_state = True
+    monster.fast_forward(frames)
+    assert 400 <= monster.x <= 600 and 400 <= monster.y <= 600
+    assert not monster.combat_state and monster.state == 'wandering'
+
+
+def test_monster_fast_forward_respects_blocking():
+    monster = MonsterFactory.create_monster('鸡', 500, 500)
+    monster.fast_forward(10000, is_blocked=lambda m: True)
+    assert (monster.x, monster.y) == (500, 500)
+
+
+class FakeUI:
+    def __init__(self):
+        self.messages = []
+        self.selected_monster = None
+
+    def add_game_message(self, message, color, duration):
+        self.messages.append(message)
+
+
+class FakeGame:
+    tick_ms = 1000 / 60
+    monster_arrays = False
+
+    def __init__(self):
+        self.ui = FakeUI()
+
+
+def test_background_boss_spawn_is_not_announced(monkeypatch):
+    from src.map.map import Map, MAX_MONSTERS
+    import src.map.map as map_module
+
+    game = FakeGame()
+    game_map = Map(map_id=3, scene_type='沙漠', game=game)
+    # 每帧都刷新，且每次都刷新Boss
+    monkeypatch.setattr(map_module.random, 'random', lambda: 0.0)
+
+    game_map.simulate_background(MAX_MONSTERS)
+    assert len(game_map.monsters) == MAX_MONSTERS
+    assert game_map.monsters[-1].monster_type.is_boss
+    assert game.ui.messages == []
+
+    # 当前地图刷新Boss仍在游戏内提示
+    game_map.spawn_random_monster()
+    assert len(game.ui.messages) == 1
@@ -0,0 +1,61 @@
+from src.map.spatial_hash import SpatialHash
+
+
+class Thing:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+def make_hash(points, cell_size=128):
+    spatial_hash = SpatialHash(cell_size)
+    things = [Thing(x, y) for x, y in points]
+    for thing in things:
+        spatial_hash.insert(thing, thing.x, thing.y)
+    return spatial_hash, things
+
+
+def test_query_rect_returns_candidates_in_insertion_order():
+    spatial_hash, things = make_hash([(500, 500), (10, 10), (130, 10), (1000, 1000)])
+    assert spatial_hash.query_rect(0, 0, 200, 200) == [things[1], things[2]]
+    # 大范围查询走遍历非空网格的分支，顺序同样按插入顺序
+    assert spatial_hash.query_rect(-10000, -10000, 10000, 10000) == things
+
+
+def test_query_is_coarse_by_cell():
+    spatial_hash, things = make_hash([(120, 120)])
+    # 同一网格内的对象即使不在矩形内也会作为候选返回
+    assert spatial_hash.query_point(5, 5) == things
+
+
+def test_move_updates_cell():
+    spatial_hash, (thing,) = make_hash([(10, 10)])
+    spatial_hash.move(thing, 300, 300)
+    assert spatial_hash.query_point(10, 10) == []
+    assert spatial_hash.query_radius(300, 300, 10) == [thing]
+    # 没有变化网格的移动不改变桶
+    spatial_hash.move(thing, 301, 301)
+    assert len(spatial_hash.cells) == 1
+
+
+def test_remove_and_contains():
+    spatial_hash, (first, second) = make_hash([(10, 10), (20, 20)])
+    assert first in spatial_hash and len(spatial_hash) == 2
+    spatial_hash.remove(first)
+    spatial_hash.remove(first)
+    assert first not in spatial_hash
+    assert spatial_hash.query_point(10, 10) == [second]
+    spatial_hash.remove(second)
+    assert spatial_hash.cells == {}
+
+
+def test_insert_existing_object_moves_it():
+    spatial_hash, (thing,) = make_hash([(10, 10)])
+    spatial_hash.insert(thing, 600, 600)
+    assert len(spatial_hash) == 1
+    assert spatial_hash.query_point(600, 600) == [thing]
+
+
+def test_negative_coordinates():
+    spatial_hash, (thing,) = make_hash([(-5, -5)])
+    assert spatial_hash.query_rect(-10, -10, -1, -1) == [thing]
+    assert spatial_hash.query_rect(0, 0, 100, 100) == []